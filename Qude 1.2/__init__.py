@@ -1 +1 @@
-__all__ = ["main", "ide", "interpreter"]
+__all__ = ["main", "ide", "interpreter", "paths", "publish", "qude_runner"]
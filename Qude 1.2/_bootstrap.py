@@ -0,0 +1,32 @@
+import importlib.util
+import os
+import runpy
+import sys
+
+# Running from source (python "Qude 1.2/main.py"), the modules here have no package
+# name, and the repo root has an older qude/ package that lacks most of them. This
+# registers this directory as "qude", so every qude.* import resolves to the modules
+# next to this file. Importing it is enough; child processes run through it instead
+# of python -m:  python _bootstrap.py qude.script_process <args>
+
+PKG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def install() -> None:
+    mod = sys.modules.get("qude")
+    if mod is not None and list(getattr(mod, "__path__", [])) == [PKG_DIR]:
+        return
+    spec = importlib.util.spec_from_file_location(
+        "qude", os.path.join(PKG_DIR, "__init__.py"), submodule_search_locations=[PKG_DIR]
+    )
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["qude"] = mod
+    spec.loader.exec_module(mod)
+
+
+install()
+
+if __name__ == "__main__":
+    module = sys.argv[1]
+    del sys.argv[1]
+    runpy.run_module(module, run_name="__main__", alter_sys=True)
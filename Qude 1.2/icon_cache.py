@@ -0,0 +1,93 @@
+import hashlib
+import os
+import sys
+import tempfile
+from typing import Optional
+try:
+    from .paths import user_cache_dir
+except ImportError:
+    # Run as a script: qude.* means the modules next to this file, not the root qude/
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import _bootstrap  # noqa: F401
+    from qude.paths import user_cache_dir
+
+# Converted icon assets, cached per user under icons/<key>/ where the key hashes the
+# source file's bytes and mtime. The ICO (taskbar icon, PyInstaller --icon) and the
+# pre-scaled splash PNG are made with Pillow once; later launches and publishes only
+# stat and hash the source, and Tk loads the PNG without Pillow.
+
+ICO_SIZES = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128)]
+ICO_NAME = "icon.ico"
+SPLASH_NAME = "splash.png"
+
+
+def asset_key(src: str) -> str:
+    st = os.stat(src)
+    h = hashlib.sha256(str(st.st_mtime_ns).encode("ascii"))
+    with open(src, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()[:32]
+
+
+def _asset_path(src: str, name: str) -> str:
+    return os.path.join(user_cache_dir("icons", asset_key(src)), name)
+
+
+def _write_atomic(img, out: str, **save_args) -> None:
+    # The IDE and a publish thread may build the same asset at once; each writer gets
+    # its own temp file in the target dir
+    fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(out))
+    os.close(fd)
+    try:
+        img.save(tmp, **save_args)
+        os.replace(tmp, out)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def cached_ico(src: str) -> Optional[str]:
+    # ICO version of a PNG/ICO icon; an ICO source is used as is
+    if src.lower().endswith(".ico"):
+        return src
+    try:
+        out = _asset_path(src, ICO_NAME)
+        if os.path.exists(out):
+            return out
+        from PIL import Image  # type: ignore
+        img = Image.open(src)
+        _write_atomic(img, out, format="ICO", sizes=ICO_SIZES)
+        return out
+    except Exception:
+        return None
+
+
+def cached_splash(src: str) -> Optional[str]:
+    # Largest frame of the icon, scaled up for small icons, as a PNG Tk can load directly
+    try:
+        out = _asset_path(src, SPLASH_NAME)
+        if os.path.exists(out):
+            return out
+        from PIL import Image  # type: ignore
+        img = Image.open(src)
+        if getattr(img, "n_frames", 1) > 1:
+            best = None
+            best_area = -1
+            for i in range(img.n_frames):
+                img.seek(i)
+                w, h = img.size
+                if w * h > best_area:
+                    best = img.copy()
+                    best_area = w * h
+            img = best if best is not None else img
+        w, h = img.size
+        scale = 4 if max(w, h) <= 32 else 2 if max(w, h) <= 64 else 1
+        if scale > 1:
+            img = img.resize((w * scale, h * scale), Image.LANCZOS)
+        _write_atomic(img, out, format="PNG")
+        return out
+    except Exception:
+        return None
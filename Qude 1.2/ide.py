@@ -1,36 +1,158 @@
+import bisect
+import logging
+import logging.handlers
 import os
+import queue
 import re
-import tempfile
+import time
 import sys
 import subprocess
-import shutil
+import threading
+import traceback
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog, simpledialog
 from tkinter import font as tkfont
 try:
     from .interpreter import QudeInterpreter
+    from .paths import user_cache_dir
+    from .icon_cache import cached_ico, cached_splash
+    from .pixel_image import PixelImage
+    from .publish import BatchPublishJob, PublishJob, collect_scripts
+    from .script_process import ScriptRunJob
+    from .qude_lang.profiler import Profiler, format_duration
+    from .startup import StartupProfile
 except ImportError:
-    # Allow running directly: python qude/ide.py
-    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+    # Run as a script: qude.* means the modules next to this file, not the root qude/
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import _bootstrap  # noqa: F401
     from qude.interpreter import QudeInterpreter
-try:
-    from PIL import Image, ImageTk  # type: ignore
-except Exception:
-    Image = None  # type: ignore
-    ImageTk = None  # type: ignore
+    from qude.paths import user_cache_dir
+    from qude.icon_cache import cached_ico, cached_splash
+    from qude.pixel_image import PixelImage
+    from qude.publish import BatchPublishJob, PublishJob, collect_scripts
+    from qude.script_process import ScriptRunJob
+    from qude.qude_lang.profiler import Profiler, format_duration
+    from qude.startup import StartupProfile
+
+# Index pairs sent per Text "tag add" call when highlighting
+TAG_BATCH_SIZE = 2000
+# Console writes are buffered and flushed in one insert at most this often (ms)
+CONSOLE_FLUSH_MS = 30
+# Default console scrollback (lines); older lines only live in the log file
+CONSOLE_MAX_LINES = 5000
+# Full console output is spilled to a rotating log file of this size
+CONSOLE_LOG_MAX_BYTES = 5 * 1024 * 1024
+CONSOLE_LOG_BACKUPS = 3
+# How often the Tk thread drains background job output (ms)
+PUBLISH_POLL_MS = 50
+# Refresh period of the Performans panel while it is open (ms)
+METRICS_REFRESH_MS = 1000
+# Files larger than this (bytes) are streamed into the editor and highlighted lazily
+OPEN_STREAM_BYTES = 1024 * 1024
+# Characters read by the loader thread per chunk
+OPEN_CHUNK_CHARS = 64 * 1024
+# Time spent inserting chunks per idle callback while streaming a file (ms)
+OPEN_SLICE_MS = 12
+# Lines above and below the visible ones included in a lazy highlight pass
+LAZY_HIGHLIGHT_MARGIN = 50
+# Deferred startup work begins at the editor's first paint, or after this long (ms)
+STARTUP_DEFER_MAX_MS = 1000
+
+
+class _FileLoad:
+    # Reads a file on a worker thread; the Tk thread takes chunks off the queue
+    def __init__(self, path: str, size: int) -> None:
+        self.path = path
+        self.size = size
+        self.loaded = 0
+        self.cancelled = False
+        self.chunks: queue.Queue = queue.Queue()
+        self.thread = threading.Thread(target=self._read, daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def _read(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                while not self.cancelled:
+                    chunk = f.read(OPEN_CHUNK_CHARS)
+                    if not chunk:
+                        break
+                    self.chunks.put(("data", chunk))
+            self.chunks.put(("done", None))
+        except Exception as e:
+            self.chunks.put(("error", e))
 
 
 class QudeIDE:
-    def __init__(self) -> None:
-        self.root = tk.Tk()
-        self.root.title("Qude IDE (Prototype)")
-        self.root.geometry("1100x700")
+    def __init__(self, t0: float | None = None, profile_startup: bool = False) -> None:
+        # Only the editor is built before the window first paints; the menus, icon,
+        # splash and first highlight pass follow from idle callbacks
+        self.startup = StartupProfile(t0, profile_startup)
+        self.startup.mark("QudeIDE()")
+        with self.startup.phase("window"):
+            self.root = tk.Tk()
+            self.root.title("Qude IDE (Prototype)")
+            self.root.geometry("1100x700")
         self.current_file: str | None = None
         self.theme = 'dark'
-
-        # Create and set app icon (prefer q.ico, then q.png, else fallback)
         self.icon_bitmap_path: str | None = None
         self.app_icon = None
+
+        self._publish_job: PublishJob | BatchPublishJob | None = None
+        self._run_job: ScriptRunJob | None = None
+        # F5 runs the script in a child process so it cannot freeze the IDE
+        self.run_separate_var = tk.BooleanVar(value=True)
+        with self.startup.phase("editor"):
+            self._build_ui()
+        with self.startup.phase("interpreter"):
+            self.interpreter = QudeInterpreter(self._console_write, self.root)
+            self.interpreter.on_progress = self._on_run_progress
+        # Quick sender (Kısayol Yollayıcı) devre dışı
+        self.quick_win: tk.Toplevel | None = None
+        self.quick_entry: tk.Entry | None = None
+
+        # (name, function, best effort): best-effort phases fail silently, as the icon
+        # and splash always have; errors in the others are reported on the console
+        self._startup_phases = [
+            ("menus", self._build_menus, False),
+            ("icon", self._init_icon, True),
+            ("splash", self._show_splash_ico, True),
+            ("highlight", self._highlight_all, False),
+        ]
+        self._startup_started = False
+        self.editor.bind("<Expose>", self._on_first_paint, add="+")
+        self.root.after(STARTUP_DEFER_MAX_MS, self._on_first_paint)
+
+    def _on_first_paint(self, e=None) -> None:
+        if self._startup_started:
+            return
+        self._startup_started = True
+        self.startup.mark("first paint" if e is not None else "first paint (not seen, timed out)")
+        self.root.after_idle(self._run_startup_phase)
+
+    def _run_startup_phase(self) -> None:
+        # One deferred phase per idle callback, so input and redraws get in between
+        if not self._startup_phases:
+            self.startup.mark("startup complete")
+            self.startup.emit(self._console_write)
+            return
+        name, fn, best_effort = self._startup_phases.pop(0)
+        try:
+            with self.startup.phase(name):
+                fn()
+        except Exception as e:
+            if not best_effort:
+                self._console_write(f"[Error] startup phase {name}: {e}")
+                self._log_console(traceback.format_exc())
+        self.root.after_idle(self._run_startup_phase)
+
+    def _init_icon(self) -> None:
+        # Create and set app icon (prefer q.ico, then q.png, else fallback)
         # 1) Try ICO first
         base_dirs = [
             os.path.dirname(__file__),
@@ -71,75 +193,20 @@ class QudeIDE:
                 self.root.iconbitmap(self.icon_bitmap_path)
         except Exception:
             pass
-
-        # Optional splash with ICO (if available)
-        try:
-            self._show_splash_ico()
-        except Exception:
-            pass
-
-        self._build_ui()
-        self.interpreter = QudeInterpreter(
-            self._console_write,
-            self.root,
-            icon_image=self.app_icon,
-            icon_bitmap_path=self.icon_bitmap_path,
-        )
-        # Quick sender (Kısayol Yollayıcı) devre dışı
-        self.quick_win: tk.Toplevel | None = None
-        self.quick_entry: tk.Entry | None = None
+        # Update interpreter so child windows inherit
+        self.interpreter.icon_image = self.app_icon
+        self.interpreter.icon_bitmap_path = self.icon_bitmap_path
 
     def _build_ui(self) -> None:
         self._apply_dark_theme()
 
-        # Menu bar
-        menubar = tk.Menu(self.root, tearoff=False)
-
-        file_menu = tk.Menu(menubar, tearoff=False)
-        file_menu.add_command(label="Yeni", command=self._new_file, accelerator="Ctrl+N")
-        file_menu.add_command(label="Aç...", command=self._open_file, accelerator="Ctrl+O")
-        file_menu.add_command(label="Kaydet", command=self._save_file, accelerator="Ctrl+S")
-        file_menu.add_command(label="Farklı Kaydet...", command=self._save_file_as, accelerator="Ctrl+Shift+S")
-        file_menu.add_separator()
-        file_menu.add_command(label="Çıkış", command=self.root.quit)
-        menubar.add_cascade(label="Dosya", menu=file_menu)
-
-        run_menu = tk.Menu(menubar, tearoff=False)
-        run_menu.add_command(label="Çalıştır", command=self.run_script, accelerator="F5")
-        run_menu.add_command(label="Önizle", command=self.run_preview, accelerator="F6")
-        run_menu.add_separator()
-        run_menu.add_command(label="Yayınla (.exe)", command=self._publish_exe)
-        menubar.add_cascade(label="Çalıştır", menu=run_menu)
-
-        help_menu = tk.Menu(menubar, tearoff=False)
-        help_menu.add_command(label="Yardım", command=self._show_help)
-        menubar.add_cascade(label="Yardım", menu=help_menu)
-
-        # Settings menu
-        settings_menu = tk.Menu(menubar, tearoff=False)
-        theme_menu = tk.Menu(settings_menu, tearoff=False)
-        theme_menu.add_command(label="Koyu", command=lambda: self._set_theme('dark'))
-        theme_menu.add_command(label="Açık", command=lambda: self._set_theme('light'))
-        settings_menu.add_cascade(label="Tema", menu=theme_menu)
-        icon_menu = tk.Menu(settings_menu, tearoff=False)
-        icon_menu.add_command(label="Simge Yükle (PNG/ICO)...", command=self._load_icon_file)
-        settings_menu.add_cascade(label="Simge", menu=icon_menu)
-        settings_menu.add_separator()
-        settings_menu.add_command(label="Yazı Boyutu...", command=self._open_font_settings)
-        settings_menu.add_separator()
-        settings_menu.add_command(label="Sürüm", command=self._show_version)
-        settings_menu.add_separator()
-        settings_menu.add_command(label="Yardım", command=self._show_help)
-        menubar.add_cascade(label="Ayarlar", menu=settings_menu)
-
-        self.root.config(menu=menubar)
-
         # Shortcuts
         self.root.bind_all("<Control-n>", lambda e: self._new_file())
         self.root.bind_all("<Control-o>", lambda e: self._open_file())
         self.root.bind_all("<Control-s>", lambda e: self._save_file())
         self.root.bind_all("<Control-S>", lambda e: self._save_file_as())
         self.root.bind_all("<F5>", lambda e: self.run_script())
+        self.root.bind_all("<Shift-F5>", lambda e: self._stop_script())
         self.root.bind_all("<F6>", lambda e: self.run_preview())
         self.root.bind_all("<Control-KP_Add>", lambda e: self._zoom_in())
         self.root.bind_all("<Control-=>", lambda e: self._zoom_in())
@@ -167,6 +234,28 @@ class QudeIDE:
             font=self.editor_font,
         )
         self.editor.pack(fill=tk.BOTH, expand=True)
+        # Profiler timings per line, shown left of the editor after a profiled run
+        self.gutter = tk.Text(
+            center_frame,
+            width=8,
+            wrap="none",
+            bg="#17181a",
+            fg="#8a8f98",
+            padx=4,
+            pady=8,
+            relief=tk.FLAT,
+            font=self.editor_font,
+            state="disabled",
+            takefocus=0,
+        )
+        self.gutter.tag_configure("hot", foreground="#e06c75")
+        self._gutter_visible = False
+        self._file_load: _FileLoad | None = None
+        self.editor.configure(yscrollcommand=self._on_editor_yscroll)
+        self.profiler: Profiler | None = None
+        self._profile_win: tk.Toplevel | None = None
+        self._metrics_win: tk.Toplevel | None = None
+        self._metrics_job: str | None = None
         self._setup_editor_highlight()
         self._bind_autoclose()
         main.add(center_frame, weight=4)
@@ -191,7 +280,17 @@ class QudeIDE:
             console_frame.pack_propagate(False)
         except Exception:
             pass
-        ttk.Label(console_frame, text="Konsol").pack(anchor="w", padx=8)
+        console_header = ttk.Frame(console_frame)
+        console_header.pack(fill=tk.X, padx=8)
+        ttk.Label(console_header, text="Konsol").pack(side=tk.LEFT)
+        ttk.Button(console_header, text="Tam Günlüğü Aç", command=self._open_console_log).pack(side=tk.RIGHT)
+        # Background job status (publish etc.), only packed while a job is active
+        self.status_var = tk.StringVar(value="")
+        self.status_label = ttk.Label(console_header, textvariable=self.status_var)
+        self.status_progress = ttk.Progressbar(console_header, length=160, maximum=100, mode="determinate")
+        self.status_cancel_btn = ttk.Button(console_header, text="İptal", command=self._on_status_cancel)
+        self._status_visible = False
+        self._status_cancel = None
         self.console_font = tkfont.Font(family='Consolas', size=14)
         self.console = tk.Text(
             console_frame,
@@ -203,13 +302,70 @@ class QudeIDE:
             relief=tk.FLAT,
             font=self.console_font,
         )
+        self._console_pending: list[tuple[str, str | None]] = []
+        self._console_flush_job: str | None = None
+        self.console_max_lines = CONSOLE_MAX_LINES
+        self._console_logger: logging.Logger | None = None
+        self.console_log_path: str | None = None
         self.console.tag_configure("warn", foreground="#e5c07b")
         self.console.tag_configure("error", foreground="#e06c75")
         self.console.pack(fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
 
-        # Seed editor with a sample
+        # Seed editor with a sample (highlighted once the window is up)
         self._seed_sample()
-        self._highlight_all()
+
+    def _build_menus(self) -> None:
+        menubar = tk.Menu(self.root, tearoff=False)
+
+        file_menu = tk.Menu(menubar, tearoff=False)
+        file_menu.add_command(label="Yeni", command=self._new_file, accelerator="Ctrl+N")
+        file_menu.add_command(label="Aç...", command=self._open_file, accelerator="Ctrl+O")
+        file_menu.add_command(label="Kaydet", command=self._save_file, accelerator="Ctrl+S")
+        file_menu.add_command(label="Farklı Kaydet...", command=self._save_file_as, accelerator="Ctrl+Shift+S")
+        file_menu.add_separator()
+        file_menu.add_command(label="Çıkış", command=self.root.quit)
+        menubar.add_cascade(label="Dosya", menu=file_menu)
+
+        run_menu = tk.Menu(menubar, tearoff=False)
+        run_menu.add_command(label="Çalıştır", command=self.run_script, accelerator="F5")
+        run_menu.add_command(label="Önizle", command=self.run_preview, accelerator="F6")
+        run_menu.add_command(label="Durdur", command=self._stop_script, accelerator="Shift+F5")
+        run_menu.add_command(label="Profil ile Çalıştır", command=lambda: self.run_script(profile=True))
+        run_menu.add_command(label="Profil Sonuçları", command=self._show_profile)
+        run_menu.add_command(label="Performans Paneli", command=self._show_metrics)
+        run_menu.add_separator()
+        run_menu.add_command(label="Yayınla (.exe)", command=self._publish_exe)
+        run_menu.add_command(label="Yayınla (.exe, tam derleme)", command=lambda: self._publish_exe(full_build=True))
+        run_menu.add_command(label="Toplu Yayınla...", command=self._publish_batch)
+        run_menu.add_command(label="Yayınlamayı İptal Et", command=self._cancel_publish)
+        menubar.add_cascade(label="Çalıştır", menu=run_menu)
+
+        help_menu = tk.Menu(menubar, tearoff=False)
+        help_menu.add_command(label="Yardım", command=self._show_help)
+        menubar.add_cascade(label="Yardım", menu=help_menu)
+
+        # Settings menu
+        settings_menu = tk.Menu(menubar, tearoff=False)
+        theme_menu = tk.Menu(settings_menu, tearoff=False)
+        theme_menu.add_command(label="Koyu", command=lambda: self._set_theme('dark'))
+        theme_menu.add_command(label="Açık", command=lambda: self._set_theme('light'))
+        settings_menu.add_cascade(label="Tema", menu=theme_menu)
+        icon_menu = tk.Menu(settings_menu, tearoff=False)
+        icon_menu.add_command(label="Simge Yükle (PNG/ICO)...", command=self._load_icon_file)
+        settings_menu.add_cascade(label="Simge", menu=icon_menu)
+        settings_menu.add_separator()
+        settings_menu.add_command(label="Yazı Boyutu...", command=self._open_font_settings)
+        settings_menu.add_command(label="Konsol Satır Sınırı...", command=self._set_console_limit)
+        settings_menu.add_command(label="Tam Konsol Günlüğünü Aç", command=self._open_console_log)
+        settings_menu.add_checkbutton(label="Ayrı süreçte çalıştır", variable=self.run_separate_var)
+        settings_menu.add_command(label="Yürütme Ayarları...", command=self._open_run_settings)
+        settings_menu.add_separator()
+        settings_menu.add_command(label="Sürüm", command=self._show_version)
+        settings_menu.add_separator()
+        settings_menu.add_command(label="Yardım", command=self._show_help)
+        menubar.add_cascade(label="Ayarlar", menu=settings_menu)
+
+        self.root.config(menu=menubar)
 
     def _seed_sample(self) -> None:
         sample = (
@@ -223,19 +379,131 @@ class QudeIDE:
         self.editor.insert("1.0", sample)
 
     def _console_write(self, text: str) -> None:
-        self.console.configure(state="normal")
+        # Buffer the write; the console widget is updated at most once per frame
         tag = None
         if text.startswith('[Warn]'):
             tag = 'warn'
         elif text.startswith('[Error]'):
             tag = 'error'
-        if tag:
-            self.console.insert(tk.END, text + "\n", tag)
-        else:
-            self.console.insert(tk.END, text + "\n")
+        self._console_pending.append((text + "\n", tag))
+        if self._console_flush_job is None:
+            self._console_flush_job = self.root.after(CONSOLE_FLUSH_MS, self._flush_console)
+
+    def _flush_console(self) -> None:
+        self._console_flush_job = None
+        pending = self._console_pending
+        if not pending:
+            return
+        self._console_pending = []
+        self._log_console("".join(text for text, _ in pending))
+        # Only the newest lines can survive the scrollback limit, skip inserting the rest
+        if self.console_max_lines > 0 and len(pending) > self.console_max_lines:
+            pending = pending[-self.console_max_lines:]
+        # Merge consecutive writes sharing a tag so the whole batch is a single insert
+        args: list = []
+        run_tag = pending[0][1]
+        run: list[str] = []
+        for text, tag in pending:
+            if tag != run_tag:
+                args.extend(("".join(run), run_tag or ()))
+                run = []
+                run_tag = tag
+            run.append(text)
+        args.extend(("".join(run), run_tag or ()))
+        self.console.configure(state="normal")
+        self.console.insert(tk.END, *args)
+        self._trim_console()
         self.console.see(tk.END)
         self.console.configure(state="disabled")
 
+    def _trim_console(self, exact: bool = False) -> None:
+        if self.console_max_lines <= 0:
+            return
+        lines = int(self.console.index("end-1c").split(".")[0])
+        # Trim in bulk once the limit is overshot by a slack, not on every flush
+        slack = 0 if exact else max(100, self.console_max_lines // 10)
+        if lines > self.console_max_lines + slack:
+            self.console.delete("1.0", f"{lines - self.console_max_lines + 1}.0")
+
+    def _get_console_logger(self) -> logging.Logger | None:
+        if self._console_logger is not None:
+            return self._console_logger
+        try:
+            path = os.path.join(user_cache_dir("logs"), "console.log")
+            handler = logging.handlers.RotatingFileHandler(
+                path,
+                maxBytes=CONSOLE_LOG_MAX_BYTES,
+                backupCount=CONSOLE_LOG_BACKUPS,
+                encoding="utf-8",
+            )
+        except Exception:
+            return None
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = logging.getLogger(f"qude.console.{id(self)}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        self._console_logger = logger
+        self.console_log_path = path
+        return logger
+
+    def _log_console(self, text: str) -> None:
+        logger = self._get_console_logger()
+        if logger is None or not text:
+            return
+        try:
+            logger.info(text.rstrip("\n"))
+        except Exception:
+            pass
+
+    def _open_console_log(self) -> None:
+        self._flush_console()
+        self._get_console_logger()
+        path = self.console_log_path
+        if not path or not os.path.exists(path):
+            messagebox.showinfo("Konsol", "Henüz günlük kaydı yok.")
+            return
+        try:
+            self._open_path(path)
+        except Exception as e:
+            messagebox.showerror("Hata", f"Günlük açılamadı: {e}")
+
+    def _open_path(self, path: str) -> None:
+        if hasattr(os, "startfile"):
+            os.startfile(path)  # type: ignore[attr-defined]
+        elif sys.platform == "darwin":
+            subprocess.Popen(["open", path])
+        else:
+            subprocess.Popen(["xdg-open", path])
+
+    def _set_console_limit(self) -> None:
+        value = simpledialog.askinteger(
+            "Konsol Satır Sınırı",
+            "Konsolda tutulacak en fazla satır (0 = sınırsız):",
+            initialvalue=self.console_max_lines,
+            minvalue=0,
+            parent=self.root,
+        )
+        if value is None:
+            return
+        self.console_max_lines = value
+        self.console.configure(state="normal")
+        self._trim_console(exact=True)
+        self.console.configure(state="disabled")
+
+    def _clear_console(self) -> None:
+        self._console_pending = []
+        try:
+            if self._console_flush_job is not None:
+                self.root.after_cancel(self._console_flush_job)
+        except Exception:
+            pass
+        self._console_flush_job = None
+        self._log_console(f"----- {time.strftime('%Y-%m-%d %H:%M:%S')} -----")
+        self.console.configure(state="normal")
+        self.console.delete("1.0", tk.END)
+        self.console.configure(state="disabled")
+
     def _show_help(self) -> None:
         win = tk.Toplevel(self.root)
         win.title("Qude Yardım")
@@ -321,7 +589,16 @@ class QudeIDE:
             "  Diyalog penceresi açılır, cevap 'data' değişkenine yazılır.\n"
             "  Örnek akış:\n"
             "    taQe.putt('Adın?')\n"
-            "    if data = 'Ali': then Qonsol.write('Merhaba Ali')\n"
+            "    if data = 'Ali': then Qonsol.write('Merhaba Ali')\n\n"
+            "Koşul blokları (if / elif / else):\n"
+            "  if data = 'Ali':\n"
+            "      Qonsol.write('Merhaba Ali')\n"
+            "      Qonsol.write('Hoş geldin')\n"
+            "  elif data = 'Ayşe':\n"
+            "      Qonsol.write('Merhaba Ayşe')\n"
+            "  else:\n"
+            "      Qonsol.write('Tanışmadık')\n"
+            "  Gövde, başlıktan daha içeride yazılan satırlardır; tek satırlık 'then' biçimi de geçerlidir.\n"
         )
 
         pencere = (
@@ -419,6 +696,12 @@ class QudeIDE:
             "  event;\n"
             "      button1.LeftClickEvent:\n"
             "      Qonsol.write('left clicked!')\n\n"
+            "Çok satırlı gövde (olay satırından daha içeride):\n"
+            "  event;\n"
+            "      button1.LeftClickEvent:\n"
+            "          Qonsol.write('tıklandı')\n"
+            "          text1.text('Tamam')\n"
+            "          if sayac = 3: then Qonsol.write('üç')\n\n"
             "Desteklenen Olaylar:\n"
             "  LeftClickEvent  -> Sol tık\n"
             "  RightClickEvent -> Sağ tık\n\n"
@@ -437,6 +720,34 @@ class QudeIDE:
             "  warn.screen satırı eventlerden önce gelmeli; <secenek> etiketi birebir aynı olmalı.\n"
         )
 
+        zamanlayici = (
+            "Zamanlayıcılar (every / after)\n\n"
+            "Tekrarlayan:\n"
+            "  every 500:\n"
+            "      Qonsol.write('her yarım saniyede')\n\n"
+            "Bir kez, gecikmeli:\n"
+            "  after 2000:\n"
+            "      text1.text('2 saniye geçti')\n\n"
+            "Süre milisaniyedir ve bir ifade olabilir (every hiz * 10:).\n"
+            "Gövde, başlıktan daha içeride yazılan satırlardır; eventler gibi program bittikten sonra da çalışır.\n"
+            "Pencere kapanınca veya Durdur ile tüm zamanlayıcılar iptal edilir.\n"
+        )
+
+        donguler = (
+            "Döngüler (repeat / for)\n\n"
+            "Sabit sayıda tekrar:\n"
+            "  repeat 3:\n"
+            "      Qonsol.write('merhaba')\n\n"
+            "Sayaçlı döngü (iki uç dahil, geriye de sayabilir):\n"
+            "  for i in 1..5:\n"
+            "      insert.button() as btn{i}\n"
+            "      btn{i}.text('Buton {i}')\n"
+            "      btn{i}.cordinates(20, i * 40)\n\n"
+            "Gövde, başlıktan daha içeride yazılan satırlardır; döngüler iç içe olabilir.\n"
+            "{i} isimlerde ve metinlerde döngü değeriyle değiştirilir; i ifadelerde değişken olarak kullanılır.\n"
+            "Döngü içindeki event bloklarında {i}, event tanımlandığı andaki değeri alır.\n"
+        )
+
         help_texts: list[tk.Text] = []
         make_tab("Genel", intro)
         make_tab("Konsol", konsol)
@@ -446,6 +757,8 @@ class QudeIDE:
         make_tab("Link", linktab)
         make_tab("Input", inputtab)
         make_tab("Event", eventler)
+        make_tab("Zamanlayıcı", zamanlayici)
+        make_tab("Döngüler", donguler)
 
         def do_search() -> None:
             query = search_var.get().strip()
@@ -549,12 +862,10 @@ class QudeIDE:
         except Exception:
             pass
 
-    def run_script(self) -> None:
+    def run_script(self, profile: bool = False) -> None:
         code = self.editor.get("1.0", tk.END)
         # Clear console
-        self.console.configure(state="normal")
-        self.console.delete("1.0", tk.END)
-        self.console.configure(state="disabled")
+        self._clear_console()
 
         # Enforce start/stop requirement
         lines = [ln.strip() for ln in code.splitlines()]
@@ -569,21 +880,26 @@ class QudeIDE:
                 self._console_write("[Error] Kod 'bitir' komutu eksik: Qude.kill/ (veya qude.end, q<)")
             return
 
+        # Profiling needs the interpreter in this process
+        if self.run_separate_var.get() and not profile:
+            self._run_in_child(code)
+            return
+        self.profiler = Profiler() if profile else None
+        self.interpreter.profiler = self.profiler
+        on_done = self._on_profiled_run_done if profile else self._on_run_done
         try:
             # Run with the same in-process interpreter used by preview/export
             self.interpreter.preview_mode = False
             self.interpreter.preview_root = None
             self.interpreter.window = None
-            self.interpreter.run(code)
+            self.interpreter.run(code, on_done=on_done)
         except Exception as e:
             self._console_write(f"[Error] {e}")
 
     def run_preview(self) -> None:
         code = self.editor.get("1.0", tk.END)
         # Clear console
-        self.console.configure(state="normal")
-        self.console.delete("1.0", tk.END)
-        self.console.configure(state="disabled")
+        self._clear_console()
 
         # Enforce start/stop requirement
         lines = [ln.strip() for ln in code.splitlines()]
@@ -601,12 +917,344 @@ class QudeIDE:
         # Prepare preview area
         self._clear_preview()
         try:
+            self.interpreter.profiler = None
             self.interpreter.preview_mode = True
             self.interpreter.preview_root = self.preview_area
-            self.interpreter.run(code)
+            self.interpreter.run(code, on_done=self._on_run_done)
         except Exception as e:
             self._console_write(f"[Error] {e}")
 
+    def _run_in_child(self, code: str) -> None:
+        # A previous run is replaced, like re-running in-process replaces its window
+        if self._run_job is not None:
+            self._run_job.cancel()
+        job = ScriptRunJob(code, icon_path=self.icon_bitmap_path, limits=self.interpreter.limits)
+        self._run_job = job
+        if self._publish_job is None:
+            self._show_status("Çalışıyor...", cancel=self._stop_script)
+        job.start()
+        self.root.after(PUBLISH_POLL_MS, lambda: self._poll_run(job))
+
+    def _poll_run(self, job: ScriptRunJob) -> None:
+        for kind, *payload in job.drain():
+            if kind == "line":
+                self._console_write(payload[0])
+            elif kind == "done":
+                if self._run_job is job:
+                    self._run_job = None
+                    if self._publish_job is None:
+                        self._hide_status()
+                ok, message = payload
+                if not ok:
+                    self._console_write(f"[Warn] {message}" if job.cancelled else f"[Error] {message}")
+                return
+        self.root.after(PUBLISH_POLL_MS, lambda: self._poll_run(job))
+
+    def _stop_script(self) -> None:
+        if self._run_job is not None:
+            self._run_job.cancel()
+            return
+        # In-process run: drop the pending slices and close the app window it opened
+        stopped = self.interpreter.busy
+        self.interpreter.stop()
+        window = self.interpreter.window
+        if not self.interpreter.preview_mode and window is not None:
+            try:
+                if window.winfo_exists():
+                    window.destroy()
+                    stopped = True
+            except Exception:
+                pass
+        if stopped:
+            self._console_write("[Warn] Çalıştırma durduruldu.")
+        self._on_run_done()
+
+    def _on_run_progress(self, done: int, total: int) -> None:
+        # Called between slices of an in-process run; the status area is shared with jobs
+        if self._publish_job is None and self._run_job is None and total:
+            self._show_status(f"Çalışıyor... {done}/{total}", fraction=done / total, cancel=self._stop_script)
+
+    def _on_run_done(self) -> None:
+        if self._publish_job is None and self._run_job is None:
+            self._hide_status()
+
+    def _open_run_settings(self) -> None:
+        dlg = tk.Toplevel(self.root)
+        dlg.title("Yürütme Ayarları")
+        dlg.geometry("400x570")
+        try:
+            if self.icon_bitmap_path:
+                dlg.iconbitmap(self.icon_bitmap_path)
+        except Exception:
+            pass
+
+        frm = ttk.Frame(dlg)
+        frm.pack(fill=tk.BOTH, expand=True, padx=12, pady=12)
+
+        interp = self.interpreter
+        limits = interp.limits
+        # (label, owner, attribute, spin increment); 0 always means "no limit"
+        fields = [
+            ("Dilim başına deyim", interp, "slice_statements", 100),
+            ("Dilim süresi (ms)", interp, "slice_ms", 5),
+            ("Çalıştırma: en fazla deyim", limits, "max_statements", 10000),
+            ("Çalıştırma: en fazla süre (sn)", limits, "max_seconds", 5),
+            ("Çalıştırma: en fazla widget", limits, "max_widgets", 100),
+            ("Olay: en fazla deyim", limits, "event_max_statements", 1000),
+            ("Olay: en fazla süre (sn)", limits, "event_max_seconds", 1),
+            ("MatchEvent gecikmesi (ms)", interp.events, "match_debounce_ms", 50),
+            ("Olay kare bütçesi (ms)", interp.events.queue, "frame_budget_ms", 2),
+        ]
+        ttk.Label(frm, text="0 = sınırsız").pack(anchor="w", pady=(0, 6))
+        vars_: list[tk.StringVar] = []
+        for label, owner, attr, step in fields:
+            ttk.Label(frm, text=label).pack(anchor="w")
+            var = tk.StringVar(value=f"{getattr(owner, attr):g}")
+            ttk.Spinbox(frm, from_=0, to=10**9, increment=step, textvariable=var).pack(fill=tk.X, pady=(2, 6))
+            vars_.append(var)
+
+        def on_save() -> None:
+            values = []
+            try:
+                for (_label, owner, attr, _step), var in zip(fields, vars_):
+                    value = max(0.0, float(var.get()))
+                    values.append(int(value) if isinstance(getattr(owner, attr), int) else value)
+            except ValueError:
+                messagebox.showerror("Yürütme Ayarları", "Geçersiz sayı.", parent=dlg)
+                return
+            for (_label, owner, attr, _step), value in zip(fields, values):
+                setattr(owner, attr, value)
+            dlg.destroy()
+
+        btns = ttk.Frame(frm)
+        btns.pack(fill=tk.X, pady=(8, 0))
+        ttk.Button(btns, text="Kaydet", command=on_save).pack(side=tk.LEFT)
+        ttk.Button(btns, text="Kapat", command=dlg.destroy).pack(side=tk.RIGHT)
+
+        dlg.transient(self.root)
+        dlg.grab_set()
+        dlg.focus_set()
+
+    # ---------- Profiler ----------
+    def _on_profiled_run_done(self) -> None:
+        self._on_run_done()
+        self._show_profile()
+
+    def _show_profile(self) -> None:
+        prof = self.profiler
+        if prof is None:
+            messagebox.showinfo("Profil", "Önce 'Profil ile Çalıştır' kullanın.")
+            return
+        win = self._profile_win
+        if win is None or not win.winfo_exists():
+            win = tk.Toplevel(self.root)
+            win.title("Profil")
+            win.geometry("560x420")
+            self._profile_win = win
+            cols = ("line", "kind", "calls", "total", "avg")
+            heads = ("Satır", "Tür", "Çağrı", "Toplam", "Ortalama")
+            tree = ttk.Treeview(win, columns=cols, show="headings")
+            for col, head in zip(cols, heads):
+                tree.heading(col, text=head, command=lambda c=col: self._sort_profile(c))
+                tree.column(col, width=160 if col == "kind" else 80, anchor="w" if col == "kind" else "e")
+            tree.pack(fill=tk.BOTH, expand=True, padx=8, pady=(8, 4))
+            tree.bind("<Double-1>", lambda e: self._goto_profile_line())
+            btns = ttk.Frame(win)
+            btns.pack(fill=tk.X, padx=8, pady=(0, 8))
+            ttk.Button(btns, text="Yenile", command=self._show_profile).pack(side=tk.LEFT)
+            ttk.Button(btns, text="JSON Dışa Aktar...", command=lambda: self._export_profile("json")).pack(side=tk.LEFT, padx=(6, 0))
+            ttk.Button(btns, text="Flamegraph Dışa Aktar...", command=lambda: self._export_profile("collapsed")).pack(side=tk.LEFT, padx=(6, 0))
+            ttk.Button(btns, text="Kenar Çubuğunu Gizle", command=self._hide_gutter).pack(side=tk.RIGHT)
+            self._profile_tree = tree
+            self._profile_sort = ("total", True)
+        self._fill_profile_tree()
+        self._show_gutter(prof)
+        win.lift()
+
+    def _fill_profile_tree(self) -> None:
+        tree = self._profile_tree
+        prof = self.profiler
+        if prof is None:
+            return
+        key, reverse = self._profile_sort
+        getters = {
+            "line": lambda st: st.line,
+            "kind": lambda st: st.kind,
+            "calls": lambda st: st.calls,
+            "total": lambda st: st.seconds,
+            "avg": lambda st: st.seconds / st.calls if st.calls else 0.0,
+        }
+        rows = sorted(prof.lines.values(), key=getters[key], reverse=reverse)
+        tree.delete(*tree.get_children())
+        for st in rows:
+            avg = st.seconds / st.calls if st.calls else 0.0
+            tree.insert("", tk.END, values=(st.line, st.kind, st.calls, format_duration(st.seconds), format_duration(avg)))
+
+    def _sort_profile(self, col: str) -> None:
+        key, reverse = self._profile_sort
+        self._profile_sort = (col, not reverse) if col == key else (col, col != "line" and col != "kind")
+        self._fill_profile_tree()
+
+    def _goto_profile_line(self) -> None:
+        sel = self._profile_tree.selection()
+        if not sel:
+            return
+        line = self._profile_tree.item(sel[0], "values")[0]
+        self.editor.see(f"{line}.0")
+        self.editor.mark_set(tk.INSERT, f"{line}.0")
+        self.editor.focus_set()
+
+    def _export_profile(self, fmt: str) -> None:
+        prof = self.profiler
+        if prof is None:
+            return
+        if fmt == "json":
+            path = filedialog.asksaveasfilename(
+                title="Profili Dışa Aktar", defaultextension=".json",
+                filetypes=[("JSON", "*.json"), ("Tüm Dosyalar", "*.*")],
+                parent=self._profile_win,
+            )
+        else:
+            path = filedialog.asksaveasfilename(
+                title="Flamegraph Dışa Aktar", defaultextension=".folded",
+                filetypes=[("Collapsed stacks", "*.folded *.txt"), ("Tüm Dosyalar", "*.*")],
+                parent=self._profile_win,
+            )
+        if not path:
+            return
+        try:
+            if fmt == "json":
+                prof.write_json(path)
+            else:
+                prof.write_collapsed(path)
+            self._console_write(f"[Warn] Profil kaydedildi: {path}")
+        except Exception as e:
+            messagebox.showerror("Hata", str(e))
+
+    def _show_gutter(self, prof: Profiler) -> None:
+        line_count = int(self.editor.index("end-1c").split(".")[0])
+        hottest = max((st.seconds for st in prof.lines.values()), default=0.0)
+        rows = []
+        hot_rows = []
+        for n in range(1, line_count + 1):
+            st = prof.lines.get(n)
+            if st is None:
+                rows.append("")
+                continue
+            rows.append(format_duration(st.seconds))
+            # Lines within 10% of the hottest one are highlighted
+            if hottest and st.seconds >= hottest * 0.9:
+                hot_rows.append(n)
+        self.gutter.configure(state="normal")
+        self.gutter.delete("1.0", tk.END)
+        self.gutter.insert("1.0", "\n".join(rows))
+        for n in hot_rows:
+            self.gutter.tag_add("hot", f"{n}.0", f"{n}.end")
+        self.gutter.configure(state="disabled")
+        if not self._gutter_visible:
+            self.gutter.pack(side=tk.LEFT, fill=tk.Y, before=self.editor)
+            self._gutter_visible = True
+        self.gutter.yview_moveto(self.editor.yview()[0])
+
+    def _hide_gutter(self) -> None:
+        if self._gutter_visible:
+            self.gutter.pack_forget()
+            self._gutter_visible = False
+
+    def _on_editor_yscroll(self, first: str, last: str) -> None:
+        if self._gutter_visible:
+            self.gutter.yview_moveto(first)
+        if self._lazy_highlight:
+            self._schedule_highlight(40)
+
+    # ---------- Performans panel ----------
+    def _show_metrics(self) -> None:
+        win = self._metrics_win
+        if win is not None and win.winfo_exists():
+            win.lift()
+            return
+        win = tk.Toplevel(self.root)
+        win.title("Performans")
+        win.geometry("460x520")
+        self._metrics_win = win
+        self._metrics_text = tk.Text(
+            win, wrap="none", bg="#111315", fg="#eeeeee", relief=tk.FLAT, padx=8, pady=8, font=self.console_font
+        )
+        self._metrics_text.pack(fill=tk.BOTH, expand=True, padx=8, pady=(8, 4))
+        btns = ttk.Frame(win)
+        btns.pack(fill=tk.X, padx=8, pady=(0, 8))
+        ttk.Label(btns, text="Ayrı süreçte çalışan programlar burada görünmez.").pack(side=tk.LEFT)
+        ttk.Button(btns, text="Sıfırla", command=self._reset_metrics).pack(side=tk.RIGHT)
+        win.protocol("WM_DELETE_WINDOW", self._close_metrics)
+        self._refresh_metrics()
+
+    def _close_metrics(self) -> None:
+        # Nothing is polled once the panel is closed
+        if self._metrics_job is not None:
+            self.root.after_cancel(self._metrics_job)
+            self._metrics_job = None
+        if self._metrics_win is not None:
+            self._metrics_win.destroy()
+            self._metrics_win = None
+
+    def _reset_metrics(self) -> None:
+        self.interpreter.metrics.reset()
+        self._refresh_metrics()
+
+    def _refresh_metrics(self) -> None:
+        self._metrics_job = None
+        win = self._metrics_win
+        if win is None or not win.winfo_exists():
+            return
+        snap = self.interpreter.metrics.snapshot()
+        rows = [
+            ("Çalışan deyim", snap["statements"]),
+            ("Regex denemesi", snap["regex_attempts"]),
+            ("Regex ıskası", snap["regex_misses"]),
+            ("İfade değerlendirme", snap["evals"]),
+            ("Oluşturulan widget", snap["widgets_created"]),
+            ("Yok edilen widget", snap["widgets_destroyed"]),
+        ]
+        lines = [f"{label:<22}{value:>12,}" for label, value in rows]
+        lines.append("")
+        lines.append("Önbellekler")
+        for name, c in sorted(snap["caches"].items()):
+            lines.append(f"  {name:<20}{c['hits']:>8} / {c['misses']:<8} %{c['hit_rate'] * 100:.1f}")
+        lines.append("")
+        lines.append("Olaylar")
+        for key, n in sorted(snap["events"].items(), key=lambda kv: kv[1], reverse=True):
+            lines.append(f"  {key:<28}{n:>8}")
+        lines.append("")
+        lines.append(f"Olay kuyruğu: {snap['events_queued']:,} kuyruğa, {snap['events_coalesced']:,} birleştirildi, "
+                     f"en derin {snap['queue_peak']:,}")
+        lines.extend(self._histogram_lines("Kuyrukta bekleme", snap["queue_latency"]))
+        lines.extend(self._histogram_lines("Olay işleyici süresi", snap["handler_latency"]))
+        lines.append("")
+        lines.append(f"Zamanlayıcı: {snap['timer_ticks']:,} tik, {snap['timer_fires']:,} tetikleme, "
+                     f"{snap['timer_overruns']:,} atlanan periyot")
+        lines.extend(self._histogram_lines("Zamanlayıcı gecikmesi", snap["timer_drift"]))
+        text = self._metrics_text
+        text.configure(state="normal")
+        text.delete("1.0", tk.END)
+        text.insert("1.0", "\n".join(lines))
+        text.configure(state="disabled")
+        self._metrics_job = self.root.after(METRICS_REFRESH_MS, self._refresh_metrics)
+
+    def _histogram_lines(self, title: str, h: dict) -> list[str]:
+        lines = ["", f"{title} ({h['count']} çağrı)"]
+        lines.append(
+            f"  ort {format_duration(h['mean'])}  p50 {format_duration(h['p50'])}  "
+            f"p90 {format_duration(h['p90'])}  p99 {format_duration(h['p99'])}  max {format_duration(h['max'])}"
+        )
+        peak = max((n for _b, n in h["buckets_us"]), default=0)
+        for bound, n in h["buckets_us"]:
+            if not n:
+                continue
+            label = f"≤{format_duration(bound / 1e6)}" if bound is not None else "daha uzun"
+            bar = "█" * max(1, int(24 * n / peak)) if peak else ""
+            lines.append(f"  {label:>10} {bar} {n}")
+        return lines
+
     def run(self) -> None:
         self.root.mainloop()
 
@@ -616,7 +1264,10 @@ class QudeIDE:
         except Exception:
             pass
 
-    def _publish_exe(self) -> None:
+    def _publish_exe(self, full_build: bool = False) -> None:
+        if self._publish_job is not None:
+            messagebox.showinfo("Yayınla", "Bir yayınlama zaten sürüyor.")
+            return
         code = self.editor.get("1.0", tk.END)
         # Prefill Desktop and filename Qude1.2.exe
         desktop_dir = os.path.join(os.path.expanduser('~'), 'Desktop')
@@ -635,152 +1286,120 @@ class QudeIDE:
             return
         app_name = os.path.splitext(os.path.basename(save_path))[0]
 
-        # Check pyinstaller
-        pyinst_module = None
-        try:
-            subprocess.run([sys.executable, "-m", "PyInstaller", "--version"], capture_output=True, text=True, check=True)
-            pyinst_module = "PyInstaller"
-        except Exception:
-            try:
-                subprocess.run([sys.executable, "-m", "pyinstaller", "--version"], capture_output=True, text=True, check=True)
-                pyinst_module = "pyinstaller"
-            except Exception:
-                messagebox.showerror("Hata", "PyInstaller bulunamadı. Lütfen 'pip install pyinstaller' ile kurun.")
-                return
-
-        # Temp build folder
-        tmpdir = tempfile.mkdtemp(prefix="qude_build_")
-        try:
-            runner_path = os.path.join(tmpdir, "pack_runner.py")
-            with open(runner_path, "w", encoding="utf-8") as f:
-                f.write(
-                    "import tkinter as tk\n"
-                    "from qude.interpreter import QudeInterpreter\n"
-                    "\n"
-                    "CODE = " + repr(code) + "\n"
-                    "\n"
-                    "def main():\n"
-                    "    root = tk.Tk()\n"
-                    "    try:\n"
-                    "        root.withdraw()\n"
-                    "    except Exception:\n"
-                    "        pass\n"
-                    "    def cw(msg: str):\n"
-                    "        print(msg)\n"
-                    "    interp = QudeInterpreter(cw, root)\n"
-                    "    interp.preview_mode = False\n"
-                    "    interp.preview_root = None\n"
-                    "    interp.window = None\n"
-                    "    interp.run(CODE)\n"
-                    "    root.mainloop()\n"
-                    "\n"
-                    "if __name__ == '__main__':\n"
-                    "    main()\n"
-                )
-
-            # Ensure local 'qude' package is available to the build by copying it next to runner
-            try:
-                pkg_src = os.path.dirname(__file__)
-                pkg_dst = os.path.join(tmpdir, "qude")
-                if os.path.isdir(pkg_dst):
-                    shutil.rmtree(pkg_dst, ignore_errors=True)
-                shutil.copytree(pkg_src, pkg_dst)
-            except Exception as e:
-                self._console_write(f"[Warn] Paket kopyalanamadı: {e}")
-
-            # Build args
-            # Create Windows version resource file to embed version and description
-            try:
-                version_path = os.path.join(tmpdir, "version_info.txt")
-                with open(version_path, "w", encoding="utf-8") as vf:
-                    vf.write(
-                        "VSVersionInfo(\n"
-                        "  ffi=FixedFileInfo(\n"
-                        "    filevers=(1, 2, 0, 0),\n"
-                        "    prodvers=(1, 2, 0, 0),\n"
-                        "    mask=0x3f,\n"
-                        "    flags=0x0,\n"
-                        "    OS=0x40004,\n"
-                        "    fileType=0x1,\n"
-                        "    subtype=0x0,\n"
-                        "    date=(0, 0)\n"
-                        "  ),\n"
-                        "  kids=[\n"
-                        "    StringFileInfo([\n"
-                        "      StringTable('040904B0', [\n"
-                        "        StringStruct('CompanyName', 'Qude'),\n"
-                        "        StringStruct('FileDescription', 'Qude 1.2'),\n"
-                        "        StringStruct('FileVersion', '1.2.0.0'),\n"
-                        "        StringStruct('InternalName', '" + app_name + "'),\n"
-                        "        StringStruct('OriginalFilename', '" + app_name + ".exe'),\n"
-                        "        StringStruct('ProductName', 'Qude 1.2'),\n"
-                        "        StringStruct('ProductVersion', '1.2.0.0')\n"
-                        "      ])\n"
-                        "    ]),\n"
-                        "    VarFileInfo([VarStruct('Translation', [1033, 1200])])\n"
-                        "  ]\n"
-                        ")\n"
-                    )
-            except Exception:
-                version_path = None
-            args = [
-                sys.executable, "-m", pyinst_module,
-                "--noconfirm", "--onefile", "--windowed",
-                "--name", app_name,
-                "--paths", tmpdir,
-            ]
-            if version_path and os.path.exists(version_path):
-                args.extend(["--version-file", version_path])
-            if self.icon_bitmap_path and os.path.exists(self.icon_bitmap_path):
-                # Prefer ICO if available
-                args.extend(["--icon", self.icon_bitmap_path])
-            # else try to locate q.ico near package
-            else:
-                ico_try = None
-                for d in [os.path.dirname(__file__), os.path.dirname(os.path.dirname(__file__))]:
-                    p = os.path.join(d, "q.ico")
-                    if os.path.exists(p):
-                        ico_try = p
-                        break
-                if ico_try:
-                    args.extend(["--icon", ico_try])
-            args.append(runner_path)
-
-            # Log to console
-            self._console_write(f"[Warn] Yayınlama başlıyor: {app_name}.exe")
-            proc = subprocess.run(args, cwd=tmpdir, text=True, capture_output=True)
-            if proc.stdout:
-                for ln in proc.stdout.splitlines():
-                    if ln.strip():
-                        self._console_write(ln)
-            if proc.returncode != 0:
-                if proc.stderr:
-                    self._console_write("[Error] PyInstaller:")
-                    for ln in proc.stderr.splitlines():
-                        if ln.strip():
-                            self._console_write(ln)
-                messagebox.showerror("Hata", "Yayınlama başarısız oldu. Konsolu kontrol edin.")
-                return
-
-            # Move output
-            built_exe = os.path.join(tmpdir, "dist", f"{app_name}.exe")
-            if not os.path.exists(built_exe):
-                messagebox.showerror("Hata", "Oluşturulan EXE bulunamadı.")
-                return
-            try:
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                shutil.copy2(built_exe, save_path)
-            except Exception as e:
-                messagebox.showerror("Hata", f"EXE taşınamadı: {e}")
+        # Build runs in the background; output is relayed through the job queue
+        job = PublishJob(
+            code,
+            save_path,
+            icon_path=self.icon_bitmap_path,
+            package_dir=os.path.dirname(__file__),
+            mode="full" if full_build else "stub",
+        )
+        self._publish_job = job
+        self._console_write(f"[Warn] Yayınlama başlıyor: {app_name}.exe")
+        self._show_status("Yayınlanıyor...", cancel=self._cancel_publish)
+        job.start()
+        self.root.after(PUBLISH_POLL_MS, self._poll_publish)
+
+    def _publish_batch(self) -> None:
+        if self._publish_job is not None:
+            messagebox.showinfo("Yayınla", "Bir yayınlama zaten sürüyor.")
+            return
+        src_dir = filedialog.askdirectory(title="Yayınlanacak .q Klasörü")
+        if not src_dir:
+            return
+        out_dir = filedialog.askdirectory(title="Çıktı Klasörü")
+        if not out_dir:
+            return
+        workers = simpledialog.askinteger(
+            "Toplu Yayınla",
+            "Paralel işçi sayısı:",
+            initialvalue=os.cpu_count() or 2,
+            minvalue=1,
+            parent=self.root,
+        )
+        if workers is None:
+            return
+        scripts = collect_scripts(src_dir)
+        if not scripts:
+            messagebox.showinfo("Toplu Yayınla", "Klasörde .q dosyası bulunamadı.")
+            return
+        job = BatchPublishJob(
+            scripts,
+            out_dir,
+            workers=workers,
+            icon_path=self.icon_bitmap_path,
+            package_dir=os.path.dirname(__file__),
+        )
+        self._publish_job = job
+        self._show_status("Toplu yayınlama...", cancel=self._cancel_publish)
+        job.start()
+        self.root.after(PUBLISH_POLL_MS, self._poll_publish)
+
+    def _poll_publish(self) -> None:
+        job = self._publish_job
+        if job is None:
+            return
+        for kind, *payload in job.drain():
+            if kind == "line":
+                self._console_write(payload[0])
+            elif kind == "progress":
+                self._show_status(payload[1], fraction=payload[0], cancel=self._cancel_publish)
+            elif kind == "done":
+                self._publish_job = None
+                self._hide_status()
+                ok, message = payload
+                if ok and isinstance(job, BatchPublishJob):
+                    self._console_write(f"[Warn] {message}")
+                    messagebox.showinfo("Tamamlandı", message)
+                elif ok:
+                    self._console_write(f"[Warn] Yayınlandı: {message}")
+                    messagebox.showinfo("Tamamlandı", f"Uygulama oluşturuldu:\n{message}")
+                elif job.cancelled:
+                    self._console_write(f"[Warn] {message}")
+                else:
+                    self._console_write(f"[Error] {message}")
+                    messagebox.showerror("Hata", message)
                 return
+        self.root.after(PUBLISH_POLL_MS, self._poll_publish)
+
+    def _cancel_publish(self) -> None:
+        if self._publish_job is not None:
+            self._publish_job.cancel()
+            self._show_status("İptal ediliyor...")
+
+    # ---------- Status (console header) ----------
+    def _show_status(self, text: str, fraction: float | None = None, cancel=None) -> None:
+        self.status_var.set(text)
+        if not self._status_visible:
+            self.status_cancel_btn.pack(side=tk.RIGHT, padx=(6, 0))
+            self.status_progress.pack(side=tk.RIGHT, padx=(6, 0))
+            self.status_label.pack(side=tk.RIGHT, padx=(6, 0))
+            self._status_visible = True
+        if fraction is None:
+            if str(self.status_progress.cget("mode")) != "indeterminate":
+                self.status_progress.configure(mode="indeterminate")
+                self.status_progress.start(50)
+        else:
+            if str(self.status_progress.cget("mode")) != "determinate":
+                self.status_progress.stop()
+                self.status_progress.configure(mode="determinate")
+            self.status_progress["value"] = max(0.0, min(1.0, fraction)) * 100
+        self._status_cancel = cancel
+        self.status_cancel_btn.configure(state="normal" if cancel else "disabled")
+
+    def _hide_status(self) -> None:
+        if not self._status_visible:
+            return
+        self.status_progress.stop()
+        self.status_label.pack_forget()
+        self.status_progress.pack_forget()
+        self.status_cancel_btn.pack_forget()
+        self._status_visible = False
+        self._status_cancel = None
 
-            self._console_write(f"[Warn] Yayınlandı: {save_path}")
-            messagebox.showinfo("Tamamlandı", f"Uygulama oluşturuldu:\n{save_path}")
-        finally:
-            try:
-                shutil.rmtree(tmpdir, ignore_errors=True)
-            except Exception:
-                pass
+    def _on_status_cancel(self) -> None:
+        if self._status_cancel is not None:
+            self._status_cancel()
 
     def _clear_preview(self) -> None:
         for child in self.preview_area.winfo_children():
@@ -1004,31 +1623,21 @@ class QudeIDE:
 
     # ---------- Icon ----------
     def _create_q_icon(self) -> tk.PhotoImage:
-        img = tk.PhotoImage(width=32, height=32)
         bg = "#202225"
         fg = "#ffffff"
-        # fill background
-        for x in range(32):
-            for y in range(32):
-                img.put(bg, (x, y))
+        # Drawn in memory on a background-filled buffer, uploaded in one put
+        img = PixelImage(32, 32, bg)
         # draw a block 'Q'
         for x in range(6, 26):
-            img.put(fg, (x, 6))
-            img.put(fg, (x, 25))
+            img.set(x, 6, fg)
+            img.set(x, 25, fg)
         for y in range(6, 26):
-            img.put(fg, (6, y))
-            img.put(fg, (25, y))
-        # inner clear to create border
-        for x in range(8, 24):
-            for y in range(8, 24):
-                img.put(bg, (x, y))
+            img.set(6, y, fg)
+            img.set(25, y, fg)
         # tail of Q (diagonal)
         for d in range(0, 6):
-            x = 20 + d
-            y = 20 + d
-            if 0 <= x < 32 and 0 <= y < 32:
-                img.put(fg, (x, y))
-        return img
+            img.set(20 + d, 20 + d, fg)
+        return img.to_photo(self.root)
 
     def _load_icon_file(self) -> None:
         path = filedialog.askopenfilename(
@@ -1079,16 +1688,13 @@ class QudeIDE:
             self.root.iconphoto(True, self.app_icon)
         except Exception:
             pass
-        # Try convert PNG -> ICO using Pillow if available
+        # ICO for the taskbar, converted once per icon file and cached (needs Pillow)
+        ico = cached_ico(png_or_ico_path)
         try:
-            from PIL import Image  # type: ignore
-            img = Image.open(png_or_ico_path)
-            # ensure RGBA and size reasonable
-            sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128)]
-            tmp_ico = os.path.join(tempfile.gettempdir(), "qude_app_icon.ico")
-            img.save(tmp_ico, sizes=sizes, format='ICO')
-            self.root.iconbitmap(tmp_ico)
-            self.icon_bitmap_path = tmp_ico
+            if ico is None:
+                raise RuntimeError("no ICO")
+            self.root.iconbitmap(ico)
+            self.icon_bitmap_path = ico
         except Exception:
             # Pillow yoksa veya dönüştürme başarısızsa iconbitmap uygulanamayabilir
             self.icon_bitmap_path = None
@@ -1117,28 +1723,12 @@ class QudeIDE:
             return
         splash = tk.Toplevel(self.root)
         splash.overrideredirect(True)
-        # Load ICO as image if Pillow is available; otherwise skip image splash
+        # Pre-scaled PNG from the icon cache; Pillow is only needed the first time
         img_obj = None
-        if Image and ImageTk:
+        splash_png = cached_splash(ico_path)
+        if splash_png:
             try:
-                img = Image.open(ico_path)
-                # choose the largest available size/frame
-                if hasattr(img, "n_frames"):
-                    best = None
-                    best_area = -1
-                    for i in range(getattr(img, "n_frames", 1)):
-                        img.seek(i)
-                        w, h = img.size
-                        if w * h > best_area:
-                            best = img.copy()
-                            best_area = w * h
-                    img = best if best is not None else img
-                # scale up moderately for visibility if too small
-                w, h = img.size
-                scale = 4 if max(w, h) <= 32 else 2 if max(w, h) <= 64 else 1
-                if scale > 1:
-                    img = img.resize((w * scale, h * scale), Image.LANCZOS)
-                img_obj = ImageTk.PhotoImage(img)
+                img_obj = tk.PhotoImage(master=splash, file=splash_png)
             except Exception:
                 img_obj = None
         if img_obj is None:
@@ -1169,8 +1759,10 @@ class QudeIDE:
         self.root.title(f"Qude IDE (Prototype) - {name}")
 
     def _new_file(self) -> None:
+        self._cancel_file_load()
         self.editor.delete("1.0", tk.END)
         self.current_file = None
+        self._lazy_highlight = False
         self._set_title()
         self._highlight_all()
 
@@ -1181,18 +1773,89 @@ class QudeIDE:
         )
         if not path:
             return
+        self._cancel_file_load()
         try:
+            size = os.path.getsize(path)
+            if size > OPEN_STREAM_BYTES:
+                self._start_file_load(path, size)
+                return
             with open(path, "r", encoding="utf-8") as f:
                 content = f.read()
             self.editor.delete("1.0", tk.END)
             self.editor.insert("1.0", content)
             self.current_file = path
+            self._lazy_highlight = False
             self._set_title()
             self._highlight_all()
         except Exception as e:
             messagebox.showerror("Hata", f"Dosya açılamadı: {e}")
 
+    def _start_file_load(self, path: str, size: int) -> None:
+        # Read on a worker thread, insert in time-boxed slices from idle callbacks; the
+        # file only becomes current_file once complete, so a partial buffer is never
+        # saved over it
+        load = _FileLoad(path, size)
+        self._file_load = load
+        self.editor.delete("1.0", tk.END)
+        self.editor.configure(undo=False)
+        self.current_file = None
+        self._lazy_highlight = True
+        self.root.title(f"Qude IDE (Prototype) - {os.path.basename(path)} (yükleniyor)")
+        self._show_status(f"Açılıyor: {os.path.basename(path)}", 0.0, cancel=self._cancel_file_load)
+        load.start()
+        self.root.after_idle(self._pump_file_load, load)
+
+    def _pump_file_load(self, load: _FileLoad) -> None:
+        if load is not self._file_load:
+            return
+        deadline = time.perf_counter() + OPEN_SLICE_MS / 1000.0
+        while time.perf_counter() < deadline:
+            try:
+                kind, payload = load.chunks.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "data":
+                self.editor.insert("end-1c", payload)
+                load.loaded += len(payload)
+            elif kind == "done":
+                self._finish_file_load(load)
+                return
+            else:
+                self._end_file_load()
+                self._set_title()
+                messagebox.showerror("Hata", f"Dosya açılamadı: {payload}")
+                return
+        self._show_status(f"Açılıyor: {os.path.basename(load.path)}",
+                          min(1.0, load.loaded / max(1, load.size)), cancel=self._cancel_file_load)
+        if load.chunks.empty():
+            # The reader is behind; check back shortly instead of spinning
+            self.root.after(PUBLISH_POLL_MS, self._pump_file_load, load)
+        else:
+            self.root.after_idle(self._pump_file_load, load)
+
+    def _finish_file_load(self, load: _FileLoad) -> None:
+        self._end_file_load()
+        self.current_file = load.path
+        self._set_title()
+        self._highlight_all()
+
+    def _end_file_load(self) -> None:
+        self._file_load = None
+        self.editor.configure(undo=True)
+        self.editor.edit_reset()
+        self._hide_status()
+
+    def _cancel_file_load(self) -> None:
+        load = self._file_load
+        if load is None:
+            return
+        load.cancel()
+        self._end_file_load()
+        self._set_title()
+        self._console_write(f"[Warn] Dosya yüklemesi iptal edildi: {os.path.basename(load.path)}")
+
     def _save_file(self) -> None:
+        # While a file is streaming in current_file is None, so this goes to the guard below
         if not self.current_file:
             return self._save_file_as()
         try:
@@ -1202,6 +1865,9 @@ class QudeIDE:
             messagebox.showerror("Hata", f"Kaydedilemedi: {e}")
 
     def _save_file_as(self) -> None:
+        if self._file_load is not None:
+            messagebox.showinfo("Kaydet", "Dosya hâlâ yükleniyor.")
+            return
         path = filedialog.asksaveasfilename(
             title="Farklı Kaydet",
             defaultextension=".q",
@@ -1262,6 +1928,10 @@ class QudeIDE:
             "MatchEvent",
             # Event sistemi
             "event;", "LeftClickEvent", "RightClickEvent",
+            # Zamanlayıcılar
+            "every", "after",
+            # Döngüler
+            "repeat", "for",
         ]
 
         # Generate an aesthetic distinct color palette and map to tokens
@@ -1283,6 +1953,8 @@ class QudeIDE:
         self.editor.tag_configure("fn", foreground="#2ee07d")
         # Debounced highlighting
         self._highlight_job = None
+        # Large files: only the visible lines are highlighted, again after scrolling
+        self._lazy_highlight = False
         self.editor.bind("<<Modified>>", self._on_edit_modified)
 
         # Raise per-token tags above fallback and ensure strings/numbers on top
@@ -1299,70 +1971,102 @@ class QudeIDE:
         if not self.editor.edit_modified():
             return
         self.editor.edit_modified(False)
+        self._schedule_highlight(120)
+
+    def _schedule_highlight(self, delay_ms: int) -> None:
         try:
             if self._highlight_job is not None:
                 self.root.after_cancel(self._highlight_job)
         except Exception:
             pass
-        self._highlight_job = self.root.after(120, self._highlight_all)
+        self._highlight_job = self.root.after(delay_ms, self._highlight_all)
 
     def _highlight_all(self) -> None:
-        text = self.editor.get("1.0", tk.END)
+        if self._lazy_highlight:
+            self._highlight_visible()
+            return
+        self._highlight_text(self.editor.get("1.0", tk.END), 1, "1.0", tk.END)
+
+    def _highlight_visible(self) -> None:
+        # Visible lines plus a margin; tags elsewhere are left as they are
+        first = int(self.editor.index("@0,0").split(".")[0])
+        last = int(self.editor.index(f"@0,{self.editor.winfo_height()}").split(".")[0])
+        first = max(1, first - LAZY_HIGHLIGHT_MARGIN)
+        last += LAZY_HIGHLIGHT_MARGIN
+        start, end = f"{first}.0", f"{last}.end"
+        self._highlight_text(self.editor.get(start, end), first, start, end)
+
+    def _highlight_text(self, text: str, first_line: int, start: str, end: str) -> None:
+        # text is the editor content from start (column 0 of first_line) to end
         # Clear existing tags
         clear_tags = ["fn", "num", "str", "bool"]
         if hasattr(self, "_token_colors"):
             clear_tags.extend(self._token_to_tag(t) for t in self._token_colors.keys())
-        for tag in clear_tags:
-            self.editor.tag_remove(tag, "1.0", tk.END)
+        self._clear_tags(clear_tags, start, end)
+
+        # Collect spans per tag first, then apply each tag in a few batched calls
+        spans: dict[str, list[tuple[int, int]]] = {}
 
         # Strings
-        for m in re.finditer(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"", text):
-            self._tag_range(m.start(), m.end(), "str")
+        spans["str"] = [m.span() for m in re.finditer(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"", text)]
 
         # Numbers
-        for m in re.finditer(r"\b\d+(?:\.\d+)?\b", text):
-            self._tag_range(m.start(), m.end(), "num")
+        spans["num"] = [m.span() for m in re.finditer(r"\b\d+(?:\.\d+)?\b", text)]
 
-        for m in re.finditer(r"(?i)\b(?:true|false)\b", text):
-            self._tag_range(m.start(), m.end(), "bool")
+        spans["bool"] = [m.span() for m in re.finditer(r"(?i)\b(?:true|false)\b", text)]
 
         # Per-token patterns (exact literal search using regex-escaped tokens)
         if hasattr(self, "_token_colors"):
             for tok in self._token_colors.keys():
                 pat = re.escape(tok)
-                for m in re.finditer(pat, text):
-                    self._tag_range(m.start(), m.end(), self._token_to_tag(tok))
+                spans.setdefault(self._token_to_tag(tok), []).extend(m.span() for m in re.finditer(pat, text))
 
         # Function-like shared properties (fallback)
         fn_patterns = [
             r"uptext|uptxt|utxt|geometry\.size|geom\.sz|ge\.sz|background\.color|bg\.clr|bgc|font\.color|fnt\.clr|f\$|font\.font|fnt\.font|ffnt|font\.size|fnt\.sz|fsz|text|txt|tx|text\.color|txt\.clr|t\$|cordinates|cordint|c\$",
         ]
         for pat in fn_patterns:
-            for m in re.finditer(pat, text):
-                self._tag_range(m.start(), m.end(), "fn")
+            spans.setdefault("fn", []).extend(m.span() for m in re.finditer(pat, text))
+
+        line_starts = self._line_starts(text)
+        for tag, tag_spans in spans.items():
+            self._tag_spans(tag, tag_spans, line_starts, first_line)
 
     def _token_to_tag(self, token: str) -> str:
         # Create a safe tag name from token
         return "tok_" + re.sub(r"[^A-Za-z0-9_]+", "_", token)
 
-    def _index_from_abs(self, abs_index: int) -> str:
-        # Convert absolute index in full text to Tk text index
-        prev = self.editor.get("1.0", tk.END)
-        line = 1
-        col = 0
-        count = 0
-        for ch in prev:
-            if count == abs_index:
-                return f"{line}.{col}"
-            if ch == "\n":
-                line += 1
-                col = 0
-            else:
-                col += 1
-            count += 1
-        return f"{line}.{col}"
-
-    def _tag_range(self, start_abs: int, end_abs: int, tag: str) -> None:
-        start_index = self._index_from_abs(start_abs)
-        end_index = self._index_from_abs(end_abs)
-        self.editor.tag_add(tag, start_index, end_index)
+    def _clear_tags(self, tags: list[str], start: str = "1.0", end: str = "end") -> None:
+        # Remove every tag in one Tcl evaluation instead of one tag_remove per tag
+        if not tags:
+            return
+        self.editor.tk.eval(
+            "foreach t {%s} {%s tag remove $t %s %s}" % (" ".join(tags), str(self.editor), start, end)
+        )
+
+    def _line_starts(self, text: str) -> list[int]:
+        # Absolute offset of the first character of every line
+        starts = [0]
+        find = text.find
+        pos = find("\n")
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find("\n", pos + 1)
+        return starts
+
+    def _index_from_abs(self, abs_index: int, line_starts: list[int], first_line: int = 1) -> str:
+        # Convert absolute index in the highlighted text to Tk text index
+        line = bisect.bisect_right(line_starts, abs_index)
+        return f"{line + first_line - 1}.{abs_index - line_starts[line - 1]}"
+
+    def _tag_spans(self, tag: str, spans: list[tuple[int, int]], line_starts: list[int], first_line: int = 1) -> None:
+        # Tk's "tag add" accepts many index pairs, so send spans in large batches
+        batch: list[str] = []
+        for start_abs, end_abs in spans:
+            batch.append(self._index_from_abs(start_abs, line_starts, first_line))
+            batch.append(self._index_from_abs(end_abs, line_starts, first_line))
+            if len(batch) >= TAG_BATCH_SIZE * 2:
+                self.editor.tag_add(tag, *batch)
+                batch = []
+        if batch:
+            self.editor.tag_add(tag, *batch)
@@ -1,9 +1,65 @@
 import re
+import time
 import webbrowser
 import tkinter as tk
-from tkinter import simpledialog
 from tkinter import font as tkfont
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .qude_lang.inputs import InputPrompts
+from .qude_lang.limits import Budget, BudgetExceeded, Limits
+from .qude_lang.profiler import Profiler
+from .qude_lang.metrics import Metrics, event_key
+from .qude_lang.events import EventRouter
+from .qude_lang.scheduler import Scheduler
+
+# Default slice budget for run(): statements per slice (0 = no limit) and
+# wall-clock milliseconds per slice (0 = no limit). Both 0 runs to completion.
+SLICE_STATEMENTS = 0
+SLICE_MS = 20.0
+# Compiled statement patterns shared by all interpreters
+_PATTERNS: Dict[Tuple[str, int], "re.Pattern[str]"] = {}
+# Compiled expressions kept per interpreter
+EXPR_CACHE_MAX = 4096
+# Tk sequence behind each click event name
+_CLICK_SEQUENCES = {'LeftClickEvent': '<Button-1>', 'RightClickEvent': '<Button-3>'}
+
+
+class _RunState:
+    # Program counter and if/elif/else chain of a suspended run
+    def __init__(self, lines: List[str], on_done: Optional[Callable[[], None]]) -> None:
+        self.lines = lines
+        self.i = 0
+        self.base = 0  # source line offset of lines[0] (non-zero inside loop bodies)
+        self.skip_else_chain: Optional[bool] = None  # None=no active chain; True=branch executed; False=not yet
+        self.on_done = on_done
+        self.after_id: Optional[str] = None
+        self.budget: Optional[Budget] = None
+        self.frames: List["_LoopFrame"] = []
+        # Event/timer bodies (which run after Qude.kill/): the header, whether the body
+        # waits on taQe.putt, and how to continue it once the answer is in
+        self.header: Optional[str] = None
+        self.waiting = False
+        self.resume: Optional[Callable[[], None]] = None
+
+
+class _LoopFrame:
+    # A running repeat/for loop or taken if-branch: the enclosing position plus the body
+    def __init__(self, state: _RunState, resume: int, body: List[str], body_base: int,
+                 var: Optional[str], values: Any) -> None:
+        self.lines = state.lines
+        self.resume = resume
+        self.base = state.base
+        self.body = body
+        self.body_base = body_base
+        self.var = var
+        self.values = values
+        # if/elif/else chain state to restore once the body is done
+        self.chain: Optional[bool] = None
+        # Body lines that mention {var} and need it substituted per iteration
+        self.holes = [k for k, ln in enumerate(body) if '{' + var + '}' in ln] if var else []
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip())
 
 
 class QudeInterpreter:
@@ -13,8 +69,11 @@ class QudeInterpreter:
         ide_root: tk.Tk,
         icon_image: Optional[tk.PhotoImage] = None,
         icon_bitmap_path: Optional[str] = None,
+        backend: Any = None,
     ) -> None:
         self.console_write = console_write
+        # Widget toolkit: tkinter by default, or qude_lang.headless for display-less runs
+        self.tk = backend if backend is not None else tk
         self.ide_root = ide_root
         self.icon_image = icon_image
         self.icon_bitmap_path = icon_bitmap_path
@@ -32,89 +91,390 @@ class QudeInterpreter:
         self.warn_option_widgets: Dict[str, tk.Widget] = {}
         # link targets
         self.link_targets: Dict[str, str] = {}
-
-    def run(self, code: str) -> None:
+        # time-sliced execution
+        self.slice_statements = SLICE_STATEMENTS
+        self.slice_ms = SLICE_MS
+        self.on_progress: Optional[Callable[[int, int], None]] = None
+        self._run_state: Optional[_RunState] = None
+        self._in_step = False
+        self._suspended = False
+        # Event handler body currently running, for taQe.putt to suspend
+        self._handler_state: Optional[_RunState] = None
+        # taQe.putt: non-modal prompts; input_provider(prompt) answers synchronously (headless runs)
+        self.inputs = InputPrompts(self.tk, ide_root)
+        self.input_provider: Optional[Callable[[str], str]] = None
+        # Watchdog: per-run and per-event budgets (statements / seconds / widgets)
+        self.limits = Limits()
+        self._budget: Optional[Budget] = None
+        # Opt-in per-line profiler (qude_lang.profiler); None = off
+        self.profiler: Optional[Profiler] = None
+        # Always-on counters (qude_lang.metrics), read by the Performans panel
+        self.metrics = Metrics()
+        self._expr_cache: Dict[str, Tuple[str, Any]] = {}
+        self._expr_stats = self.metrics.cache("expr")
+        # event; handlers, multiplexed onto one Tk binding per widget and event type
+        self.events = EventRouter(self.tk, ide_root, self.metrics)
+        # every/after blocks: one shared timer heap feeding the event queue
+        self.scheduler = Scheduler(ide_root, self.events.queue.push, self.metrics)
+
+    def run(self, code: str, on_done: Optional[Callable[[], None]] = None) -> None:
+        # Executes in slices: when a slice budget runs out the rest of the program
+        # continues from ide_root.after(0, ...), so Tk can repaint and handle input.
+        self.stop()
         lines = [ln.rstrip() for ln in code.splitlines()]
-        i = 0
-        skip_else_chain: Optional[bool] = None  # None=no active chain; True=branch executed; False=not yet
-
-        while i < len(lines):
-            raw = lines[i]
-            line = raw.strip()
-
-            if not line or line.startswith('#') or line.startswith('//'):
-                i += 1
-                continue
-
-            if self._is_start(line):
-                self.running = True
-                i += 1
-                skip_else_chain = None
-                continue
-            if self._is_stop(line):
-                self.running = False
-                i += 1
-                skip_else_chain = None
-                continue
-            if not self.running:
-                i += 1
-                continue
-
-            # Event block: event; \n <indented event> \n <indented action>
-            if line.lower() == 'event;':
-                evt_line, act_line, consumed = self._consume_event_block(lines, i + 1)
-                if evt_line is None or act_line is None:
-                    self.console_write('[Error] Incomplete event block')
-                    i += 1
-                else:
-                    self._register_event_block(evt_line, act_line)
-                    i = consumed
-                continue
+        self._run_state = _RunState(lines, on_done)
+        self._run_state.budget = self.limits.run_budget()
+        try:
+            self._run_slice(self._run_state)
+        except Exception:
+            self._run_state = None
+            raise
+
+    def stop(self) -> None:
+        state = self._run_state
+        self._run_state = None
+        self._suspended = False
+        self.inputs.clear()
+        if state is not None and state.after_id is not None:
+            try:
+                self.ide_root.after_cancel(state.after_id)
+            except Exception:
+                pass
+        self.scheduler.clear()
+        self.events.queue.clear()
+        self.running = False
 
-            # If/Elif/Else single-line actions
-            if line.lower().startswith('if '):
-                cond_ok, action = self._parse_if_like(line)
-                if cond_ok is None:
-                    self.console_write('[Error] Bad if syntax')
-                    skip_else_chain = None
-                else:
-                    if cond_ok and action:
-                        self._execute_line(action)
-                        skip_else_chain = True
+    @property
+    def busy(self) -> bool:
+        return self._run_state is not None
+
+    def _run_slice(self, state: "_RunState") -> None:
+        if state is not self._run_state:
+            return  # stopped or replaced by a newer run
+        state.after_id = None
+        max_steps = self.slice_statements
+        deadline = time.perf_counter() + self.slice_ms / 1000.0 if self.slice_ms > 0 else None
+        steps = 0
+        budget = state.budget
+        self._budget = budget
+        budget.resume()
+        try:
+            while state.i < len(state.lines) or state.frames:
+                self._in_step = True
+                try:
+                    if self.profiler is None:
+                        self._step(state)
                     else:
-                        skip_else_chain = False
-                i += 1
-                continue
+                        self._profiled_step(state, self.profiler)
+                except BudgetExceeded as e:
+                    self._abort_run(state, e)
+                    return
+                finally:
+                    self._in_step = False
+                steps += 1
+                if self._suspended:
+                    return  # waiting for input; _on_input resumes this state
+                if state.i >= len(state.lines) and not state.frames:
+                    break
+                if (max_steps and steps >= max_steps) or (deadline is not None and time.perf_counter() >= deadline):
+                    if self.on_progress is not None:
+                        # Position in the top-level program, not inside a loop body
+                        top = state.frames[0] if state.frames else None
+                        self.on_progress(top.resume if top else state.i, len(top.lines if top else state.lines))
+                    state.after_id = self.ide_root.after(0, self._resume, state)
+                    return
+        finally:
+            budget.pause()
+            self._budget = None
+        self._run_state = None
+        if state.on_done is not None:
+            state.on_done()
+
+    def _profiled_step(self, state: "_RunState", prof: Profiler) -> None:
+        idx = state.i
+        lines, base = state.lines, state.base
+        t0 = time.perf_counter()
+        self._step(state)
+        elapsed = time.perf_counter() - t0
+        if idx >= len(lines):
+            return  # loop iteration bookkeeping
+        text = lines[idx].strip()
+        if text and not text.startswith('#') and not text.startswith('//'):
+            prof.record(base + idx + 1, prof.kind_of(text), elapsed)
+
+    def _abort_run(self, state: "_RunState", err: BudgetExceeded) -> None:
+        line = state.lines[state.i].strip() if state.i < len(state.lines) else ''
+        self.console_write(f"[Error] {err} at line {state.base + state.i + 1}: {line}")
+        self.stop()
+        if state.on_done is not None:
+            state.on_done()
+
+    def _fire_event(self, header: str, body: List[str], lineno: int = 0,
+                    state: Optional["_RunState"] = None) -> None:
+        # state: a body suspended on taQe.putt, continued from where it stopped
+        resumed = state is not None
+        if state is None:
+            state = _RunState(body, None)
+            state.base = lineno - 1
+            state.header = header
+            state.resume = lambda: self._fire_event(header, body, lineno, state)
+        # Handlers get their own budget; one fired from inside another shares it
+        outer = self._budget
+        budget = outer if outer is not None and outer.event else self.limits.event_budget()
+        self._budget = budget
+        if budget is not outer:
+            budget.resume()
+        prof = self.profiler
+        t0 = time.perf_counter()
+        try:
+            self._run_block(state)
+        except BudgetExceeded as e:
+            self.console_write(f"[Error] {e} in event {header.strip()}")
+        except Exception as ex:
+            self.console_write(f"[Error] Event: {ex}")
+        finally:
+            elapsed = time.perf_counter() - t0
+            if not resumed:
+                self.metrics.event_fired(event_key(header), elapsed)
+            if prof is not None:
+                prof.record(lineno, prof.kind_of(body[0].strip()), elapsed, f"event {header.strip()}")
+            if budget is not outer:
+                budget.pause()
+            self._budget = outer
+
+    def _count_widget(self) -> None:
+        self.metrics.widgets_created += 1
+        if self._budget is not None:
+            self._budget.widget()
+
+    def _on_window_destroy(self, e: Any) -> None:
+        # Bound on the app Toplevel, whose bindings also see its children's <Destroy>.
+        # Only script widgets count; input prompts and other engine frames do not
+        if e.widget is self.window:
+            self.metrics.widgets_destroyed += sum(1 for w in self.widgets.values() if w.master is e.widget)
+            # Timers die with the app window
+            self.scheduler.clear()
+
+    def _match(self, pattern: str, line: str, flags: int = 0) -> Optional["re.Match[str]"]:
+        rx = _PATTERNS.get((pattern, flags))
+        if rx is None:
+            rx = _PATTERNS[(pattern, flags)] = re.compile(pattern, flags)
+        m = rx.match(line)
+        metrics = self.metrics
+        metrics.regex_attempts += 1
+        if m is None:
+            metrics.regex_misses += 1
+        return m
+
+    def _resume(self, state: "_RunState") -> None:
+        # Errors raised from a continuation would otherwise only reach Tk's stderr hook
+        try:
+            self._run_slice(state)
+        except Exception as e:
+            self.console_write(f"[Error] {e}")
+            if state is self._run_state:
+                self._run_state = None
+                if state.on_done is not None:
+                    state.on_done()
+
+    def _step(self, state: "_RunState") -> None:
+        if state.i >= len(state.lines):
+            self._next_iteration(state)  # end of a loop body
+            return
+        raw = state.lines[state.i]
+        line = raw.strip()
 
-            if line.lower().startswith('elif '):
-                cond_ok, action = self._parse_if_like(line)
-                if skip_else_chain is None:
-                    i += 1
-                    continue
-                if skip_else_chain:
-                    i += 1
-                    continue
-                if cond_ok and action:
-                    self._execute_line(action)
-                    skip_else_chain = True
+        if not line or line.startswith('#') or line.startswith('//'):
+            state.i += 1
+            return
+
+        if self._is_start(line):
+            self.running = True
+            state.i += 1
+            state.skip_else_chain = None
+            return
+        if self._is_stop(line):
+            self.running = False
+            state.i += 1
+            state.skip_else_chain = None
+            return
+        if not (self.running or state.header is not None):
+            state.i += 1
+            return
+
+        # Event block: event; \n <indented event> \n <action, or a more indented body>
+        if line.lower() == 'event;':
+            hdr = state.i + 1
+            while hdr < len(state.lines) and not state.lines[hdr].strip():
+                hdr += 1
+            if hdr >= len(state.lines):
+                self.console_write('[Error] Incomplete event block')
+                state.i = hdr
+                return
+            body, start, end = self._consume_body(state.lines, hdr)
+            if not body:
+                self.console_write('[Error] Incomplete event block')
+            else:
+                self._register_event_block(state.lines[hdr], body, state.base + start + 1)
+            state.i = end
+            return
+
+        # Timer block: every <ms>: / after <ms>: \n <indented body>
+        if line[:6].lower() in ('every ', 'after '):
+            m = self._match(r"^(every|after)\s+(.+?)\s*:$", line, re.IGNORECASE)
+            if m:
+                body, start, end = self._consume_body(state.lines, state.i)
+                if not body:
+                    self.console_write(f'[Error] Incomplete {m.group(1).lower()} block')
                 else:
-                    skip_else_chain = False
-                i += 1
-                continue
-
-            if line.lower().startswith('else'):
-                if skip_else_chain is None:
-                    i += 1
-                    continue
-                if not skip_else_chain:
-                    m = re.match(r"^else\s*:\s*(?:then\s+)?(.+)$", line, re.IGNORECASE)
-                    if m and m.group(1).strip():
-                        self._execute_line(m.group(1).strip())
-                i += 1
-                continue
-
-            self._execute_line(line)
-            i += 1
+                    self._register_timer(m.group(1).lower(), m.group(2), body, state.base + start + 1)
+                state.i = end
+                return
+
+        # Loops: repeat N: / for i in a..b: \n <more indented body>
+        if line[:7].lower() == 'repeat ' or line[:4].lower() == 'for ':
+            if self._begin_loop(state, raw, line):
+                return
+
+        # If/Elif/Else: "if c: then action" on one line, or "if c:" with a more indented body
+        low = line.lower()
+        if low.startswith('if ') or low.startswith('elif '):
+            block = self._match(r"^(?:if|elif)\s+(.+?)\s*:$", line, re.IGNORECASE)
+            # An elif with no open chain, or after a branch already ran, is skipped
+            skip = low.startswith('elif ') and state.skip_else_chain is not False
+            if block:
+                cond_ok, action = (False if skip else self._eval_condition(block.group(1))), None
+            elif skip:
+                state.i += 1
+                return
+            else:
+                cond_ok, action = self._parse_if_like(line)
+            if cond_ok is None:
+                self.console_write('[Error] Bad if syntax')
+                state.skip_else_chain = None
+            elif block:
+                if not skip:
+                    state.skip_else_chain = cond_ok
+            elif cond_ok and action:
+                self._execute_line(action)
+                state.skip_else_chain = True
+            else:
+                state.skip_else_chain = False
+            if block:
+                self._if_block(state, raw, bool(cond_ok))
+            else:
+                state.i += 1
+            return
+
+        if low.startswith('else'):
+            run = state.skip_else_chain is False
+            if self._match(r"^else\s*:$", line, re.IGNORECASE):
+                self._if_block(state, raw, run)
+                return
+            if run:
+                m = re.match(r"^else\s*:\s*(?:then\s+)?(.+)$", line, re.IGNORECASE)
+                if m and m.group(1).strip():
+                    self._execute_line(m.group(1).strip())
+            state.i += 1
+            return
+
+        self._execute_line(line)
+        state.i += 1
+
+    def _begin_loop(self, state: "_RunState", raw: str, line: str) -> bool:
+        m = self._match(r"^repeat\s+(.+?)\s*:$", line, re.IGNORECASE)
+        if m:
+            var = None
+            values: Any = range(max(0, int(self._eval_expr(m.group(1)))))
+        else:
+            m = self._match(r"^for\s+(\w+)\s+in\s+(.+?)\s*\.\.\s*(.+?)\s*:$", line, re.IGNORECASE)
+            if not m:
+                return False
+            var = m.group(1)
+            first = int(self._eval_expr(m.group(2)))
+            last = int(self._eval_expr(m.group(3)))
+            values = range(first, last + 1) if first <= last else range(first, last - 1, -1)
+        lines = state.lines
+        start = state.i + 1
+        end = self._block_end(lines, start, _indent(raw))
+        state.i = end
+        state.skip_else_chain = None
+        if end > start:
+            state.frames.append(_LoopFrame(state, end, lines[start:end], state.base + start, var, iter(values)))
+            self._next_iteration(state)
+        return True
+
+    def _if_block(self, state: "_RunState", raw: str, taken: bool) -> None:
+        # Runs the branch body as a one-pass frame when taken; skips over it otherwise
+        lines = state.lines
+        start = state.i + 1
+        end = self._block_end(lines, start, _indent(raw))
+        state.i = end
+        if taken and end > start:
+            frame = _LoopFrame(state, end, lines[start:end], state.base + start, None, iter((0,)))
+            frame.chain = True  # later elif/else branches are skipped
+            state.frames.append(frame)
+            self._next_iteration(state)
+
+    def _next_iteration(self, state: "_RunState") -> None:
+        frame = state.frames[-1]
+        state.skip_else_chain = None
+        value = next(frame.values, None)
+        if value is None:
+            state.frames.pop()
+            state.lines, state.i, state.base = frame.lines, frame.resume, frame.base
+            state.skip_else_chain = frame.chain
+            return
+        # Each iteration counts as a statement, so empty bodies still hit the budget
+        self.metrics.statements += 1
+        if self._budget is not None:
+            self._budget.tick()
+        body = frame.body
+        if frame.var is not None:
+            self.vars[frame.var] = value
+            if frame.holes:
+                body = list(body)
+                token = '{' + frame.var + '}'
+                for k in frame.holes:
+                    body[k] = body[k].replace(token, str(value))
+        state.lines, state.i, state.base = body, 0, frame.body_base
+
+    def _run_block(self, state: "_RunState") -> None:
+        # A handler body runs outside the time-sliced main program, until it ends or
+        # waits for a taQe.putt answer
+        outer = self._handler_state
+        self._handler_state = state
+        state.waiting = False
+        try:
+            while (state.i < len(state.lines) or state.frames) and not state.waiting:
+                self._step(state)
+        finally:
+            self._handler_state = outer
+
+    def _request_input(self, prompt: str) -> None:
+        if self.input_provider is not None:
+            ans = self.input_provider(prompt)
+            self.vars['data'] = ans if ans is not None else ''
+            return
+        # The main program or the event handler asking suspends until the answer arrives
+        state = self._handler_state
+        if state is not None:
+            state.waiting = True
+        elif self._in_step:
+            state = self._run_state
+            if state is not None:
+                self._suspended = True
+        parent = self.preview_root if self.preview_mode and self.window is None else self.window
+        self.inputs.ask(parent, prompt, lambda ans: self._on_input(ans, state))
+
+    def _on_input(self, ans: str, state: Optional["_RunState"]) -> None:
+        self.vars['data'] = ans
+        if state is not None and state.resume is not None:
+            # Continued through the event queue, like any other handler
+            self.events.queue.push(state.resume)
+        elif state is not None and state is self._run_state:
+            self._suspended = False
+            state.after_id = self.ide_root.after(0, self._resume, state)
 
     # Aliases
     def _is_start(self, line: str) -> bool:
@@ -127,28 +487,26 @@ class QudeInterpreter:
     def _execute_line(self, line: str) -> None:
         if not line:
             return
+        self.metrics.statements += 1
+        if self._budget is not None:
+            self._budget.tick()
 
         # Console write
-        m = re.match(r"^(Qonsol\.write|qonsol\.write|qons\.wrt)\((.*)\)$", line)
+        m = self._match(r"^(Qonsol\.write|qonsol\.write|qons\.wrt)\((.*)\)$", line)
         if m:
             arg = self._eval_arg(m.group(2))
             self.console_write(str(arg))
             return
 
         # Input -> stores to 'data'
-        m = re.match(r"^(taQe\.putt|tq\.put|q£)\((.*)\)$", line)
+        m = self._match(r"^(taQe\.putt|tq\.put|q£)\((.*)\)$", line)
         if m:
             prompt = self._eval_arg(m.group(2))
-            if self.window is None:
-                parent = self.ide_root
-            else:
-                parent = self.window
-            ans = simpledialog.askstring("Qude Input", str(prompt), parent=parent)
-            self.vars['data'] = ans if ans is not None else ''
+            self._request_input(str(prompt))
             return
 
         # Variables assignment: Qurr x = expr
-        m = re.match(r"^(Qurr|qrr|q\$)\s+(\w+)\s*=\s*(.+)$", line)
+        m = self._match(r"^(Qurr|qrr|q\$)\s+(\w+)\s*=\s*(.+)$", line)
         if m:
             name = m.group(2)
             expr = m.group(3)
@@ -156,7 +514,7 @@ class QudeInterpreter:
             return
 
         # Variables assignment alias: variable x = expr
-        m = re.match(r"^(variable)\s+(\w+)\s*=\s*(.+)$", line, re.IGNORECASE)
+        m = self._match(r"^(variable)\s+(\w+)\s*=\s*(.+)$", line, re.IGNORECASE)
         if m:
             name = m.group(2)
             expr = m.group(3)
@@ -164,7 +522,7 @@ class QudeInterpreter:
             return
 
         # Math: matq(expr) or m;(expr)
-        m = re.match(r"^(matq|m;)\((.*)\)$", line)
+        m = self._match(r"^(matq|m;)\((.*)\)$", line)
         if m:
             val = self._eval_expr(m.group(2))
             self.console_write(str(val))
@@ -176,20 +534,20 @@ class QudeInterpreter:
             return
 
         # Window title
-        m = re.match(r"^(Qwindow\.uptext|qwd\.uptxt|qw\.utxt)\((.*)\)$", line)
+        m = self._match(r"^(Qwindow\.uptext|qwd\.uptxt|qw\.utxt)\((.*)\)$", line)
         if m:
             title = str(self._eval_arg(m.group(2)))
             self._ensure_window()
-            if not self.preview_mode and isinstance(self.window, tk.Toplevel):
+            if not self.preview_mode and isinstance(self.window, self.tk.Toplevel):
                 self.window.title(title)
             return
 
         # Window size
-        m = re.match(r"^(Qwindow\.geometry\.size|qwd\.geom\.sz|qw\.ge\.sz)\((.*)\)$", line)
+        m = self._match(r"^(Qwindow\.geometry\.size|qwd\.geom\.sz|qw\.ge\.sz)\((.*)\)$", line)
         if m:
             w, h = self._parse_two_ints(m.group(2))
             self._ensure_window()
-            if not self.preview_mode and isinstance(self.window, tk.Toplevel):
+            if not self.preview_mode and isinstance(self.window, self.tk.Toplevel):
                 self.window.geometry(f"{w}x{h}")
             else:
                 try:
@@ -201,25 +559,25 @@ class QudeInterpreter:
             return
 
         # Window resizable flags
-        m = re.match(r"^(Qwindow\.resizable|qwd\.reszbl|qw\.resz)\s*=\s*(.*)$", line)
+        m = self._match(r"^(Qwindow\.resizable|qwd\.reszbl|qw\.resz)\s*=\s*(.*)$", line)
         if m:
             val = self._parse_bool(m.group(2))
             self._ensure_window()
-            if not self.preview_mode and isinstance(self.window, tk.Toplevel):
+            if not self.preview_mode and isinstance(self.window, self.tk.Toplevel):
                 self.window.resizable(val, val)
             return
 
         # Window fullscreen
-        m = re.match(r"^(Qwindow\.fullscreen|qwd\.fullsc|qw\.fls)\s*=\s*(.*)$", line)
+        m = self._match(r"^(Qwindow\.fullscreen|qwd\.fullsc|qw\.fls)\s*=\s*(.*)$", line)
         if m:
             val = self._parse_bool(m.group(2))
             self._ensure_window()
-            if not self.preview_mode and isinstance(self.window, tk.Toplevel):
+            if not self.preview_mode and isinstance(self.window, self.tk.Toplevel):
                 self.window.attributes("-fullscreen", val)
             return
 
         # Window background color
-        m = re.match(r"^(Qwindow\.background\.color|qwd\.bg\.clr|qw\.bgc)\((.*)\)$", line)
+        m = self._match(r"^(Qwindow\.background\.color|qwd\.bg\.clr|qw\.bgc)\((.*)\)$", line)
         if m:
             color = str(self._eval_arg(m.group(2)))
             self._ensure_window()
@@ -258,68 +616,72 @@ class QudeInterpreter:
             return
 
         # Wwindow properties (warn window)
-        m = re.match(r"^(Wwindow\.uptext)\((.*)\)$", line)
+        m = self._match(r"^(Wwindow\.uptext)\((.*)\)$", line)
         if m:
             title = str(self._eval_arg(m.group(2)))
             self._set_warn_title(title)
             return
-        m = re.match(r"^(Wwindow\.background\.color)\((.*)\)$", line)
+        m = self._match(r"^(Wwindow\.background\.color)\((.*)\)$", line)
         if m:
             color = str(self._eval_arg(m.group(2)))
             self._set_warn_bg(color)
             return
 
         # Insert text
-        m = re.match(r"^(insert\.text|ins\.txt|i\.tx)\((.*)\)\s+as\s+(\w+)$", line)
+        m = self._match(r"^(insert\.text|ins\.txt|i\.tx)\((.*)\)\s+as\s+(\w+)$", line)
         if m:
             content = str(self._eval_arg(m.group(2)))
             name = m.group(3)
             self._ensure_window()
-            lbl = tk.Label(self.window, text=content)
+            self._count_widget()
+            lbl = self.tk.Label(self.window, text=content)
             lbl.place(x=0, y=0)
             self.widgets[name] = lbl
-            self.widget_fonts[name] = tkfont.Font(family='TkDefaultFont', size=12)
+            self.widget_fonts[name] = self.tk.font.Font(family='TkDefaultFont', size=12)
             lbl.configure(font=self.widget_fonts[name])
             return
 
         # Insert link (Label styled as hyperlink)
-        m = re.match(r"^(insert\.link)\(\)\s+as\s+(\w+)$", line)
+        m = self._match(r"^(insert\.link)\(\)\s+as\s+(\w+)$", line)
         if m:
             name = m.group(2)
             self._ensure_window()
-            lbl = tk.Label(self.window, text="link", fg="#1a73e8", cursor="hand2")
+            self._count_widget()
+            lbl = self.tk.Label(self.window, text="link", fg="#1a73e8", cursor="hand2")
             lbl.place(x=0, y=0)
             self.widgets[name] = lbl
-            self.widget_fonts[name] = tkfont.Font(family='TkDefaultFont', size=12, underline=1)
+            self.widget_fonts[name] = self.tk.font.Font(family='TkDefaultFont', size=12, underline=1)
             lbl.configure(font=self.widget_fonts[name])
             return
 
         # Insert button
-        m = re.match(r"^(insert\.button|ins\.btn|i\.bt)\(\)\s+as\s+(\w+)$", line)
+        m = self._match(r"^(insert\.button|ins\.btn|i\.bt)\(\)\s+as\s+(\w+)$", line)
         if m:
             name = m.group(2)
             self._ensure_window()
-            btn = tk.Button(self.window, text="button")
+            self._count_widget()
+            btn = self.tk.Button(self.window, text="button")
             btn.place(x=0, y=0)
             self.widgets[name] = btn
-            self.widget_fonts[name] = tkfont.Font(family='TkDefaultFont', size=12)
+            self.widget_fonts[name] = self.tk.font.Font(family='TkDefaultFont', size=12)
             btn.configure(font=self.widget_fonts[name])
             return
 
         # Insert inputter (Entry)
-        m = re.match(r"^(insert\.inputter)\(\)\s+as\s+(\w+)$", line)
+        m = self._match(r"^(insert\.inputter)\(\)\s+as\s+(\w+)$", line)
         if m:
             name = m.group(2)
             self._ensure_window()
-            ent = tk.Entry(self.window)
+            self._count_widget()
+            ent = self.tk.Entry(self.window)
             ent.place(x=0, y=0)
             self.widgets[name] = ent
-            self.widget_fonts[name] = tkfont.Font(family='TkDefaultFont', size=12)
+            self.widget_fonts[name] = self.tk.font.Font(family='TkDefaultFont', size=12)
             ent.configure(font=self.widget_fonts[name])
             return
 
         # Warn screen: warn.screen('message' <option>)
-        m = re.match(r"^warn\.screen\(\s*([\"\'].*?[\"\'])\s*<([^>]+)>\s*\)$", line)
+        m = self._match(r"^warn\.screen\(\s*([\"\'].*?[\"\'])\s*<([^>]+)>\s*\)$", line)
         if m:
             msg = str(self._eval_arg(m.group(1)))
             option = m.group(2).strip()
@@ -332,7 +694,7 @@ class QudeInterpreter:
 
     def _execute_widget_line(self, line: str) -> None:
         # name.font.color = 'red' | name.fnt.clr('red') | name.f$('red')
-        m = re.match(r"^(\w+)\.(font\.color|fnt\.clr|f\$)\((.*)\)$", line)
+        m = self._match(r"^(\w+)\.(font\.color|fnt\.clr|f\$)\((.*)\)$", line)
         if m:
             name = m.group(1)
             color = str(self._eval_arg(m.group(3)))
@@ -342,7 +704,7 @@ class QudeInterpreter:
             return
 
         # name.font.font('Comic Sans MS') | name.fnt.font('...') | name.ffnt('...')
-        m = re.match(r"^(\w+)\.(font\.font|fnt\.font|ffnt)\((.*)\)$", line)
+        m = self._match(r"^(\w+)\.(font\.font|fnt\.font|ffnt)\((.*)\)$", line)
         if m:
             name = m.group(1)
             fam = str(self._eval_arg(m.group(3)))
@@ -352,7 +714,7 @@ class QudeInterpreter:
                 self.widgets[name].configure(font=f)
             return
 
-        m = re.match(r"^(\w+)\.size\s*=\s*(.*)$", line)
+        m = self._match(r"^(\w+)\.size\s*=\s*(.*)$", line)
         if m:
             name = m.group(1)
             size = int(self._eval_expr(m.group(2)))
@@ -363,7 +725,7 @@ class QudeInterpreter:
             return
 
         # name.font.size = 15 | name.fnt.sz = 15 | name.fsz = 15
-        m = re.match(r"^(\w+)\.(font\.size|fnt\.sz|fsz)\s*=\s*(.*)$", line)
+        m = self._match(r"^(\w+)\.(font\.size|fnt\.sz|fsz)\s*=\s*(.*)$", line)
         if m:
             name = m.group(1)
             size = int(self._eval_expr(m.group(3)))
@@ -374,7 +736,7 @@ class QudeInterpreter:
             return
 
         # name.background.color = 'red' | name.bg.clr('red') | name.bgc('red')
-        m = re.match(r"^(\w+)\.(background\.color|bg\.clr|bgc)\((.*)\)$", line)
+        m = self._match(r"^(\w+)\.(background\.color|bg\.clr|bgc)\((.*)\)$", line)
         if m:
             name = m.group(1)
             color = str(self._eval_arg(m.group(3)))
@@ -384,23 +746,23 @@ class QudeInterpreter:
             return
 
         # name.text('click me') | name.txt('click me') | button.tx('click me')
-        m = re.match(r"^(\w+)\.(text|txt|tx)\((.*)\)$", line)
+        m = self._match(r"^(\w+)\.(text|txt|tx)\((.*)\)$", line)
         if m:
             name = m.group(1)
             txt = str(self._eval_arg(m.group(3)))
             w = self.widgets.get(name)
             if w:
-                if isinstance(w, tk.Button) or isinstance(w, tk.Label):
+                if isinstance(w, self.tk.Button) or isinstance(w, self.tk.Label):
                     w.configure(text=txt)
             return
 
         # name.link('https://...') -> assign URL and bind click
-        m = re.match(r"^(\w+)\.(link)\((.*)\)$", line)
+        m = self._match(r"^(\w+)\.(link)\((.*)\)$", line)
         if m:
             name = m.group(1)
             url = str(self._eval_arg(m.group(3)))
             w = self.widgets.get(name)
-            if w and isinstance(w, tk.Label):
+            if w and isinstance(w, self.tk.Label):
                 self.link_targets[name] = url
                 try:
                     w.configure(fg="#1a73e8", cursor="hand2")
@@ -427,7 +789,7 @@ class QudeInterpreter:
             return
 
         # name.text.color('red') | name.txt.clr('red') | name.t$('red')
-        m = re.match(r"^(\w+)\.(text\.color|txt\.clr|t\$)\((.*)\)$", line)
+        m = self._match(r"^(\w+)\.(text\.color|txt\.clr|t\$)\((.*)\)$", line)
         if m:
             name = m.group(1)
             color = str(self._eval_arg(m.group(3)))
@@ -437,7 +799,7 @@ class QudeInterpreter:
             return
 
         # name.geometry.size(100,100) | name.geom.sz | name.ge.sz
-        m = re.match(r"^(\w+)\.(geometry\.size|geom\.sz|ge\.sz)\((.*)\)$", line)
+        m = self._match(r"^(\w+)\.(geometry\.size|geom\.sz|ge\.sz)\((.*)\)$", line)
         if m:
             name = m.group(1)
             w = self.widgets.get(name)
@@ -451,7 +813,7 @@ class QudeInterpreter:
             return
 
         # name.cordinates(100, 100) | name.cordint | name.c$(x, y)
-        m = re.match(r"^(\w+)\.(cordinates|cordint|c\$)\((.*)\)$", line)
+        m = self._match(r"^(\w+)\.(cordinates|cordint|c\$)\((.*)\)$", line)
         if m:
             name = m.group(1)
             w = self.widgets.get(name)
@@ -467,7 +829,7 @@ class QudeInterpreter:
         # Unknown line -> ignore gracefully
         self.console_write(f"[Warn] Unrecognized: {line}")
 
-    def _register_event_block(self, evt_line: str, action_line: str) -> None:
+    def _register_event_block(self, evt_line: str, body: List[str], body_lineno: int = 0) -> None:
         # Patterns supported:
         #   name.LeftClickEvent:
         #   name.RightClickEvent:
@@ -484,16 +846,7 @@ class QudeInterpreter:
                 self.console_write(f"[Error] Unknown warn option: {option}")
                 return
 
-            def handler_opt(_e=None):
-                try:
-                    self._execute_line(action_line.strip())
-                except Exception as ex:
-                    self.console_write(f"[Error] Event: {ex}")
-
-            if evt == 'LeftClickEvent':
-                w.bind('<Button-1>', handler_opt, add='+')
-            else:
-                w.bind('<Button-3>', handler_opt, add='+')
+            self.events.add(w, _CLICK_SEQUENCES[evt], self._event_handler(evt_line, body, body_lineno))
             return
 
         # MatchEvent
@@ -503,19 +856,11 @@ class QudeInterpreter:
             expected_raw = m_match.group(2).strip()
             expected_val = self._eval_arg(expected_raw)
             w = self.widgets.get(name)
-            if not w or not isinstance(w, tk.Entry):
+            if not w or not isinstance(w, self.tk.Entry):
                 self.console_write(f"[Error] MatchEvent requires inputter widget: {name}")
                 return
 
-            def on_change(_e=None):
-                try:
-                    if w.get() == str(expected_val):
-                        self._execute_line(action_line.strip())
-                except Exception as ex:
-                    self.console_write(f"[Error] Event: {ex}")
-
-            # Bind on key release for simplicity
-            w.bind('<KeyRelease>', on_change, add='+')
+            self.events.add_match(w, str(expected_val), self._event_handler(evt_line, body, body_lineno))
             return
 
         # Click events on named widget
@@ -530,16 +875,28 @@ class QudeInterpreter:
             self.console_write(f"[Error] Unknown widget: {name}")
             return
 
-        def handler(_e=None):
-            try:
-                self._execute_line(action_line.strip())
-            except Exception as ex:
-                self.console_write(f"[Error] Event: {ex}")
+        self.events.add(w, _CLICK_SEQUENCES[evt], self._event_handler(evt_line, body, body_lineno))
+
+    def _register_timer(self, kind: str, interval_raw: str, body: List[str], body_lineno: int = 0) -> None:
+        try:
+            ms = float(self._eval_expr(interval_raw))
+        except Exception:
+            self.console_write(f"[Error] Bad {kind} interval: {interval_raw}")
+            return
+        if kind == 'every' and ms <= 0:
+            self.console_write('[Error] every needs a positive interval')
+            return
+        header = f"{kind} {ms:g}:"
+        handler = self._event_handler(header, body, body_lineno)
+        if kind == 'every':
+            self.scheduler.every(ms, handler, header)
+        else:
+            self.scheduler.after(ms, handler, header)
 
-        if evt == 'LeftClickEvent':
-            w.bind('<Button-1>', handler, add='+')
-        elif evt == 'RightClickEvent':
-            w.bind('<Button-3>', handler, add='+')
+    def _event_handler(self, header: str, body: List[str], lineno: int) -> Callable[[], None]:
+        # A single action line is taken as-is; deeper bodies keep their relative indentation
+        body = [body[0].strip()] if len(body) == 1 else list(body)
+        return lambda: self._fire_event(header, body, lineno)
 
     # Helpers
     def _ensure_window(self) -> None:
@@ -553,13 +910,14 @@ class QudeInterpreter:
                         self.window.destroy()
                 except Exception:
                     pass
-                self.window = tk.Frame(parent, bg='#222')
+                self.window = self.tk.Frame(parent, bg='#222')
                 # Fill the preview area
                 try:
                     self.window.pack(fill=tk.BOTH, expand=True)
                 except Exception:
                     self.window.place(x=0, y=0, relwidth=1.0, relheight=1.0)
                 # clear widget state for fresh render
+                self.metrics.widgets_destroyed += len(self.widgets)
                 self.widgets = {}
                 self.widget_fonts = {}
                 self.widget_sizes = {}
@@ -567,10 +925,11 @@ class QudeInterpreter:
 
         # Normal mode: Toplevel window
         if self.window is None or not self.window.winfo_exists():
-            self.window = tk.Toplevel(self.ide_root)
+            self.window = self.tk.Toplevel(self.ide_root)
             self.window.title('Qude App')
             self.window.geometry('400x300')
             self.window.configure(bg='#222')
+            self.window.bind('<Destroy>', self._on_window_destroy, add='+')
             # Prefer ICO for taskbar when available
             try:
                 if self.icon_bitmap_path:
@@ -602,14 +961,15 @@ class QudeInterpreter:
             pass
         self.warn_window = None
         self.warn_option_widgets = {}
+        self._count_widget()
 
         if self.preview_mode:
             parent = self.preview_root if self.preview_root else self.ide_root
-            frm = tk.Frame(parent, bg='#333', bd=1, relief='ridge')
+            frm = self.tk.Frame(parent, bg='#333', bd=1, relief='ridge')
             self.warn_window = frm
             # content
-            lbl = tk.Label(frm, text=message, bg='#333', fg='#fff')
-            btn = tk.Label(frm, text=option, bg='#555', fg='#fff', padx=12, pady=6)
+            lbl = self.tk.Label(frm, text=message, bg='#333', fg='#fff')
+            btn = self.tk.Label(frm, text=option, bg='#555', fg='#fff', padx=12, pady=6)
             lbl.pack(padx=12, pady=(12, 8))
             btn.pack(padx=12, pady=(0, 12))
             # place centered
@@ -625,7 +985,7 @@ class QudeInterpreter:
             except Exception:
                 frm.pack()
         else:
-            top = tk.Toplevel(self.ide_root)
+            top = self.tk.Toplevel(self.ide_root)
             top.title('Uyarı')
             top.geometry('300x150')
             top.configure(bg='#333')
@@ -642,8 +1002,8 @@ class QudeInterpreter:
                 pass
             self.warn_window = top
             # content
-            lbl = tk.Label(top, text=message, bg='#333', fg='#fff')
-            btn = tk.Label(top, text=option, bg='#555', fg='#fff', padx=12, pady=6)
+            lbl = self.tk.Label(top, text=message, bg='#333', fg='#fff')
+            btn = self.tk.Label(top, text=option, bg='#555', fg='#fff', padx=12, pady=6)
             lbl.pack(padx=12, pady=(12, 8))
             btn.pack(padx=12, pady=(0, 12))
             # modal-like
@@ -662,7 +1022,7 @@ class QudeInterpreter:
 
     # Wwindow property setters (warn window similar to Qwindow)
     def _set_warn_title(self, title: str) -> None:
-        if self.warn_window is not None and isinstance(self.warn_window, tk.Toplevel):
+        if self.warn_window is not None and isinstance(self.warn_window, self.tk.Toplevel):
             try:
                 self.warn_window.title(title)
             except Exception:
@@ -675,20 +1035,28 @@ class QudeInterpreter:
             except Exception:
                 pass
 
-    def _consume_event_block(self, lines: list[str], start_idx: int) -> Tuple[Optional[str], Optional[str], int]:
-        i = start_idx
+    def _block_end(self, lines: list[str], start: int, indent: int) -> int:
+        # End of the lines from start that are indented deeper than indent (blank lines included)
+        end = start
+        while end < len(lines) and (not lines[end].strip() or _indent(lines[end]) > indent):
+            end += 1
+        while end > start and not lines[end - 1].strip():
+            end -= 1
+        return end
+
+    def _consume_body(self, lines: list[str], header_idx: int) -> Tuple[List[str], int, int]:
+        # Body of a block header: the more indented lines after it, or else (1.1 style)
+        # just the next non-empty line. Returns (body, first body index, index after it).
+        start = header_idx + 1
+        end = self._block_end(lines, start, _indent(lines[header_idx]))
+        if end > start:
+            return lines[start:end], start, end
+        i = start
         while i < len(lines) and not lines[i].strip():
             i += 1
         if i >= len(lines):
-            return None, None, i
-        evt_line = lines[i]
-        i += 1
-        while i < len(lines) and not lines[i].strip():
-            i += 1
-        if i >= len(lines):
-            return evt_line, None, i
-        act_line = lines[i]
-        return evt_line, act_line, i + 1
+            return [], i, i
+        return [lines[i]], i, i + 1
 
     def _parse_two_ints(self, arg: str) -> Tuple[int, int]:
         parts = self._split_args(arg)
@@ -701,6 +1069,7 @@ class QudeInterpreter:
         return val in ('true', 'tr', '1', 'yes', 'y')
 
     def _eval_arg(self, s: str) -> Any:
+        self.metrics.evals += 1
         s = s.strip()
         # alias: taqe.data -> data
         if s.lower() == 'taqe.data':
@@ -717,24 +1086,31 @@ class QudeInterpreter:
             return s
 
     def _eval_expr(self, expr: str) -> Any:
+        self.metrics.evals += 1
         expr = expr.strip()
-        # alias: taqe.data -> data for expression resolution
-        expr = re.sub(r"\btaqe\.data\b", "data", expr, flags=re.IGNORECASE)
-        # Replace variable names with values for simple arithmetic
-        def repl_var(match: re.Match) -> str:
-            name = match.group(0)
-            if name in self.vars:
-                val = self.vars[name]
-                if isinstance(val, (int, float)):
-                    return str(val)
-                return repr(val)
-            return name
-
-        safe = re.sub(r"\b[a-zA-Z_]\w*\b", repl_var, expr)
-        try:
-            return eval(safe, {"__builtins__": {}}, {})
-        except Exception:
-            return self._eval_arg(expr)
+        # Compiled once per distinct expression; variables are passed in as names
+        entry = self._expr_cache.get(expr)
+        if entry is None:
+            self._expr_stats[1] += 1
+            # alias: taqe.data -> data for expression resolution
+            src = re.sub(r"\btaqe\.data\b", "data", expr, flags=re.IGNORECASE)
+            try:
+                code = compile(src, "<qude>", "eval")
+            except Exception:
+                code = None
+            entry = (src, code)
+            if len(self._expr_cache) < EXPR_CACHE_MAX:
+                self._expr_cache[expr] = entry
+        else:
+            self._expr_stats[0] += 1
+        src, code = entry
+        if code is not None:
+            names = {n: self.vars[n] for n in code.co_names if n in self.vars}
+            try:
+                return eval(code, {"__builtins__": {}}, names)
+            except Exception:
+                pass
+        return self._eval_arg(src)
 
     def _split_args(self, arg: str) -> list:
         parts = []
@@ -775,12 +1151,16 @@ class QudeInterpreter:
         m = re.match(r"^(if|elif)\s+(.+?)\s*:\s*then\s+(.+)$", line, re.IGNORECASE)
         if not m:
             return None, None
-        cond = m.group(2).strip()
-        action = m.group(3).strip()
+        cond_ok = self._eval_condition(m.group(2).strip())
+        if cond_ok is None:
+            return None, None
+        return cond_ok, m.group(3).strip()
+
+    def _eval_condition(self, cond: str) -> Optional[bool]:
         # Only support equality with '=' in spec
         m2 = re.match(r"^(.+?)\s*=\s*(.+)$", cond)
         if not m2:
-            return None, None
+            return None
         left = self._eval_expr(m2.group(1))
         right = self._eval_expr(m2.group(2))
-        return bool(left == right), action
+        return bool(left == right)
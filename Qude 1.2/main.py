@@ -1,17 +1,43 @@
 import os
 import sys
+import time
+import multiprocessing
+
+# Taken before the IDE modules are imported, for --profile-startup
+_T0 = time.perf_counter()
+
 try:
     from .ide import QudeIDE
+    from .publish import main as publish_batch_main
+    from .qude_lang.batch import main as run_batch_main
+    from .script_process import main as run_child_main
 except ImportError:
-    # Allow running directly: python qude/main.py
-    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+    # Allow running directly: python "Qude 1.2/main.py"; qude.* then means this directory
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import _bootstrap  # noqa: F401
     from qude.ide import QudeIDE
+    from qude.publish import main as publish_batch_main
+    from qude.qude_lang.batch import main as run_batch_main
+    from qude.script_process import main as run_child_main
 
 
 def main():
-    app = QudeIDE()
+    # Subcommands: publish-batch <dir|manifest> -o OUT [-j N]; batch <scripts...> [-j N];
+    # run <script> (child process used by the IDE); no argument opens the IDE,
+    # --profile-startup prints how long each startup phase took
+    args = sys.argv[1:]
+    if args and args[0] == "publish-batch":
+        return publish_batch_main(args[1:])
+    if args and args[0] == "batch":
+        return run_batch_main(args[1:])
+    if args and args[0] == "run":
+        return run_child_main(args[1:])
+    profile = "--profile-startup" in args
+    app = QudeIDE(t0=_T0, profile_startup=profile)
     app.run()
 
 
 if __name__ == "__main__":
-    main()
+    # Needed for process pools inside a frozen (PyInstaller) IDE
+    multiprocessing.freeze_support()
+    raise SystemExit(main())
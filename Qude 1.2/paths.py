@@ -0,0 +1,17 @@
+import os
+import sys
+
+
+# Per-user locations for logs and caches (created on first use)
+def user_cache_dir(*parts: str) -> str:
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+        root = os.path.join(base, "Qude", "Cache")
+    elif sys.platform == "darwin":
+        root = os.path.join(os.path.expanduser("~"), "Library", "Caches", "Qude")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        root = os.path.join(base, "qude")
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
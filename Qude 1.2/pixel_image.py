@@ -0,0 +1,25 @@
+import tkinter as tk
+from typing import Any
+
+
+# Pixel buffer for generated images (default icon, thumbnails). Pixels are set in
+# Python and the whole image is uploaded with a single PhotoImage.put of row data,
+# instead of one Tcl call per pixel.
+class PixelImage:
+    def __init__(self, width: int, height: int, fill: str = "#000000") -> None:
+        self.width = width
+        self.height = height
+        self.rows = [[fill] * width for _ in range(height)]
+
+    def set(self, x: int, y: int, color: str) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.rows[y][x] = color
+
+    def data(self) -> str:
+        # Tk photo data: a list of rows, each a list of colors
+        return " ".join("{" + " ".join(row) + "}" for row in self.rows)
+
+    def to_photo(self, master: Any = None) -> tk.PhotoImage:
+        img = tk.PhotoImage(master=master, width=self.width, height=self.height)
+        img.put(self.data(), to=(0, 0))
+        return img
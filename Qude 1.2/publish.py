@@ -0,0 +1,783 @@
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import multiprocessing
+import os
+import queue
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+try:
+    from .paths import user_cache_dir
+    from .icon_cache import cached_ico
+    from .qude_runner import pack_payload, sidecar_path
+except ImportError:
+    # Run as a script: qude.* means the modules next to this file, not the root qude/
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import _bootstrap  # noqa: F401
+    from qude.paths import user_cache_dir
+    from qude.icon_cache import cached_ico
+    from qude.qude_runner import pack_payload, sidecar_path
+
+# Build pipeline for "Yayınla (.exe)": runs in a background thread and streams its
+# output through a queue that the IDE drains on the Tk thread. By default a cached
+# runner executable is reused and the script is attached to a copy of it; the
+# full PyInstaller build per script is kept as an alternative mode. Build outputs
+# are cached per user, keyed by a hash of everything that goes into them.
+
+ENGINE_VERSION = "1.2"
+# Name of the cached runner executable that published scripts are attached to
+STUB_APP_NAME = "QudeRunner"
+# Number of full-build artifacts kept in the content-addressed build cache
+BUILD_CACHE_KEEP = 20
+# How often (seconds) batch publishing checks for a cancel while workers run
+CANCEL_POLL_SECONDS = 0.2
+
+# PyInstaller log milestones -> (progress fraction, label)
+BUILD_STAGES: List[Tuple[str, float, str]] = [
+    ("Initializing module dependency graph", 0.10, "Bağımlılıklar hazırlanıyor"),
+    ("Analyzing", 0.20, "Analiz ediliyor"),
+    ("Looking for dynamic libraries", 0.50, "Kütüphaneler toplanıyor"),
+    ("Building PYZ", 0.65, "PYZ oluşturuluyor"),
+    ("Building PKG", 0.80, "Paket oluşturuluyor"),
+    ("Building EXE", 0.90, "EXE oluşturuluyor"),
+    ("Build complete", 1.00, "Tamamlandı"),
+]
+
+_toolchain_lock = threading.Lock()
+_toolchain_checked = False
+_toolchain_module: Optional[str] = None
+
+
+def detect_pyinstaller() -> Optional[str]:
+    # Probing spawns a Python process, so the answer is cached for the session
+    global _toolchain_checked, _toolchain_module
+    with _toolchain_lock:
+        if _toolchain_checked:
+            return _toolchain_module
+        for mod in ("PyInstaller", "pyinstaller"):
+            try:
+                subprocess.run(
+                    [sys.executable, "-m", mod, "--version"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    creationflags=_no_window_flags(),
+                )
+                _toolchain_module = mod
+                break
+            except Exception:
+                continue
+        _toolchain_checked = True
+        return _toolchain_module
+
+
+def _no_window_flags() -> int:
+    # Keep child consoles hidden when the IDE itself is a windowed exe
+    return getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+
+def exe_name(app_name: str) -> str:
+    return app_name + (".exe" if os.name == "nt" else "")
+
+
+def find_default_icon(package_dir: str) -> Optional[str]:
+    for d in [package_dir, os.path.dirname(package_dir)]:
+        p = os.path.join(d, "q.ico")
+        if os.path.exists(p):
+            return p
+    return None
+
+
+def runner_source(code: str) -> str:
+    return (
+        "import tkinter as tk\n"
+        "from qude.interpreter import QudeInterpreter\n"
+        "\n"
+        "CODE = " + repr(code) + "\n"
+        "\n"
+        "def main():\n"
+        "    root = tk.Tk()\n"
+        "    try:\n"
+        "        root.withdraw()\n"
+        "    except Exception:\n"
+        "        pass\n"
+        "    def cw(msg: str):\n"
+        "        print(msg)\n"
+        "    interp = QudeInterpreter(cw, root)\n"
+        "    interp.preview_mode = False\n"
+        "    interp.preview_root = None\n"
+        "    interp.window = None\n"
+        "    interp.run(CODE)\n"
+        "    root.mainloop()\n"
+        "\n"
+        "if __name__ == '__main__':\n"
+        "    main()\n"
+    )
+
+
+def version_file_text(app_name: str) -> str:
+    # Windows version resource embedding version and description
+    return (
+        "VSVersionInfo(\n"
+        "  ffi=FixedFileInfo(\n"
+        "    filevers=(1, 2, 0, 0),\n"
+        "    prodvers=(1, 2, 0, 0),\n"
+        "    mask=0x3f,\n"
+        "    flags=0x0,\n"
+        "    OS=0x40004,\n"
+        "    fileType=0x1,\n"
+        "    subtype=0x0,\n"
+        "    date=(0, 0)\n"
+        "  ),\n"
+        "  kids=[\n"
+        "    StringFileInfo([\n"
+        "      StringTable('040904B0', [\n"
+        "        StringStruct('CompanyName', 'Qude'),\n"
+        "        StringStruct('FileDescription', 'Qude 1.2'),\n"
+        "        StringStruct('FileVersion', '1.2.0.0'),\n"
+        "        StringStruct('InternalName', '" + app_name + "'),\n"
+        "        StringStruct('OriginalFilename', '" + app_name + ".exe'),\n"
+        "        StringStruct('ProductName', 'Qude 1.2'),\n"
+        "        StringStruct('ProductVersion', '1.2.0.0')\n"
+        "      ])\n"
+        "    ]),\n"
+        "    VarFileInfo([VarStruct('Translation', [1033, 1200])])\n"
+        "  ]\n"
+        ")\n"
+    )
+
+
+STUB_ENTRY_SOURCE = (
+    "from qude.qude_runner import main\n"
+    "\n"
+    "if __name__ == '__main__':\n"
+    "    raise SystemExit(main())\n"
+)
+
+
+def _hash_build_inputs(h: Any, package_dir: str, icon_path: Optional[str]) -> None:
+    # Inputs shared by every build: engine sources, icon, Python version
+    h.update(f"{ENGINE_VERSION}|{sys.version}|{sys.platform}".encode("utf-8"))
+    for rel in sorted(_package_sources(package_dir)):
+        h.update(rel.replace(os.sep, "/").encode("utf-8"))
+        with open(os.path.join(package_dir, rel), "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    if icon_path and os.path.exists(icon_path):
+        with open(icon_path, "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+
+
+def stub_cache_key(package_dir: str, icon_path: Optional[str]) -> str:
+    h = hashlib.sha256(b"stub")
+    _hash_build_inputs(h, package_dir, icon_path)
+    return h.hexdigest()
+
+
+def build_cache_key(code: str, package_dir: str, icon_path: Optional[str], version_text: str) -> str:
+    h = hashlib.sha256(b"full")
+    _hash_build_inputs(h, package_dir, icon_path)
+    h.update(hashlib.sha256(code.encode("utf-8")).digest())
+    h.update(hashlib.sha256(version_text.encode("utf-8")).digest())
+    return h.hexdigest()
+
+
+def _package_sources(package_dir: str) -> List[str]:
+    found: List[str] = []
+    for dirpath, dirnames, filenames in os.walk(package_dir):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        for name in filenames:
+            if name.endswith(".py"):
+                found.append(os.path.relpath(os.path.join(dirpath, name), package_dir))
+    return found
+
+
+def cached_stub_path(key: str) -> str:
+    return os.path.join(user_cache_dir("stubs", key), exe_name(STUB_APP_NAME))
+
+
+def cached_build_path(key: str, app_name: str) -> str:
+    return os.path.join(user_cache_dir("builds", key), exe_name(app_name))
+
+
+def work_dir_for(app_name: str) -> str:
+    # Persistent PyInstaller work dir per app so unchanged analysis steps are reused
+    return user_cache_dir("work", re.sub(r"[^\w.-]+", "_", app_name) or "app")
+
+
+def prune_build_cache(keep: int = BUILD_CACHE_KEEP) -> None:
+    # Least recently used entries go first; cache hits touch their entry's mtime
+    root = user_cache_dir("builds")
+    try:
+        entries = [os.path.join(root, d) for d in os.listdir(root)]
+    except OSError:
+        return
+    entries = [d for d in entries if os.path.isdir(d)]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    for old in entries[keep:]:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def write_if_changed(path: str, text: str) -> None:
+    # Leave mtimes alone for unchanged inputs so PyInstaller can skip work
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return
+    except OSError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def sync_tree(src: str, dst: str) -> None:
+    # Mirror the package into the work dir, copying only files that changed and
+    # removing ones that no longer exist in the package
+    for dirpath, dirnames, filenames in os.walk(src):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        target_dir = os.path.join(dst, os.path.relpath(dirpath, src))
+        os.makedirs(target_dir, exist_ok=True)
+        keep = set(dirnames).union(filenames)
+        for name in os.listdir(target_dir):
+            if name in keep or name == "__pycache__" or name.endswith(".pyc"):
+                continue
+            stale = os.path.join(target_dir, name)
+            if os.path.isdir(stale) and not os.path.islink(stale):
+                shutil.rmtree(stale, ignore_errors=True)
+            else:
+                os.remove(stale)
+        for name in filenames:
+            if name.endswith(".pyc"):
+                continue
+            s_path = os.path.join(dirpath, name)
+            d_path = os.path.join(target_dir, name)
+            try:
+                st_s = os.stat(s_path)
+                st_d = os.stat(d_path)
+                if st_s.st_size == st_d.st_size and int(st_s.st_mtime) == int(st_d.st_mtime):
+                    continue
+            except OSError:
+                pass
+            shutil.copy2(s_path, d_path)
+
+
+def copy_atomic(src: str, dest: str) -> None:
+    dest_dir = os.path.dirname(os.path.abspath(dest))
+    os.makedirs(dest_dir, exist_ok=True)
+    tmp = dest + ".tmp"
+    shutil.copy2(src, tmp)
+    os.replace(tmp, dest)
+
+
+def attach_payload(stub_path: str, save_path: str, code: str, sidecar: bool = False) -> None:
+    # Publishing a script = copy the runner and attach the packed program
+    payload = pack_payload(code)
+    dest_dir = os.path.dirname(os.path.abspath(save_path))
+    os.makedirs(dest_dir, exist_ok=True)
+    tmp = save_path + ".tmp"
+    shutil.copy2(stub_path, tmp)
+    if sidecar:
+        with open(sidecar_path(save_path), "wb") as f:
+            f.write(payload)
+    else:
+        with open(tmp, "ab") as f:
+            f.write(payload)
+        # A sidecar left by an earlier publish would win over the appended payload
+        try:
+            os.remove(sidecar_path(save_path))
+        except FileNotFoundError:
+            pass
+    os.replace(tmp, save_path)
+
+
+class PublishCancelled(Exception):
+    pass
+
+
+class BackgroundJob(ABC):
+    # Events put on self.events:
+    #   ("line", text)               one line of build output
+    #   ("progress", fraction, label)
+    #   ("done", ok, message)        always the last event
+    thread_name = "qude-publish"
+    cancelled_message = "Yayınlama iptal edildi."
+
+    def __init__(self) -> None:
+        self.events: "queue.Queue[Tuple[Any, ...]]" = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._progress = 0.0
+
+    # ---- control (any thread) ----
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+        self._thread.start()
+
+    def run(self) -> Tuple[bool, str]:
+        # Synchronous variant (CLI, batch workers); output stays on self.events
+        self._run()
+        done: Tuple[bool, str] = (False, "")
+        remaining: List[Tuple[Any, ...]] = []
+        for event in self.drain(limit=sys.maxsize):
+            if event[0] == "done":
+                done = (bool(event[1]), str(event[2]))
+            else:
+                remaining.append(event)
+        for event in remaining:
+            self.events.put(event)
+        return done
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def drain(self, limit: int = 1000) -> List[Tuple[Any, ...]]:
+        items: List[Tuple[Any, ...]] = []
+        while len(items) < limit:
+            try:
+                items.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    # ---- worker thread ----
+    def _emit(self, *event: Any) -> None:
+        self.events.put(event)
+
+    def _progress_to(self, fraction: float, label: str) -> None:
+        if fraction > self._progress:
+            self._progress = fraction
+            self._emit("progress", fraction, label)
+
+    def _check_cancel(self) -> None:
+        if self._cancel.is_set():
+            raise PublishCancelled()
+
+    def _run(self) -> None:
+        try:
+            message = self._build()
+            self._emit("done", True, message)
+        except PublishCancelled:
+            self._emit("done", False, self.cancelled_message)
+        except Exception as e:
+            self._emit("done", False, str(e))
+
+    @abstractmethod
+    def _build(self) -> str:
+        # Does the work on the worker thread; returns the success message
+        ...
+
+
+class PublishJob(BackgroundJob):
+    def __init__(
+        self,
+        code: str,
+        save_path: str,
+        icon_path: Optional[str] = None,
+        package_dir: Optional[str] = None,
+        mode: str = "stub",
+        sidecar: bool = False,
+    ) -> None:
+        super().__init__()
+        self.code = code
+        self.mode = mode
+        self.sidecar = sidecar
+        self.save_path = save_path
+        self.app_name = os.path.splitext(os.path.basename(save_path))[0]
+        self.package_dir = package_dir or os.path.dirname(os.path.abspath(__file__))
+        self.icon_path = icon_path
+        self._proc: Optional[subprocess.Popen] = None
+
+    def cancel(self) -> None:
+        super().cancel()
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+
+    def _build(self) -> str:
+        if self.mode == "stub":
+            return self._build_from_stub()
+        return self._build_full()
+
+    def _resolve_icon(self) -> Optional[str]:
+        # A PNG icon goes through the shared icon cache, so it is converted at most once
+        if self.icon_path and os.path.exists(self.icon_path):
+            return cached_ico(self.icon_path) or self.icon_path
+        return find_default_icon(self.package_dir)
+
+    def _build_full(self) -> str:
+        # The script is embedded into a dedicated PyInstaller build, cached by content
+        icon = self._resolve_icon()
+        version_text = version_file_text(self.app_name)
+        key = build_cache_key(self.code, self.package_dir, icon, version_text)
+        cached = cached_build_path(key, self.app_name)
+        if os.path.exists(cached):
+            self._emit("line", f"Önbellekteki derleme kullanılıyor ({key[:12]})")
+            # prune_build_cache evicts by mtime, so a hit counts as recent use
+            try:
+                os.utime(os.path.dirname(cached))
+            except OSError:
+                pass
+        else:
+            self._run_pyinstaller(
+                self.app_name,
+                runner_source(self.code),
+                version_text,
+                icon,
+                cached,
+                work_dir_for(self.app_name),
+            )
+            prune_build_cache()
+        self._check_cancel()
+        try:
+            copy_atomic(cached, self.save_path)
+        except Exception as e:
+            raise RuntimeError(f"EXE taşınamadı: {e}")
+        self._progress_to(1.0, "Tamamlandı")
+        return self.save_path
+
+    def _build_from_stub(self) -> str:
+        # The runner exe only changes with the engine; the script is attached as a payload
+        stub = self.ensure_stub()
+        self._check_cancel()
+        self._progress_to(0.95, "Betik ekleniyor")
+        try:
+            attach_payload(stub, self.save_path, self.code, sidecar=self.sidecar)
+        except Exception as e:
+            raise RuntimeError(f"EXE oluşturulamadı: {e}")
+        self._progress_to(1.0, "Tamamlandı")
+        return self.save_path
+
+    def ensure_stub(self) -> str:
+        icon = self._resolve_icon()
+        key = stub_cache_key(self.package_dir, icon)
+        stub = cached_stub_path(key)
+        if os.path.exists(stub):
+            self._emit("line", f"Önbellekteki çalıştırıcı kullanılıyor ({key[:12]})")
+        else:
+            self._emit("line", "[Warn] Çalıştırıcı derleniyor (yalnızca motor değiştiğinde gerekir)...")
+            self._run_pyinstaller(
+                STUB_APP_NAME,
+                STUB_ENTRY_SOURCE,
+                version_file_text(STUB_APP_NAME),
+                icon,
+                stub,
+                work_dir_for(STUB_APP_NAME),
+            )
+        return stub
+
+    def _run_pyinstaller(
+        self,
+        app_name: str,
+        entry_source: str,
+        version_text: str,
+        icon: Optional[str],
+        dest: str,
+        workdir: str,
+    ) -> None:
+        self._progress_to(0.02, "PyInstaller aranıyor")
+        pyinst_module = detect_pyinstaller()
+        if not pyinst_module:
+            raise RuntimeError("PyInstaller bulunamadı. Lütfen 'pip install pyinstaller' ile kurun.")
+        self._check_cancel()
+
+        # Stable paths inside the work dir let PyInstaller reuse its spec and analysis
+        src_dir = os.path.join(workdir, "src")
+        os.makedirs(src_dir, exist_ok=True)
+        runner_path = os.path.join(src_dir, "pack_runner.py")
+        write_if_changed(runner_path, entry_source)
+
+        # Ensure local 'qude' package is available to the build next to the runner
+        try:
+            sync_tree(self.package_dir, os.path.join(src_dir, "qude"))
+        except Exception as e:
+            self._emit("line", f"[Warn] Paket kopyalanamadı: {e}")
+
+        version_path: Optional[str] = os.path.join(workdir, "version_info.txt")
+        try:
+            write_if_changed(version_path, version_text)
+        except Exception:
+            version_path = None
+
+        dist_dir = os.path.join(workdir, "dist")
+        args = [
+            sys.executable, "-m", pyinst_module,
+            "--noconfirm", "--onefile", "--windowed",
+            "--name", app_name,
+            "--paths", src_dir,
+            "--workpath", os.path.join(workdir, "build"),
+            "--specpath", workdir,
+            "--distpath", dist_dir,
+        ]
+        if version_path and os.path.exists(version_path):
+            args.extend(["--version-file", version_path])
+        if icon:
+            args.extend(["--icon", icon])
+        args.append(runner_path)
+
+        self._check_cancel()
+        self._progress_to(0.05, "PyInstaller başlatıldı")
+        returncode = self._stream(args, workdir)
+        self._check_cancel()
+        if returncode != 0:
+            raise RuntimeError(f"PyInstaller başarısız oldu (çıkış kodu {returncode}). Konsolu kontrol edin.")
+
+        built_exe = os.path.join(dist_dir, exe_name(app_name))
+        if not os.path.exists(built_exe):
+            raise RuntimeError("Oluşturulan EXE bulunamadı.")
+        try:
+            copy_atomic(built_exe, dest)
+        except Exception as e:
+            raise RuntimeError(f"EXE önbelleğe alınamadı: {e}")
+
+    def _stream(self, args: List[str], cwd: str) -> int:
+        # PyInstaller logs on stderr; merge both streams and relay line by line
+        self._proc = subprocess.Popen(
+            args,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            creationflags=_no_window_flags(),
+        )
+        if self._cancel.is_set():
+            self.cancel()
+        assert self._proc.stdout is not None
+        for ln in self._proc.stdout:
+            ln = ln.rstrip()
+            if not ln:
+                continue
+            self._emit("line", ln)
+            for marker, fraction, label in BUILD_STAGES:
+                if marker in ln:
+                    self._progress_to(fraction, label)
+                    break
+        return self._proc.wait()
+
+
+# ---------- Batch publishing ----------
+def collect_scripts(source: str) -> List[str]:
+    # A directory (every *.q inside, recursively) or a manifest listing script paths
+    if os.path.isdir(source):
+        found: List[str] = []
+        for dirpath, dirnames, filenames in os.walk(source):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.lower().endswith(".q"):
+                    found.append(os.path.join(dirpath, name))
+        return found
+    base = os.path.dirname(os.path.abspath(source))
+    with open(source, "r", encoding="utf-8") as f:
+        if source.lower().endswith(".json"):
+            entries = [str(e) for e in json.load(f)]
+        else:
+            entries = [ln.strip() for ln in f if ln.strip() and not ln.strip().startswith("#")]
+    return [e if os.path.isabs(e) else os.path.join(base, e) for e in entries]
+
+
+# Set in batch worker processes; the parent sets it to cancel their builds
+_worker_cancel: Optional[Any] = None
+
+
+def _init_worker(cancel_event: Any) -> None:
+    global _worker_cancel
+    _worker_cancel = cancel_event
+
+
+def _watch_cancel(job: "PublishJob", finished: threading.Event) -> None:
+    # Terminates the job's PyInstaller process once the batch is cancelled
+    while not finished.wait(CANCEL_POLL_SECONDS):
+        if job.cancelled:
+            job.cancel()
+            return
+
+
+def _publish_worker(
+    script: str,
+    save_path: str,
+    mode: str,
+    sidecar: bool,
+    icon_path: Optional[str],
+    package_dir: str,
+) -> Dict[str, Any]:
+    # Runs in a pool process; returns a picklable status record
+    started = time.perf_counter()
+    try:
+        with open(script, "r", encoding="utf-8") as f:
+            code = f.read()
+        job = PublishJob(code, save_path, icon_path=icon_path, package_dir=package_dir, mode=mode, sidecar=sidecar)
+        finished = threading.Event()
+        if _worker_cancel is not None:
+            job._cancel = _worker_cancel
+            threading.Thread(target=_watch_cancel, args=(job, finished), daemon=True).start()
+        try:
+            ok, message = job.run()
+        finally:
+            finished.set()
+        log = [event[1] for event in job.drain(limit=sys.maxsize) if event[0] == "line"]
+    except Exception as e:
+        ok, message, log = False, str(e), []
+    return {
+        "script": script,
+        "output": save_path,
+        "ok": ok,
+        "message": message,
+        "seconds": time.perf_counter() - started,
+        "log": log[-20:],
+    }
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    status = "OK  " if result["ok"] else "HATA"
+    line = f"{status} {result['seconds']:7.2f}s  {result['script']}"
+    if result["ok"]:
+        return f"{line} -> {result['output']}"
+    return f"[Error] {line}: {result['message']}"
+
+
+class BatchPublishJob(BackgroundJob):
+    # Extra event: ("result", record) for every finished script
+    def __init__(
+        self,
+        scripts: List[str],
+        out_dir: str,
+        workers: Optional[int] = None,
+        mode: str = "stub",
+        sidecar: bool = False,
+        icon_path: Optional[str] = None,
+        package_dir: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        self.scripts = scripts
+        self.out_dir = out_dir
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.mode = mode
+        self.sidecar = sidecar
+        self.icon_path = icon_path
+        self.package_dir = package_dir or os.path.dirname(os.path.abspath(__file__))
+        self.results: List[Dict[str, Any]] = []
+        self._prep: Optional[PublishJob] = None
+        # Shared with the pool processes, so cancelling also stops their builds
+        self._worker_cancel = multiprocessing.Event()
+
+    def cancel(self) -> None:
+        super().cancel()
+        self._worker_cancel.set()
+        if self._prep is not None:
+            self._prep.cancel()
+
+    def _build(self) -> str:
+        started = time.perf_counter()
+        targets: Dict[str, str] = {}
+        for script in self.scripts:
+            name = os.path.splitext(os.path.basename(script))[0]
+            if name in targets:
+                raise RuntimeError(f"Aynı adlı iki betik: {targets[name]} ve {script}")
+            targets[name] = script
+        if not targets:
+            raise RuntimeError("Yayınlanacak .q dosyası bulunamadı.")
+
+        if self.mode == "stub":
+            # Build (or reuse) the shared runner once before fanning out
+            prep = PublishJob("", os.devnull, icon_path=self.icon_path, package_dir=self.package_dir)
+            prep.events = self.events
+            prep._cancel = self._cancel
+            self._prep = prep
+            prep.ensure_stub()
+            self._check_cancel()
+
+        total = len(targets)
+        self._emit("line", f"[Warn] Toplu yayınlama: {total} betik, {self.workers} işçi")
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self._worker_cancel,),
+        )
+        try:
+            pending = {
+                pool.submit(
+                    _publish_worker,
+                    script,
+                    os.path.join(self.out_dir, exe_name(name)),
+                    self.mode,
+                    self.sidecar,
+                    self.icon_path,
+                    self.package_dir,
+                )
+                for name, script in targets.items()
+            }
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, timeout=CANCEL_POLL_SECONDS, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for fut in done:
+                    result = fut.result()
+                    self.results.append(result)
+                    self._emit("result", result)
+                    self._emit("line", format_result(result))
+                    self._progress_to(len(self.results) / total, f"{len(self.results)}/{total} betik")
+                self._check_cancel()
+        finally:
+            # On cancel, queued scripts are dropped and running ones stop on their own
+            pool.shutdown(wait=not self.cancelled, cancel_futures=True)
+
+        failed = sum(1 for r in self.results if not r["ok"])
+        summary = (
+            f"Toplam: {total} betik, {total - failed} başarılı, {failed} hatalı, "
+            f"{time.perf_counter() - started:.1f}s ({self.workers} işçi)"
+        )
+        if failed:
+            raise RuntimeError(summary)
+        return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="qude publish-batch", description="Publish many .q scripts in parallel")
+    parser.add_argument("source", help="directory of .q files or a manifest (.txt / .json)")
+    parser.add_argument("-o", "--out", required=True, help="output directory for executables")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--full", action="store_true", help="full PyInstaller build per script instead of the runner stub")
+    parser.add_argument("--sidecar", action="store_true", help="write the script next to the exe (.qpak) instead of appending it")
+    parser.add_argument("--icon", default=None, help="ICO file for the executables")
+    args = parser.parse_args(argv)
+
+    job = BatchPublishJob(
+        collect_scripts(args.source),
+        args.out,
+        workers=args.workers,
+        mode="full" if args.full else "stub",
+        sidecar=args.sidecar,
+        icon_path=args.icon,
+    )
+    job.start()
+    while True:
+        try:
+            kind, *payload = job.events.get()
+        except KeyboardInterrupt:
+            job.cancel()
+            continue
+        if kind == "line":
+            print(payload[0], flush=True)
+        elif kind == "done":
+            print(payload[1])
+            return 0 if payload[0] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
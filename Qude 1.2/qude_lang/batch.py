@@ -0,0 +1,170 @@
+from __future__ import annotations
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Optional
+
+# Runs many .q scripts against the headless backend. Every script gets its own
+# worker process (qude.qude_lang.run_qude --headless) so a hung script
+# can be killed at its timeout without taking the rest of the batch down.
+
+DEFAULT_TIMEOUT = 10.0
+ERROR_MARK = "[Error]"
+
+
+@dataclass
+class ScriptResult:
+    script: str
+    status: str  # passed | failed | timeout
+    returncode: Optional[int]
+    seconds: float
+    output: str
+
+
+def collect_scripts(paths: List[str], pattern: str = ".q") -> List[str]:
+    found: List[str] = []
+    for p in paths:
+        if os.path.isdir(p):
+            for dirpath, dirnames, filenames in os.walk(p):
+                dirnames.sort()
+                for name in sorted(filenames):
+                    if name.endswith(pattern):
+                        found.append(os.path.join(dirpath, name))
+        else:
+            found.append(p)
+    return found
+
+
+def _runner_env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONIOENCODING"] = "utf-8"
+    return env
+
+
+def runner_command(script: str, engine: str = "ast", duration: float = 0) -> List[str]:
+    # Through _bootstrap, so workers run this package whatever qude/ is on sys.path
+    pkg_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return [sys.executable, os.path.join(pkg_dir, "_bootstrap.py"), "qude.qude_lang.run_qude",
+            "--headless", "--engine", engine, "--duration", str(duration), script]
+
+
+def run_one(script: str, timeout: float = DEFAULT_TIMEOUT, engine: str = "ast",
+            duration: float = 0, env: Optional[dict] = None) -> ScriptResult:
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            runner_command(script, engine, duration),
+            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            env=env if env is not None else _runner_env(),
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        out = (e.stdout or b"").decode("utf-8", errors="replace")
+        return ScriptResult(script, "timeout", None, time.perf_counter() - start, out)
+    out = proc.stdout.decode("utf-8", errors="replace")
+    failed = proc.returncode != 0 or any(line.startswith(ERROR_MARK) for line in out.splitlines())
+    return ScriptResult(script, "failed" if failed else "passed", proc.returncode,
+                        time.perf_counter() - start, out)
+
+
+def run_batch(scripts: List[str], workers: Optional[int] = None, timeout: float = DEFAULT_TIMEOUT,
+              engine: str = "ast", duration: float = 0,
+              on_result: Optional[Callable[[ScriptResult], None]] = None) -> List[ScriptResult]:
+    # Threads only wait on child processes, so a thread pool is enough here
+    workers = max(1, workers or os.cpu_count() or 1)
+    env = _runner_env()
+    results: List[ScriptResult] = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_one, s, timeout, engine, duration, env) for s in scripts]
+        for fut in as_completed(futures):
+            res = fut.result()
+            results.append(res)
+            if on_result is not None:
+                on_result(res)
+    order = {s: i for i, s in enumerate(scripts)}
+    results.sort(key=lambda r: order.get(r.script, 0))
+    return results
+
+
+def summarize(results: List[ScriptResult]) -> dict:
+    counts = {"passed": 0, "failed": 0, "timeout": 0}
+    for r in results:
+        counts[r.status] = counts.get(r.status, 0) + 1
+    return {
+        "total": len(results),
+        **counts,
+        "seconds": round(sum(r.seconds for r in results), 3),
+    }
+
+
+def write_json(path: str, results: List[ScriptResult]) -> None:
+    data = {"summary": summarize(results), "results": [asdict(r) for r in results]}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def write_junit(path: str, results: List[ScriptResult]) -> None:
+    summary = summarize(results)
+    suite = ET.Element("testsuite", {
+        "name": "qude",
+        "tests": str(summary["total"]),
+        "failures": str(summary["failed"]),
+        "errors": str(summary["timeout"]),
+        "time": f"{summary['seconds']:.3f}",
+    })
+    for r in results:
+        case = ET.SubElement(suite, "testcase", {
+            "classname": os.path.dirname(r.script) or ".",
+            "name": os.path.basename(r.script),
+            "time": f"{r.seconds:.3f}",
+        })
+        if r.status == "failed":
+            msg = next((l for l in r.output.splitlines() if l.startswith(ERROR_MARK)), f"exit code {r.returncode}")
+            ET.SubElement(case, "failure", {"message": msg}).text = r.output
+        elif r.status == "timeout":
+            ET.SubElement(case, "error", {"message": "timeout"}).text = r.output
+        ET.SubElement(case, "system-out").text = r.output
+    ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="qude batch", description="Run Qude scripts headless in parallel")
+    ap.add_argument("paths", nargs="+", help=".q files or directories to search")
+    ap.add_argument("-j", "--workers", type=int, default=None, help="parallel worker processes (default: CPU count)")
+    ap.add_argument("-t", "--timeout", type=float, default=DEFAULT_TIMEOUT, help="per-script timeout in seconds")
+    ap.add_argument("--engine", choices=("ast", "legacy"), default="ast")
+    ap.add_argument("--duration", type=float, default=0, metavar="MS",
+                    help="virtual time to run timers for after each script")
+    ap.add_argument("--json", metavar="FILE", help="write a JSON summary")
+    ap.add_argument("--junit", metavar="FILE", help="write a JUnit XML summary")
+    ap.add_argument("-q", "--quiet", action="store_true", help="only print failures and the summary")
+    args = ap.parse_args(argv)
+
+    scripts = collect_scripts(args.paths)
+    if not scripts:
+        print("No scripts found")
+        return 1
+
+    def report(r: ScriptResult) -> None:
+        if args.quiet and r.status == "passed":
+            return
+        print(f"{r.status.upper():8} {r.script} ({r.seconds:.2f}s)", flush=True)
+
+    results = run_batch(scripts, args.workers, args.timeout, args.engine, args.duration, report)
+    if args.json:
+        write_json(args.json, results)
+    if args.junit:
+        write_junit(args.junit, results)
+    s = summarize(results)
+    print(f"{s['total']} scripts: {s['passed']} passed, {s['failed']} failed, {s['timeout']} timed out")
+    return 0 if s["passed"] == s["total"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,212 @@
+from __future__ import annotations
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+# Per-widget event multiplexer shared by both engines. The first handler for a
+# (widget, sequence) pair installs a single Tk binding; later handlers are only
+# appended to a Python list, so a click crosses the Tcl/Python boundary once no
+# matter how many `event;` blocks target the widget.
+#
+# MatchEvent handlers hang off one StringVar trace per Entry and are looked up by
+# the current text, so an edit costs one dict lookup however many are registered.
+# Typing, paste and programmatic changes all go through the trace.
+#
+# Tk callbacks never run handlers directly: they enqueue them on an EventQueue,
+# which drains from an after(0) callback under a per-frame time budget so bursts
+# (key repeat, rapid clicks, cascading handlers) cannot starve redraws. A handler
+# that is already waiting is not queued a second time.
+
+Handler = Callable[[], None]
+
+# Delay (ms) between the last edit and the MatchEvent lookup; 0 checks every edit
+MATCH_DEBOUNCE_MS = 0
+# Time (ms) spent running queued handlers before yielding to Tk; 0 drains everything
+FRAME_BUDGET_MS = 8.0
+
+
+class EventQueue:
+    def __init__(self, root: Any, metrics: Any = None) -> None:
+        self.root = root
+        self.metrics = metrics
+        self.frame_budget_ms: float = FRAME_BUDGET_MS
+        self._pending: Deque[Tuple[Handler, float]] = deque()
+        self._queued: Set[Handler] = set()
+        self._job: Optional[str] = None
+
+    def push(self, handler: Handler) -> None:
+        metrics = self.metrics
+        if handler in self._queued:
+            if metrics is not None:
+                metrics.events_coalesced += 1
+            return
+        self._queued.add(handler)
+        self._pending.append((handler, time.perf_counter()))
+        if metrics is not None:
+            metrics.events_queued += 1
+            if len(self._pending) > metrics.queue_peak:
+                metrics.queue_peak = len(self._pending)
+        if self._job is None:
+            self._job = self.root.after(0, self._drain)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _drain(self, budget_ms: Optional[float] = None) -> None:
+        self._job = None
+        if budget_ms is None:
+            budget_ms = self.frame_budget_ms
+        deadline = time.perf_counter() + budget_ms / 1000.0 if budget_ms > 0 else None
+        pending = self._pending
+        metrics = self.metrics
+        try:
+            while pending:
+                handler, queued_at = pending.popleft()
+                # Dequeued before it runs, so the handler can be queued again meanwhile
+                self._queued.discard(handler)
+                now = time.perf_counter()
+                if metrics is not None:
+                    metrics.queue_latency.observe(now - queued_at)
+                handler()
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+        finally:
+            if pending and self._job is None:
+                self._job = self.root.after(0, self._drain)
+
+    def flush(self) -> None:
+        # Runs everything queued now, including handlers queued by those handlers
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        while self._pending:
+            self._drain(0)
+            if self._job is not None:
+                self.root.after_cancel(self._job)
+                self._job = None
+
+    def clear(self) -> None:
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+        self._pending.clear()
+        self._queued.clear()
+
+
+class _MatchWatch:
+    def __init__(self, router: "EventRouter", widget: Any) -> None:
+        self.router = router
+        self.widget = widget
+        self.table: Dict[str, List[Handler]] = {}
+        self.pending: Optional[str] = None
+        # Keep the current text; attaching a textvariable would otherwise reset it
+        self.var = router.tk.StringVar(widget, value=widget.get())
+        widget.configure(textvariable=self.var)
+        self.trace = self.var.trace_add('write', self._changed)
+
+    def _changed(self, *_args: Any) -> None:
+        delay = self.router.match_debounce_ms
+        if delay <= 0:
+            self._check()
+            return
+        if self.pending is not None:
+            self.widget.after_cancel(self.pending)
+        self.pending = self.widget.after(int(delay), self._check)
+
+    def _check(self) -> None:
+        self.pending = None
+        handlers = self.table.get(self.var.get())
+        if handlers:
+            self.router._dispatch(handlers)
+
+    def close(self) -> None:
+        if self.pending is not None:
+            try:
+                self.widget.after_cancel(self.pending)
+            except Exception:
+                pass
+            self.pending = None
+        try:
+            self.var.trace_remove('write', self.trace)
+        except Exception:
+            pass
+
+
+class EventRouter:
+    def __init__(self, tkmod: Any, root: Any, metrics: Any = None) -> None:
+        self.tk = tkmod
+        self.queue = EventQueue(root, metrics)
+        self.match_debounce_ms: float = MATCH_DEBOUNCE_MS
+        self._routes: Dict[Tuple[Any, str], List[Handler]] = {}
+        self._matches: Dict[Any, _MatchWatch] = {}
+        self._watched: Dict[Any, bool] = {}
+
+    def add(self, widget: Any, sequence: str, handler: Handler) -> None:
+        key = (widget, sequence)
+        handlers = self._routes.get(key)
+        if handlers is None:
+            handlers = self._routes[key] = []
+            widget.bind(sequence, lambda _e=None: self._dispatch(handlers), add='+')
+            self._watch(widget)
+        handlers.append(handler)
+
+    def remove(self, widget: Any, sequence: str, handler: Handler) -> None:
+        # The Tk binding stays; an empty list simply dispatches nothing
+        handlers = self._routes.get((widget, sequence))
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def add_match(self, widget: Any, expected: str, handler: Handler) -> None:
+        watch = self._matches.get(widget)
+        if watch is None:
+            watch = self._matches[widget] = _MatchWatch(self, widget)
+            self._watch(widget)
+        watch.table.setdefault(expected, []).append(handler)
+
+    def remove_match(self, widget: Any, expected: str, handler: Handler) -> None:
+        watch = self._matches.get(widget)
+        handlers = watch.table.get(expected) if watch is not None else None
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del watch.table[expected]
+
+    def handlers(self, widget: Any, sequence: str) -> List[Handler]:
+        return list(self._routes.get((widget, sequence), ()))
+
+    def __len__(self) -> int:
+        return (sum(len(h) for h in self._routes.values())
+                + sum(len(h) for w in self._matches.values() for h in w.table.values()))
+
+    def clear(self) -> None:
+        self.queue.clear()
+        for handlers in self._routes.values():
+            handlers.clear()
+        self._routes.clear()
+        for watch in self._matches.values():
+            watch.close()
+        self._matches.clear()
+        self._watched.clear()
+
+    def _dispatch(self, handlers: List[Handler]) -> None:
+        push = self.queue.push
+        for handler in handlers:
+            push(handler)
+
+    def _watch(self, widget: Any) -> None:
+        if widget not in self._watched:
+            self._watched[widget] = True
+            widget.bind('<Destroy>', lambda e: self._forget(widget, e), add='+')
+
+    def _forget(self, widget: Any, e: Any) -> None:
+        if getattr(e, 'widget', widget) is not widget:
+            return
+        self._watched.pop(widget, None)
+        watch = self._matches.pop(widget, None)
+        if watch is not None:
+            watch.close()
+        for key in [k for k in self._routes if k[0] is widget]:
+            del self._routes[key]
@@ -0,0 +1,357 @@
+from __future__ import annotations
+import heapq
+import itertools
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Display-less stand-in for the parts of tkinter the Qude engines use. Widgets only
+# record their options, geometry and bindings; timers run on a virtual clock so
+# scripts can be executed in batch runs and benchmarks without a Tk display.
+# Pass this module as `backend=` to QudeInterpreter / QudeAstInterpreter.
+
+HEADLESS = True
+BOTH = "both"
+X = "x"
+END = "end"
+
+
+class TclError(Exception):
+    pass
+
+
+class Event:
+    def __init__(self, widget: "Misc", **kw: Any) -> None:
+        self.widget = widget
+        self.__dict__.update(kw)
+
+
+class Misc:
+    _names = itertools.count(1)
+
+    def __init__(self, master: Optional["Misc"] = None, **kw: Any) -> None:
+        self.master = master
+        self.children: Dict[str, Misc] = {}
+        self._name = f"!{type(self).__name__.lower()}{next(Misc._names)}"
+        self._options: Dict[str, Any] = dict(kw)
+        self._bindings: Dict[str, List[Tuple[str, Callable]]] = {}
+        self._place: Dict[str, str] = {}
+        self._destroyed = False
+        if master is not None:
+            master.children[self._name] = self
+
+    def __str__(self) -> str:
+        if self.master is None:
+            return "."
+        parent = str(self.master)
+        return (parent if parent != "." else "") + "." + self._name
+
+    # ---- options ----
+    def configure(self, cnf: Optional[Dict[str, Any]] = None, **kw: Any) -> None:
+        if cnf:
+            kw.update(cnf)
+        self._options.update(kw)
+        var = kw.get("textvariable")
+        if var is not None and hasattr(self, "_attach_var"):
+            self._attach_var(var)
+
+    config = configure
+
+    def cget(self, key: str) -> Any:
+        return self._options.get(key, "")
+
+    def __getitem__(self, key: str) -> Any:
+        return self.cget(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.configure(**{key: value})
+
+    # ---- events ----
+    def bind(self, sequence: str, func: Optional[Callable] = None, add: Any = None) -> str:
+        funcid = f"{id(func)}{sequence}"
+        if func is None:
+            return funcid
+        handlers = self._bindings.setdefault(sequence, [])
+        if not add:
+            handlers.clear()
+        handlers.append((funcid, func))
+        return funcid
+
+    def unbind(self, sequence: str, funcid: Optional[str] = None) -> None:
+        if funcid is None:
+            self._bindings.pop(sequence, None)
+            return
+        self._bindings[sequence] = [(i, f) for i, f in self._bindings.get(sequence, []) if i != funcid]
+
+    def event_generate(self, sequence: str, **kw: Any) -> None:
+        # Synchronously dispatch to bound handlers (used by tests and benchmarks)
+        evt = Event(self, **kw)
+        for _funcid, func in list(self._bindings.get(sequence, [])):
+            if func(evt) == "break":
+                break
+
+    # ---- geometry ----
+    def place(self, **kw: Any) -> None:
+        self._place.update({k: str(v) for k, v in kw.items()})
+
+    place_configure = place
+
+    def place_info(self) -> Dict[str, str]:
+        return dict(self._place)
+
+    def pack(self, **kw: Any) -> None:
+        pass
+
+    def pack_propagate(self, flag: Any = None) -> None:
+        pass
+
+    def grid(self, **kw: Any) -> None:
+        pass
+
+    # ---- lifetime ----
+    def destroy(self) -> None:
+        for child in list(self.children.values()):
+            child.destroy()
+        # Like Tk bindtags: the widget's own bindings, then its toplevel's
+        evt = Event(self)
+        targets = [self]
+        top = self.master
+        while top is not None and not isinstance(top, Wm):
+            top = top.master
+        if top is not None:
+            targets.append(top)
+        for target in targets:
+            for _funcid, func in list(target._bindings.get("<Destroy>", [])):
+                func(evt)
+        self._destroyed = True
+        if self.master is not None:
+            self.master.children.pop(self._name, None)
+
+    def winfo_exists(self) -> int:
+        return 0 if self._destroyed else 1
+
+    def winfo_children(self) -> List["Misc"]:
+        return list(self.children.values())
+
+    def winfo_width(self) -> int:
+        return int(self._place.get("width", self._options.get("width", 1)) or 1)
+
+    def winfo_height(self) -> int:
+        return int(self._place.get("height", self._options.get("height", 1)) or 1)
+
+    # ---- scheduling (delegated to the root) ----
+    def _root(self) -> "Tk":
+        w: Misc = self
+        while w.master is not None:
+            w = w.master
+        return w  # type: ignore[return-value]
+
+    def after(self, ms: int, func: Optional[Callable] = None, *args: Any) -> str:
+        return self._root()._schedule(ms, func, args)
+
+    def after_idle(self, func: Callable, *args: Any) -> str:
+        return self._root()._schedule(0, func, args)
+
+    def after_cancel(self, job_id: str) -> None:
+        self._root()._cancelled.add(job_id)
+
+    # ---- no-ops that only matter with a real display ----
+    def lift(self, *a: Any) -> None:
+        pass
+
+    tkraise = lift
+
+    def focus_force(self) -> None:
+        pass
+
+    focus_set = focus_force
+
+    def update(self) -> None:
+        self._root()._run_due()
+
+    def update_idletasks(self) -> None:
+        pass
+
+
+class Wm:
+    def title(self, text: Optional[str] = None) -> str:
+        if text is not None:
+            self._wm_title = text  # type: ignore[attr-defined]
+        return getattr(self, "_wm_title", "")
+
+    def geometry(self, spec: Optional[str] = None) -> str:
+        if spec is not None:
+            self._wm_geometry = spec  # type: ignore[attr-defined]
+        return getattr(self, "_wm_geometry", "1x1+0+0")
+
+    def resizable(self, *a: Any) -> None:
+        pass
+
+    def attributes(self, *a: Any) -> Any:
+        return ""
+
+    def iconbitmap(self, *a: Any, **kw: Any) -> None:
+        pass
+
+    def iconphoto(self, *a: Any) -> None:
+        pass
+
+    def withdraw(self) -> None:
+        pass
+
+    def deiconify(self) -> None:
+        pass
+
+    def protocol(self, *a: Any) -> None:
+        pass
+
+    def transient(self, *a: Any) -> None:
+        pass
+
+    def grab_set(self) -> None:
+        pass
+
+    def overrideredirect(self, *a: Any) -> None:
+        pass
+
+
+class Tk(Misc, Wm):
+    # Timers run on a virtual clock: mainloop() jumps straight to the next due callback
+    def __init__(self, *a: Any, **kw: Any) -> None:
+        super().__init__(None)
+        self.now_ms = 0.0
+        self._timers: List[Tuple[float, int, str, Callable, tuple]] = []
+        self._seq = itertools.count()
+        self._cancelled: set = set()
+        self._quit = False
+
+    def _schedule(self, ms: int, func: Optional[Callable], args: tuple) -> str:
+        seq = next(self._seq)
+        job_id = f"after#{seq}"
+        if func is not None:
+            heapq.heappush(self._timers, (self.now_ms + max(0, int(ms)), seq, job_id, func, args))
+        return job_id
+
+    def _pop_due(self, until_ms: float) -> Optional[Tuple[Callable, tuple]]:
+        while self._timers and self._timers[0][0] <= until_ms:
+            due, _seq, job_id, func, args = heapq.heappop(self._timers)
+            if job_id in self._cancelled:
+                self._cancelled.discard(job_id)
+                continue
+            self.now_ms = max(self.now_ms, due)
+            return func, args
+        return None
+
+    def _run_due(self) -> None:
+        while True:
+            item = self._pop_due(self.now_ms)
+            if item is None:
+                return
+            item[0](*item[1])
+
+    def mainloop(self, duration_ms: Optional[float] = None) -> None:
+        # Without a duration only callbacks due "now" run (after(0)/after_idle chains)
+        limit = self.now_ms + (duration_ms or 0)
+        self._quit = False
+        while not self._quit:
+            item = self._pop_due(limit)
+            if item is None:
+                break
+            item[0](*item[1])
+        if duration_ms:
+            self.now_ms = max(self.now_ms, limit)
+
+    def quit(self) -> None:
+        self._quit = True
+
+    def pending_timers(self) -> int:
+        return sum(1 for t in self._timers if t[2] not in self._cancelled)
+
+
+class Toplevel(Misc, Wm):
+    pass
+
+
+class Frame(Misc):
+    pass
+
+
+class Label(Misc):
+    pass
+
+
+class Button(Misc):
+    pass
+
+
+class StringVar:
+    def __init__(self, master: Any = None, value: str = "") -> None:
+        self._value = value
+        self._traces: List[Tuple[str, Callable]] = []
+
+    def get(self) -> str:
+        return self._value
+
+    def set(self, value: str) -> None:
+        self._value = str(value)
+        for _name, cb in list(self._traces):
+            cb("", "", "write")
+
+    def trace_add(self, mode: Any, callback: Callable) -> str:
+        name = f"trace{id(callback)}"
+        self._traces.append((name, callback))
+        return name
+
+    def trace_remove(self, mode: Any, name: str) -> None:
+        self._traces = [(n, cb) for n, cb in self._traces if n != name]
+
+
+class Entry(Misc):
+    def __init__(self, master: Optional[Misc] = None, **kw: Any) -> None:
+        self._var: Optional[StringVar] = None
+        self._text = ""
+        super().__init__(master, **kw)
+        if kw.get("textvariable") is not None:
+            self._attach_var(kw["textvariable"])
+
+    def _attach_var(self, var: StringVar) -> None:
+        self._var = var
+        self._text = var.get()
+
+    def get(self) -> str:
+        return self._var.get() if self._var is not None else self._text
+
+    def _set_text(self, text: str) -> None:
+        if self._var is not None:
+            self._var.set(text)
+        else:
+            self._text = text
+
+    def insert(self, index: Any, text: str) -> None:
+        cur = self.get()
+        pos = len(cur) if index == END else int(index)
+        self._set_text(cur[:pos] + text + cur[pos:])
+
+    def delete(self, first: Any, last: Any = None) -> None:
+        cur = self.get()
+        start = len(cur) if first == END else int(first)
+        end = start + 1 if last is None else (len(cur) if last == END else int(last))
+        self._set_text(cur[:start] + cur[end:])
+
+
+class Font:
+    def __init__(self, root: Any = None, **kw: Any) -> None:
+        self._options: Dict[str, Any] = dict(kw)
+
+    def configure(self, **kw: Any) -> None:
+        self._options.update(kw)
+
+    config = configure
+
+    def cget(self, key: str) -> Any:
+        return self._options.get(key, "")
+
+    def actual(self, key: Optional[str] = None) -> Any:
+        return self._options if key is None else self._options.get(key, "")
+
+
+font = SimpleNamespace(Font=Font)
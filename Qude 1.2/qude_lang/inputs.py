@@ -0,0 +1,101 @@
+from __future__ import annotations
+from collections import deque
+from typing import Any, Callable, Deque, Optional, Tuple
+
+# Non-modal replacement for simpledialog.askstring used by taQe.putt / tq.put.
+# The prompt is an input bar placed at the bottom of the app window (or preview)
+# and the answer is delivered through a callback, so no nested event loop runs.
+# Requests made while a prompt is open are queued and shown one after another.
+
+
+class InputPrompts:
+    def __init__(self, tkmod: Any, fallback_root: Any) -> None:
+        self.tk = tkmod
+        self.fallback_root = fallback_root
+        self._queue: Deque[Tuple[Any, str, Callable[[str], None]]] = deque()
+        self._current: Optional[Tuple[Any, str, Callable[[str], None]]] = None
+        self._frame: Any = None
+        self._entry: Any = None
+        self._own_top: Any = None
+
+    @property
+    def active(self) -> bool:
+        return self._current is not None
+
+    def ask(self, parent: Any, prompt: str, on_submit: Callable[[str], None]) -> None:
+        self._queue.append((parent, prompt, on_submit))
+        if self._current is None:
+            self._show_next()
+
+    def submit(self, text: Optional[str] = None) -> None:
+        # text=None takes the entry's contents (Return / Tamam)
+        current = self._current
+        if current is None:
+            return
+        if text is None:
+            try:
+                text = self._entry.get()
+            except Exception:
+                text = ""
+        self._close()
+        self._current = None
+        try:
+            current[2](text)
+        finally:
+            if self._current is None and self._queue:
+                self._show_next()
+
+    def cancel(self) -> None:
+        # Escape behaves like a cancelled dialog: empty answer
+        self.submit("")
+
+    def clear(self) -> None:
+        self._queue.clear()
+        self._current = None
+        self._close()
+
+    def _show_next(self) -> None:
+        parent, prompt, on_submit = self._queue.popleft()
+        self._current = (parent, prompt, on_submit)
+        tk = self.tk
+        try:
+            alive = parent is not None and parent.winfo_exists()
+        except Exception:
+            alive = False
+        if not alive:
+            # No app window yet: a small, non-modal window of its own
+            self._own_top = parent = tk.Toplevel(self.fallback_root)
+            parent.title("Qude Input")
+            parent.geometry("320x90")
+            parent.protocol("WM_DELETE_WINDOW", self.cancel)
+        frm = tk.Frame(parent, bg='#333', bd=1, relief='ridge')
+        lbl = tk.Label(frm, text=prompt, bg='#333', fg='#fff', anchor='w')
+        ent = tk.Entry(frm)
+        btn = tk.Button(frm, text="Tamam", command=self.submit)
+        lbl.pack(fill=tk.X, padx=8, pady=(6, 2))
+        ent.pack(side='left', fill=tk.X, expand=True, padx=(8, 4), pady=(0, 6))
+        btn.pack(side='right', padx=(0, 8), pady=(0, 6))
+        ent.bind('<Return>', lambda e: self.submit())
+        ent.bind('<Escape>', lambda e: self.cancel())
+        try:
+            frm.place(relx=0.0, rely=1.0, relwidth=1.0, anchor='sw')
+            frm.lift()
+        except Exception:
+            frm.pack(fill=tk.X, side='bottom')
+        try:
+            ent.focus_set()
+        except Exception:
+            pass
+        self._frame = frm
+        self._entry = ent
+
+    def _close(self) -> None:
+        for w in (self._frame, self._own_top):
+            try:
+                if w is not None and w.winfo_exists():
+                    w.destroy()
+            except Exception:
+                pass
+        self._frame = None
+        self._entry = None
+        self._own_top = None
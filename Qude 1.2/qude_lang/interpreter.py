@@ -1,21 +1,65 @@
 from __future__ import annotations
+import copy
 import re
+import time
 import tkinter as tk
-from tkinter import simpledialog
 from tkinter import font as tkfont
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from .parser import (
     Program, StartStmt, StopStmt, ConsoleWrite, InputStmt, Assign, MathStmt,
     WindowOpen, WindowTitle, WindowSize, WindowResizable, WindowFullscreen, WindowBg,
     InsertText, InsertButton, InsertInput,
     WidgetText, WidgetTextColor, WidgetBgColor, WidgetFontFamily, WidgetFontSize,
-    WidgetSize, WidgetPos, EventBlock,
-    StringLit, NumberLit, VarRef, Binary, Expr, Stmt,
+    WidgetSize, WidgetPos, EventBlock, TimerBlock, RepeatStmt, ForStmt, IfStmt,
+    StringLit, NumberLit, VarRef, Binary, Compare, Expr, Stmt,
 )
+from .inputs import InputPrompts
+from .limits import Budget, BudgetExceeded, Limits
+from .profiler import Profiler
+from .metrics import Metrics, event_key
+from .events import EventRouter
+from .scheduler import Scheduler
+
+# Slice budget defaults, see QudeInterpreter (0 = no limit)
+SLICE_STATEMENTS = 0
+SLICE_MS = 20.0
+# {var} placeholders in names and strings inside loop bodies
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
+class _RunState:
+    def __init__(self, statements: List[Stmt], on_done: Optional[Callable[[], None]]) -> None:
+        self.statements = statements
+        self.pc = 0
+        self.on_done = on_done
+        self.after_id: Optional[str] = None
+        self.budget: Optional[Budget] = None
+        self.frames: List[_LoopFrame] = []
+        # Event/timer bodies: the header, loop values in scope, whether the body waits
+        # on taQe.putt, and how to continue it once the answer is in
+        self.header: Optional[str] = None
+        self.scope: Dict[str, Any] = {}
+        self.waiting = False
+        self.resume: Optional[Callable[[], None]] = None
+
+
+class _LoopFrame:
+    # A running repeat/for loop or taken if-branch and the position to continue from once it ends
+    def __init__(self, state: _RunState, loop: Stmt, body: List[Stmt], var: Optional[str], values: Any) -> None:
+        self.statements = state.statements
+        self.resume = state.pc
+        self.loop = loop
+        self.body = body
+        self.var = var
+        self.values = values
+        self.prev = None
+
 
 class QudeAstInterpreter:
-    def __init__(self, console_write, ide_root: tk.Tk) -> None:
+    def __init__(self, console_write, ide_root: tk.Tk, backend: Any = None) -> None:
         self.console_write = console_write
+        # Widget toolkit: tkinter by default, or qude_lang.headless for display-less runs
+        self.tk = backend if backend is not None else tk
         self.ide_root = ide_root
         self.window: Optional[tk.Toplevel] = None
         self.widgets: Dict[str, tk.Widget] = {}
@@ -23,29 +67,152 @@ class QudeAstInterpreter:
         self.widget_sizes: Dict[str, Tuple[int, int]] = {}
         self.vars: Dict[str, Any] = {}
         self.running = False
+        self.slice_statements = SLICE_STATEMENTS
+        self.slice_ms = SLICE_MS
+        self.on_progress: Optional[Callable[[int, int], None]] = None
+        self._run_state: Optional[_RunState] = None
+        self._in_step = False
+        self._suspended = False
+        # Event handler body currently running, for taQe.putt to suspend
+        self._handler_state: Optional[_RunState] = None
+        self.inputs = InputPrompts(self.tk, ide_root)
+        self.input_provider: Optional[Callable[[str], str]] = None
+        self.limits = Limits()
+        self._budget: Optional[Budget] = None
+        self.profiler: Optional[Profiler] = None
+        self.metrics = Metrics()
+        # Loop variables in scope for {var} placeholders
+        self._scope: Dict[str, Any] = {}
+        self.events = EventRouter(self.tk, ide_root, self.metrics)
+        self.scheduler = Scheduler(ide_root, self.events.queue.push, self.metrics)
+
+    def run(self, program: Program, on_done: Optional[Callable[[], None]] = None) -> None:
+        # Same slicing as QudeInterpreter.run: continues via ide_root.after(0, ...)
+        self.stop()
+        self._run_state = _RunState(program.statements, on_done)
+        self._run_state.budget = self.limits.run_budget()
+        try:
+            self._run_slice(self._run_state)
+        except Exception:
+            self._run_state = None
+            raise
+
+    def stop(self) -> None:
+        state = self._run_state
+        self._run_state = None
+        self._suspended = False
+        self.inputs.clear()
+        if state is not None and state.after_id is not None:
+            try:
+                self.ide_root.after_cancel(state.after_id)
+            except Exception:
+                pass
+        self.scheduler.clear()
+        self.events.queue.clear()
+        self._scope = {}
+        self.running = False
 
-    def run(self, program: Program) -> None:
-        for stmt in program.statements:
-            self._exec_stmt(stmt)
+    @property
+    def busy(self) -> bool:
+        return self._run_state is not None
+
+    def _run_slice(self, state: _RunState) -> None:
+        if state is not self._run_state:
+            return
+        state.after_id = None
+        max_steps = self.slice_statements
+        deadline = time.perf_counter() + self.slice_ms / 1000.0 if self.slice_ms > 0 else None
+        steps = 0
+        budget = state.budget
+        self._budget = budget
+        budget.resume()
+        try:
+            while state.pc < len(state.statements) or state.frames:
+                self._in_step = True
+                if state.pc >= len(state.statements):
+                    # End of a loop body: next iteration, or back to the enclosing block
+                    stmt = state.frames[-1].loop
+                    try:
+                        self._next_iteration(state)
+                    except BudgetExceeded as e:
+                        self.console_write(f"[Error] {e} at line {stmt.line}")
+                        self.stop()
+                        if state.on_done is not None:
+                            state.on_done()
+                        return
+                    finally:
+                        self._in_step = False
+                    steps += 1
+                    continue
+                stmt = state.statements[state.pc]
+                state.pc += 1
+                try:
+                    if self.profiler is None:
+                        self._exec_stmt(stmt)
+                    else:
+                        t0 = time.perf_counter()
+                        self._exec_stmt(stmt)
+                        self.profiler.record(stmt.line, type(stmt).__name__, time.perf_counter() - t0)
+                except BudgetExceeded as e:
+                    self.console_write(f"[Error] {e} at line {stmt.line}")
+                    self.stop()
+                    if state.on_done is not None:
+                        state.on_done()
+                    return
+                finally:
+                    self._in_step = False
+                steps += 1
+                if self._suspended:
+                    return
+                if state.pc >= len(state.statements) and not state.frames:
+                    break
+                if (max_steps and steps >= max_steps) or (deadline is not None and time.perf_counter() >= deadline):
+                    if self.on_progress is not None:
+                        top = state.frames[0] if state.frames else None
+                        self.on_progress(top.resume if top else state.pc, len(top.statements if top else state.statements))
+                    state.after_id = self.ide_root.after(0, self._resume, state)
+                    return
+        finally:
+            budget.pause()
+            self._budget = None
+        self._run_state = None
+        if state.on_done is not None:
+            state.on_done()
+
+    def _resume(self, state: _RunState) -> None:
+        try:
+            self._run_slice(state)
+        except Exception as e:
+            self.console_write(f"[Error] {e}")
+            if state is self._run_state:
+                self._run_state = None
+                if state.on_done is not None:
+                    state.on_done()
 
     def _exec_stmt(self, stmt: Stmt) -> None:
         if isinstance(stmt, StartStmt):
             self.running = True
-            return
-        if isinstance(stmt, StopStmt):
+        elif isinstance(stmt, StopStmt):
             self.running = False
+        elif self.running:
+            self._exec_action(stmt)
             return
-        if not self.running:
-            return
+        self.metrics.statements += 1
+        if self._budget is not None:
+            self._budget.tick()
 
+    def _exec_action(self, stmt: Stmt) -> None:
+        # Statement body; event handlers call this directly since they fire after Qude.kill/
+        self.metrics.statements += 1
+        if self._budget is not None:
+            self._budget.tick()
+        if stmt.templated:
+            stmt = self._instantiate(stmt)
         if isinstance(stmt, ConsoleWrite):
             self.console_write(str(self._eval(stmt.expr)))
             return
         if isinstance(stmt, InputStmt):
-            prompt = str(self._eval(stmt.prompt))
-            parent = self.window if self.window is not None else self.ide_root
-            ans = simpledialog.askstring("Qude Input", prompt, parent=parent)
-            self.vars['data'] = ans if ans is not None else ''
+            self._request_input(str(self._eval(stmt.prompt)))
             return
         if isinstance(stmt, Assign):
             self.vars[stmt.name] = self._eval(stmt.expr)
@@ -102,31 +269,40 @@ class QudeAstInterpreter:
             return
         if isinstance(stmt, InsertText):
             self._ensure_window()
-            lbl = tk.Label(self.window, text=str(self._eval(stmt.text)))
+            self.metrics.widgets_created += 1
+            if self._budget is not None:
+                self._budget.widget()
+            lbl = self.tk.Label(self.window, text=str(self._eval(stmt.text)))
             lbl.place(x=0, y=0)
             self.widgets[stmt.name] = lbl
-            self.widget_fonts[stmt.name] = tkfont.Font(family='TkDefaultFont', size=12)
+            self.widget_fonts[stmt.name] = self.tk.font.Font(family='TkDefaultFont', size=12)
             lbl.configure(font=self.widget_fonts[stmt.name])
             return
         if isinstance(stmt, InsertButton):
             self._ensure_window()
-            btn = tk.Button(self.window, text="button")
+            self.metrics.widgets_created += 1
+            if self._budget is not None:
+                self._budget.widget()
+            btn = self.tk.Button(self.window, text="button")
             btn.place(x=0, y=0)
             self.widgets[stmt.name] = btn
-            self.widget_fonts[stmt.name] = tkfont.Font(family='TkDefaultFont', size=12)
+            self.widget_fonts[stmt.name] = self.tk.font.Font(family='TkDefaultFont', size=12)
             btn.configure(font=self.widget_fonts[stmt.name])
             return
         if isinstance(stmt, InsertInput):
             self._ensure_window()
-            ent = tk.Entry(self.window)
+            self.metrics.widgets_created += 1
+            if self._budget is not None:
+                self._budget.widget()
+            ent = self.tk.Entry(self.window)
             ent.place(x=0, y=0)
             self.widgets[stmt.name] = ent
-            self.widget_fonts[stmt.name] = tkfont.Font(family='TkDefaultFont', size=12)
+            self.widget_fonts[stmt.name] = self.tk.font.Font(family='TkDefaultFont', size=12)
             ent.configure(font=self.widget_fonts[stmt.name])
             return
         if isinstance(stmt, WidgetText):
             w = self.widgets.get(stmt.name)
-            if w and isinstance(w, (tk.Button, tk.Label)):
+            if w and isinstance(w, (self.tk.Button, self.tk.Label)):
                 try:
                     w.configure(text=str(self._eval(stmt.value)))
                 except Exception:
@@ -195,10 +371,174 @@ class QudeAstInterpreter:
                     pass
             return
         if isinstance(stmt, EventBlock):
-            self._register_event(stmt.header, stmt.action)
+            self._register_event(stmt.header, stmt.body)
+            return
+        if isinstance(stmt, TimerBlock):
+            self._register_timer(stmt)
+            return
+        if isinstance(stmt, (RepeatStmt, ForStmt)):
+            self._begin_loop(stmt)
+            return
+        if isinstance(stmt, IfStmt):
+            self._begin_if(stmt)
             return
 
-    def _register_event(self, header: str, action: Stmt) -> None:
+    # -------- Loops --------
+    def _loop_values(self, stmt: Stmt) -> Tuple[Optional[str], range]:
+        if isinstance(stmt, RepeatStmt):
+            return None, range(max(0, int(self._eval(stmt.count))))
+        first = int(self._eval(stmt.first))
+        last = int(self._eval(stmt.last))
+        return stmt.var, range(first, last + 1) if first <= last else range(first, last - 1, -1)
+
+    def _begin_loop(self, stmt: Stmt) -> None:
+        var, values = self._loop_values(stmt)
+        if not stmt.body:
+            return
+        state = self._block_state()
+        frame = _LoopFrame(state, stmt, stmt.body, var, iter(values))
+        if var is not None:
+            frame.prev = self._scope.get(var)
+        state.frames.append(frame)
+        self._next_iteration(state)
+
+    def _next_iteration(self, state: _RunState) -> None:
+        frame = state.frames[-1]
+        value = next(frame.values, None)
+        if value is None:
+            state.frames.pop()
+            state.statements, state.pc = frame.statements, frame.resume
+            if frame.var is not None:
+                if frame.prev is None:
+                    self._scope.pop(frame.var, None)
+                else:
+                    self._scope[frame.var] = frame.prev
+            return
+        # Each iteration counts as a statement, so empty bodies still hit the budget
+        self.metrics.statements += 1
+        if self._budget is not None:
+            self._budget.tick()
+        if frame.var is not None:
+            self.vars[frame.var] = value
+            self._scope[frame.var] = value
+        state.statements, state.pc = frame.body, 0
+
+    def _begin_if(self, stmt: IfStmt) -> None:
+        body: List[Stmt] = []
+        for cond, branch in stmt.branches:
+            if cond is None or self._eval(cond):
+                body = branch
+                break
+        if not body:
+            return
+        # The branch runs as a one-pass frame so it is sliced (or suspended) like a loop body
+        state = self._block_state()
+        state.frames.append(_LoopFrame(state, stmt, body, None, iter((0,))))
+        self._next_iteration(state)
+
+    def _block_state(self) -> _RunState:
+        # The event handler body being run, else the main program
+        if self._handler_state is not None:
+            return self._handler_state
+        return self._run_state
+
+    def _interpolate(self, text: str) -> str:
+        scope = self._scope
+        if not scope or '{' not in text:
+            return text
+        return _PLACEHOLDER_RE.sub(lambda m: str(scope[m.group(1)]) if m.group(1) in scope else m.group(0), text)
+
+    def _instantiate(self, stmt: Stmt) -> Stmt:
+        # A copy of a templated statement with the current loop values in its name/header
+        inst = copy.copy(stmt)
+        if hasattr(inst, 'name'):
+            inst.name = self._interpolate(inst.name)
+        if isinstance(inst, EventBlock):
+            inst.header = self._interpolate(inst.header)
+        inst.templated = False
+        return inst
+
+    def _request_input(self, prompt: str) -> None:
+        if self.input_provider is not None:
+            ans = self.input_provider(prompt)
+            self.vars['data'] = ans if ans is not None else ''
+            return
+        # The main program or the event handler asking suspends until the answer arrives
+        state = self._handler_state
+        if state is not None:
+            state.waiting = True
+        elif self._in_step:
+            state = self._run_state
+            if state is not None:
+                self._suspended = True
+        self.inputs.ask(self.window, prompt, lambda ans: self._on_input(ans, state))
+
+    def _on_input(self, ans: str, state: Optional[_RunState]) -> None:
+        self.vars['data'] = ans
+        if state is not None and state.resume is not None:
+            # Continued through the event queue, like any other handler
+            self.events.queue.push(state.resume)
+        elif state is not None and state is self._run_state:
+            self._suspended = False
+            state.after_id = self.ide_root.after(0, self._resume, state)
+
+    def _fire_event(self, header: str, body: List[Stmt], scope: Optional[Dict[str, Any]] = None,
+                    state: Optional[_RunState] = None) -> None:
+        # scope: loop values captured when the handler was registered inside a loop
+        # state: a body suspended on taQe.putt, continued from where it stopped
+        resumed = state is not None
+        if state is None:
+            state = _RunState(body, None)
+            state.header = header
+            state.scope = dict(scope) if scope else {}
+            state.resume = lambda: self._fire_event(header, body, scope, state)
+        outer_scope = self._scope
+        self._scope = state.scope
+        outer = self._budget
+        budget = outer if outer is not None and outer.event else self.limits.event_budget()
+        self._budget = budget
+        if budget is not outer:
+            budget.resume()
+        prof = self.profiler
+        t0 = time.perf_counter()
+        try:
+            self._run_block(state)
+        except Exception as ex:
+            self.console_write(f"[Error] Event: {ex}")
+        finally:
+            elapsed = time.perf_counter() - t0
+            if not resumed:
+                self.metrics.event_fired(event_key(header), elapsed)
+            if prof is not None:
+                prof.record(body[0].line, type(body[0]).__name__, elapsed, f"event {header.strip()}")
+            if budget is not outer:
+                budget.pause()
+            self._budget = outer
+            self._scope = outer_scope
+
+    def _run_block(self, state: _RunState) -> None:
+        # A handler body runs outside the time-sliced main program, until it ends or
+        # waits for a taQe.putt answer
+        outer = self._handler_state
+        self._handler_state = state
+        state.waiting = False
+        stmt = state.statements[0]
+        try:
+            while (state.pc < len(state.statements) or state.frames) and not state.waiting:
+                if state.pc >= len(state.statements):
+                    # End of a loop body: next iteration, or back to the enclosing block
+                    stmt = state.frames[-1].loop
+                    self._next_iteration(state)
+                    continue
+                stmt = state.statements[state.pc]
+                state.pc += 1
+                self._exec_action(stmt)
+        except BudgetExceeded as e:
+            self.console_write(f"[Error] {e} in event {state.header.strip()} (line {stmt.line})")
+        finally:
+            self._handler_state = outer
+
+    def _register_event(self, header: str, body: List[Stmt]) -> None:
         # <option>LeftClickEvent:
         m_opt = re.match(r"\s*<([^>]+)>(LeftClickEvent|RightClickEvent):\s*$", header)
         if m_opt:
@@ -211,16 +551,11 @@ class QudeAstInterpreter:
             name = m_match.group(1)
             expected = self._eval_text_expr(m_match.group(2))
             w = self.widgets.get(name)
-            if not w or not isinstance(w, tk.Entry):
+            if not w or not isinstance(w, self.tk.Entry):
                 self.console_write(f"[Error] MatchEvent requires inputter widget: {name}")
                 return
-            def on_change(_e=None):
-                try:
-                    if w.get() == str(expected):
-                        self._exec_stmt(action)
-                except Exception as ex:
-                    self.console_write(f"[Error] Event: {ex}")
-            w.bind('<KeyRelease>', lambda e: on_change(e), add='+')
+            scope = dict(self._scope) if self._scope else None
+            self.events.add_match(w, str(expected), lambda: self._fire_event(header, body, scope))
             return
         # name.LeftClickEvent:
         m = re.match(r"\s*(\w+)\.(LeftClickEvent|RightClickEvent):\s*$", header)
@@ -233,21 +568,34 @@ class QudeAstInterpreter:
         if not w:
             self.console_write(f"[Error] Unknown widget: {name}")
             return
-        def handler(_e=None):
-            try:
-                self._exec_stmt(action)
-            except Exception as ex:
-                self.console_write(f"[Error] Event: {ex}")
-        if evt == 'LeftClickEvent':
-            w.bind('<Button-1>', handler, add='+')
+        scope = dict(self._scope) if self._scope else None
+        self.events.add(w, '<Button-1>' if evt == 'LeftClickEvent' else '<Button-3>',
+                        lambda: self._fire_event(header, body, scope))
+
+    def _register_timer(self, stmt: TimerBlock) -> None:
+        try:
+            ms = float(self._eval(stmt.interval))
+        except Exception:
+            self.console_write(f"[Error] Bad {stmt.kind} interval (line {stmt.line})")
+            return
+        if stmt.kind == 'every' and ms <= 0:
+            self.console_write('[Error] every needs a positive interval')
+            return
+        header = f"{stmt.kind} {ms:g}:"
+        body = stmt.body
+        scope = dict(self._scope) if self._scope else None
+        handler = lambda: self._fire_event(header, body, scope)
+        if stmt.kind == 'every':
+            self.scheduler.every(ms, handler, header)
         else:
-            w.bind('<Button-3>', handler, add='+')
+            self.scheduler.after(ms, handler, header)
 
     def _ensure_window(self) -> None:
         if self.window is None or not self.window.winfo_exists():
-            self.window = tk.Toplevel(self.ide_root)
+            self.window = self.tk.Toplevel(self.ide_root)
             self.window.title('Qude App')
             self.window.geometry('400x300')
+            self.window.bind('<Destroy>', self._on_window_destroy, add='+')
             try:
                 self.window.lift()
                 self.window.focus_force()
@@ -256,11 +604,22 @@ class QudeAstInterpreter:
             except Exception:
                 pass
 
+    def _on_window_destroy(self, e: Any) -> None:
+        # Bound on the app Toplevel, whose bindings also see its children's <Destroy>.
+        # Only script widgets count; input prompts and other engine frames do not
+        if e.widget is self.window:
+            self.metrics.widgets_destroyed += sum(1 for w in self.widgets.values() if w.master is e.widget)
+            # Timers die with the app window
+            self.scheduler.clear()
+
     # -------- Expr eval --------
     def _eval(self, expr: Expr) -> Any:
+        self.metrics.evals += 1
         if isinstance(expr, StringLit):
             if expr.value.lower() == 'taqe.data':
                 return self.vars.get('data', '')
+            if self._scope and '{' in expr.value:
+                return self._interpolate(expr.value)
             return expr.value
         if isinstance(expr, NumberLit):
             return expr.value
@@ -270,6 +629,8 @@ class QudeAstInterpreter:
             l = self._eval(expr.left)
             r = self._eval(expr.right)
             return self._apply_bin(l, r, expr.op)
+        if isinstance(expr, Compare):
+            return self._eval(expr.left) == self._eval(expr.right)
         return None
 
     def _eval_text_expr(self, text: str) -> Any:
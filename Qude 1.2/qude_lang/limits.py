@@ -0,0 +1,69 @@
+from __future__ import annotations
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+# Work budgets for a run and for each event dispatch. A value of 0 disables that
+# limit. Wall time only counts time spent executing, not time waiting for input
+# or between slices.
+
+
+class BudgetExceeded(Exception):
+    def __init__(self, limit: str, value: float) -> None:
+        super().__init__(f"Limit exceeded: {limit} ({value:g})")
+        self.limit = limit
+        self.value = value
+
+
+@dataclass
+class Limits:
+    max_statements: int = 1_000_000
+    max_seconds: float = 60.0
+    max_widgets: int = 10_000
+    event_max_statements: int = 100_000
+    event_max_seconds: float = 5.0
+
+    def run_budget(self) -> "Budget":
+        return Budget(self.max_statements, self.max_seconds, self.max_widgets)
+
+    def event_budget(self) -> "Budget":
+        return Budget(self.event_max_statements, self.event_max_seconds, self.max_widgets, event=True)
+
+
+class Budget:
+    def __init__(self, max_statements: int, max_seconds: float, max_widgets: int, event: bool = False) -> None:
+        self.max_statements = max_statements
+        self.max_seconds = max_seconds
+        self.max_widgets = max_widgets
+        self.event = event
+        self.statements = 0
+        self.widgets = 0
+        self._elapsed = 0.0
+        self._started: Optional[float] = None
+
+    def resume(self) -> None:
+        self._started = time.perf_counter()
+
+    def pause(self) -> None:
+        if self._started is not None:
+            self._elapsed += time.perf_counter() - self._started
+            self._started = None
+
+    @property
+    def elapsed(self) -> float:
+        if self._started is None:
+            return self._elapsed
+        return self._elapsed + time.perf_counter() - self._started
+
+    def tick(self) -> None:
+        self.statements += 1
+        if self.max_statements and self.statements > self.max_statements:
+            raise BudgetExceeded("max statements", self.max_statements)
+        # Checking the clock every 64 statements keeps the per-statement cost low
+        if self.max_seconds and not (self.statements & 63) and self.elapsed > self.max_seconds:
+            raise BudgetExceeded("max seconds", self.max_seconds)
+
+    def widget(self) -> None:
+        self.widgets += 1
+        if self.max_widgets and self.widgets > self.max_widgets:
+            raise BudgetExceeded("max widgets", self.max_widgets)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+import bisect
+from typing import Any, Dict, List, Tuple
+
+# Always-on engine counters. Everything is a plain attribute increment on the hot
+# path; aggregation only happens in snapshot(), which the IDE's Performans panel
+# calls on a timer while it is open.
+
+
+class Histogram:
+    # Upper bucket bounds in microseconds; the last bucket is open-ended
+    BOUNDS_US: Tuple[int, ...] = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 250000)
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BOUNDS_US) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.BOUNDS_US, seconds * 1e6)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p: float) -> float:
+        # Upper bound of the bucket holding the p-th percentile, in seconds
+        if not self.count:
+            return 0.0
+        rank = p / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(self.BOUNDS_US[i] / 1e6, self.max) if i < len(self.BOUNDS_US) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+            "buckets_us": list(zip(list(self.BOUNDS_US) + [None], self.counts)),
+        }
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.regex_attempts = 0
+        self.regex_misses = 0
+        self.evals = 0
+        self.widgets_created = 0
+        self.widgets_destroyed = 0
+        # "widget.EventType" -> firings
+        self.events: Dict[str, int] = {}
+        # cache name -> [hits, misses]; zeroed in place, engines hold on to the lists
+        caches: Dict[str, List[int]] = getattr(self, "caches", {})
+        for entry in caches.values():
+            entry[0] = entry[1] = 0
+        self.caches = caches
+        self.handler_latency = Histogram()
+        # Event queue: handlers queued / dropped as duplicates, deepest backlog, wait time
+        self.events_queued = 0
+        self.events_coalesced = 0
+        self.queue_peak = 0
+        self.queue_latency = Histogram()
+        # every/after scheduler: ticks, firings, skipped periods, lateness
+        self.timer_ticks = 0
+        self.timer_fires = 0
+        self.timer_overruns = 0
+        self.timer_drift = Histogram()
+
+    def cache(self, name: str) -> List[int]:
+        # Returns the live [hits, misses] pair so callers can bump it directly
+        entry = self.caches.get(name)
+        if entry is None:
+            entry = self.caches[name] = [0, 0]
+        return entry
+
+    def event_fired(self, key: str, seconds: float) -> None:
+        self.events[key] = self.events.get(key, 0) + 1
+        self.handler_latency.observe(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        caches = {}
+        for name, (hits, misses) in self.caches.items():
+            total = hits + misses
+            caches[name] = {"hits": hits, "misses": misses, "hit_rate": hits / total if total else 0.0}
+        return {
+            "statements": self.statements,
+            "regex_attempts": self.regex_attempts,
+            "regex_misses": self.regex_misses,
+            "evals": self.evals,
+            "widgets_created": self.widgets_created,
+            "widgets_destroyed": self.widgets_destroyed,
+            "events": dict(self.events),
+            "caches": caches,
+            "handler_latency": self.handler_latency.snapshot(),
+            "events_queued": self.events_queued,
+            "events_coalesced": self.events_coalesced,
+            "queue_peak": self.queue_peak,
+            "queue_latency": self.queue_latency.snapshot(),
+            "timer_ticks": self.timer_ticks,
+            "timer_fires": self.timer_fires,
+            "timer_overruns": self.timer_overruns,
+            "timer_drift": self.timer_drift.snapshot(),
+        }
+
+
+def event_key(header: str) -> str:
+    # "b1.LeftClickEvent:" / "<Tamam>LeftClickEvent:" / "in.MatchEvent == 'x':" -> "b1.LeftClickEvent"
+    head = header.strip().rstrip(":").strip()
+    return head.split("==")[0].strip()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 from .lexer import Token, Lexer
 import re
 
@@ -9,7 +9,11 @@ import re
 class Program:
     statements: List['Stmt']
 
-class Stmt: ...
+class Stmt:
+    # Source line of the statement, set by the parser (0 = unknown)
+    line: int = 0
+    # Names contain {var} loop placeholders, filled in when the statement runs
+    templated: bool = False
 
 @dataclass
 class StartStmt(Stmt):
@@ -114,7 +118,30 @@ class WidgetPos(Stmt):
 @dataclass
 class EventBlock(Stmt):
     header: str
-    action: 'Stmt'
+    body: List['Stmt']
+
+@dataclass
+class TimerBlock(Stmt):
+    kind: str  # every | after
+    interval: 'Expr'
+    body: List['Stmt']
+
+@dataclass
+class RepeatStmt(Stmt):
+    count: 'Expr'
+    body: List['Stmt']
+
+@dataclass
+class ForStmt(Stmt):
+    var: str
+    first: 'Expr'
+    last: 'Expr'
+    body: List['Stmt']
+
+@dataclass
+class IfStmt(Stmt):
+    # (condition, body) per if/elif branch in order; an else branch has no condition
+    branches: List[Tuple[Optional['Expr'], List['Stmt']]]
 
 # Expressions
 class Expr: ...
@@ -137,6 +164,12 @@ class Binary(Expr):
     op: str
     right: Expr
 
+@dataclass
+class Compare(Expr):
+    # Equality test of an if/elif condition: left = right
+    left: Expr
+    right: Expr
+
 
 class Parser:
     def __init__(self, code: str) -> None:
@@ -152,8 +185,63 @@ class Parser:
             stmts.append(self._parse_statement())
         return Program(stmts)
 
-    # Statement parsing is line-oriented and uses regex matching on the raw text per line for MVP
     def _parse_statement(self) -> Stmt:
+        line = self.tokens[self.i].line
+        stmt = self._parse_line()
+        stmt.line = line
+        if '{' in (getattr(stmt, 'name', None) or getattr(stmt, 'header', None) or ''):
+            stmt.templated = True
+        return stmt
+
+    def _parse_block(self, header_col: int) -> List[Stmt]:
+        # Statements on the following lines indented deeper than the header
+        body: List[Stmt] = []
+        while True:
+            while self._peek_kind("EOL"):
+                self._advance()
+            tok = self.tokens[self.i]
+            if tok.kind == "EOF" or tok.col <= header_col:
+                return body
+            body.append(self._parse_statement())
+
+    def _parse_body(self, header_col: int, what: str) -> List[Stmt]:
+        # A more indented block, or (1.1 style) just the statement on the next line
+        while self._peek_kind("EOL"):
+            self._advance()
+        if self._peek_kind("EOF"):
+            raise SyntaxError(f"Incomplete {what} block")
+        if self.tokens[self.i].col > header_col:
+            return self._parse_block(header_col)
+        return [self._parse_statement()]
+
+    def _parse_branch(self, text: str, header_col: int, line: int) -> Tuple[Optional[Expr], List[Stmt]]:
+        m = re.match(r"^(?:if|elif)\s+(.+?)\s*:\s*(?:then\s+(.+))?$", text, re.IGNORECASE)
+        if m:
+            cond: Optional[Expr] = self._parse_condition(m.group(1))
+            action = m.group(2)
+        else:
+            m = re.match(r"^else\s*:\s*(?:(?:then\s+)?(.+))?$", text, re.IGNORECASE)
+            if not m:
+                raise SyntaxError(f"Bad if syntax: {text}")
+            cond, action = None, m.group(1)
+        if action:
+            # Inline form: "if c: then action"
+            stmts = Parser(action).parse().statements
+            for stmt in stmts:
+                stmt.line = line
+            return cond, stmts
+        return cond, self._parse_block(header_col)
+
+    def _parse_condition(self, text: str) -> Expr:
+        # Only equality with '=' is supported
+        m = re.match(r"^(.+?)\s*=\s*(.+)$", text)
+        if not m:
+            raise SyntaxError(f"Bad if condition: {text}")
+        return Compare(self._parse_expr_from_text(m.group(1)), self._parse_expr_from_text(m.group(2)))
+
+    # Statement parsing is line-oriented and uses regex matching on the raw text per line for MVP
+    def _parse_line(self) -> Stmt:
+        header_col = self.tokens[self.i].col
         # For simplicity, reconstruct the remainder of the line from tokens until EOL
         line_tokens: List[Token] = []
         while not self._peek_kind("EOL") and not self._peek_kind("EOF"):
@@ -161,7 +249,7 @@ class Parser:
         # consume EOL if present
         if self._peek_kind("EOL"):
             self._advance()
-        text = "".join(t.text for t in line_tokens).strip()
+        text = self._line_text(line_tokens)
 
         # Start/Stop
         if text in ("Qude.prompt", "qude.str()", "q>"):
@@ -180,7 +268,7 @@ class Parser:
             return InputStmt(self._parse_expr_from_text(m.group(1)))
 
         # Assign: Qurr x = expr | qrr | q$
-        m = re.match(r"^(?:Qurr|qrr|q\$)\s+(\w+)\s*=\s*(.+)$", text)
+        m = re.match(r"^(?:Qurr|qrr|q\$)\s+([\w{}]+)\s*=\s*(.+)$", text)
         if m:
             return Assign(m.group(1), self._parse_expr_from_text(m.group(2)))
 
@@ -222,65 +310,118 @@ class Parser:
             return WindowBg(self._parse_expr_from_text(m.group(1)))
 
         # Insert text: insert.text('...') as name
-        m = re.match(r"^(?:insert\.text|ins\.txt|i\.tx)\((.*)\)\s+as\s+(\w+)$", text)
+        m = re.match(r"^(?:insert\.text|ins\.txt|i\.tx)\((.*)\)\s+as\s+([\w{}]+)$", text)
         if m:
             return InsertText(self._parse_expr_from_text(m.group(1)), m.group(2))
 
         # Insert button: insert.button() as name
-        m = re.match(r"^(?:insert\.button|ins\.btn|i\.bt)\(\)\s+as\s+(\w+)$", text)
+        m = re.match(r"^(?:insert\.button|ins\.btn|i\.bt)\(\)\s+as\s+([\w{}]+)$", text)
         if m:
             return InsertButton(m.group(1))
 
         # Insert input: insert.inputter() as name
-        m = re.match(r"^(?:insert\.inputter)\(\)\s+as\s+(\w+)$", text)
+        m = re.match(r"^(?:insert\.inputter)\(\)\s+as\s+([\w{}]+)$", text)
         if m:
             return InsertInput(m.group(1))
 
         # Widget ops
-        m = re.match(r"^(\w+)\.(?:text|txt|tx)\((.*)\)$", text)
+        m = re.match(r"^([\w{}]+)\.(?:text|txt|tx)\((.*)\)$", text)
         if m:
             return WidgetText(m.group(1), self._parse_expr_from_text(m.group(2)))
-        m = re.match(r"^(\w+)\.(?:text\.color|txt\.clr|t\$)\((.*)\)$", text)
+        m = re.match(r"^([\w{}]+)\.(?:text\.color|txt\.clr|t\$)\((.*)\)$", text)
         if m:
             return WidgetTextColor(m.group(1), self._parse_expr_from_text(m.group(2)))
-        m = re.match(r"^(\w+)\.(?:background\.color|bg\.clr|bgc)\((.*)\)$", text)
+        m = re.match(r"^([\w{}]+)\.(?:background\.color|bg\.clr|bgc)\((.*)\)$", text)
         if m:
             return WidgetBgColor(m.group(1), self._parse_expr_from_text(m.group(2)))
-        m = re.match(r"^(\w+)\.(?:font\.font|fnt\.font|ffnt)\((.*)\)$", text)
+        m = re.match(r"^([\w{}]+)\.(?:font\.font|fnt\.font|ffnt)\((.*)\)$", text)
         if m:
             return WidgetFontFamily(m.group(1), self._parse_expr_from_text(m.group(2)))
-        m = re.match(r"^(\w+)\.(?:size|font\.size|fnt\.sz|fsz)\s*=\s*(.*)$", text)
+        m = re.match(r"^([\w{}]+)\.(?:size|font\.size|fnt\.sz|fsz)\s*=\s*(.*)$", text)
         if m:
             return WidgetFontSize(m.group(1), self._parse_expr_from_text(m.group(2)))
-        m = re.match(r"^(\w+)\.(?:geometry\.size|geom\.sz|ge\.sz)\((.*)\)$", text)
+        m = re.match(r"^([\w{}]+)\.(?:geometry\.size|geom\.sz|ge\.sz)\((.*)\)$", text)
         if m:
             args = self._split_args(m.group(2))
             if len(args) != 2:
                 raise SyntaxError("geometry.size expects 2 args")
             return WidgetSize(m.group(1), self._parse_expr_from_text(args[0]), self._parse_expr_from_text(args[1]))
-        m = re.match(r"^(\w+)\.(?:cordinates|cordint|c\$)\((.*)\)$", text)
+        m = re.match(r"^([\w{}]+)\.(?:cordinates|cordint|c\$)\((.*)\)$", text)
         if m:
             args = self._split_args(m.group(2))
             if len(args) != 2:
                 raise SyntaxError("cordinates expects 2 args")
             return WidgetPos(m.group(1), self._parse_expr_from_text(args[0]), self._parse_expr_from_text(args[1]))
 
-        # Event block (MVP: header on this line; next non-empty line is single action)
+        # Event block: header on the next line, then its action or a more indented body
         if text == "event;":
-            # Gather next two logical lines from token stream (already consumed EOL)
+            while self._peek_kind("EOL"):
+                self._advance()
+            if self._peek_kind("EOF"):
+                raise SyntaxError("Incomplete event block")
+            event_col = self.tokens[self.i].col
             header = self._gather_next_line_text()
-            action = self._parse_statement()  # parse action as a normal statement
-            return EventBlock(header, action)
+            return EventBlock(header, self._parse_body(event_col, "event"))
+
+        # Timer block: every <ms>: / after <ms>: followed by an indented body
+        m = re.match(r"^(every|after)\s+(.+?)\s*:$", text, re.IGNORECASE)
+        if m:
+            kind = m.group(1).lower()
+            return TimerBlock(kind, self._parse_expr_from_text(m.group(2)), self._parse_body(header_col, kind))
+
+        # If chain: if/elif/else branches at the header's indentation, each either
+        # inline ("if c: then action") or with a more indented body ("if c:")
+        if re.match(r"^if\s", text, re.IGNORECASE):
+            branches = [self._parse_branch(text, header_col, line_tokens[0].line)]
+            while branches[-1][0] is not None:
+                while self._peek_kind("EOL"):
+                    self._advance()
+                tok = self.tokens[self.i]
+                if tok.col != header_col or tok.text.lower() not in ("elif", "else"):
+                    break
+                branches.append(self._parse_branch(self._gather_next_line_text(), header_col, tok.line))
+            return IfStmt(branches)
+        if re.match(r"^(?:elif|else)\b", text, re.IGNORECASE):
+            raise SyntaxError(f"{text.split()[0].rstrip(':')} without if")
+
+        # Loops: repeat N: / for i in a..b: followed by a more indented body
+        m = re.match(r"^repeat\s+(.+?)\s*:$", text, re.IGNORECASE)
+        if m:
+            return RepeatStmt(self._parse_expr_from_text(m.group(1)), self._parse_block(header_col))
+        m = re.match(r"^for\s+(\w+)\s+in\s+(.+?)\s*\.\.\s*(.+?)\s*:$", text, re.IGNORECASE)
+        if m:
+            return ForStmt(m.group(1), self._parse_expr_from_text(m.group(2)),
+                           self._parse_expr_from_text(m.group(3)), self._parse_block(header_col))
 
         # Fallback: unknown
         raise SyntaxError(f"Unrecognized syntax: {text}")
 
+    def _peek_kind(self, kind: str) -> bool:
+        return self.tokens[self.i].kind == kind
+
+    def _advance(self) -> Token:
+        tok = self.tokens[self.i]
+        if self.i < len(self.tokens) - 1:
+            self.i += 1
+        return tok
+
     def _gather_next_line_text(self) -> str:
-        parts: List[str] = []
+        parts: List[Token] = []
         while not self._peek_kind("EOL") and not self._peek_kind("EOF"):
-            parts.append(self._advance().text)
+            parts.append(self._advance())
         if self._peek_kind("EOL"):
             self._advance()
+        return self._line_text(parts)
+
+    def _line_text(self, tokens: List[Token]) -> str:
+        # Rebuild the source line, keeping a single space wherever tokens were separated
+        parts: List[str] = []
+        prev_end = None
+        for t in tokens:
+            if prev_end is not None and t.col > prev_end:
+                parts.append(" ")
+            parts.append(t.text)
+            prev_end = t.col + len(t.text)
         return "".join(parts).strip()
 
     def _split_args(self, s: str) -> List[str]:
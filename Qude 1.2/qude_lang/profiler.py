@@ -0,0 +1,109 @@
+from __future__ import annotations
+import json
+import re
+from typing import Any, Dict, List, Tuple
+
+# Opt-in per-statement profiler shared by both engines. Attach an instance as
+# `interpreter.profiler`; each executed statement is recorded with its source line,
+# statement kind and inclusive time (expression evaluation and Tk calls included).
+# Event handler time is recorded under an "event <header>" frame.
+
+_KIND_RE = re.compile(r"^\s*([A-Za-z_£$;<>/.]+?)\s*(?:\(|=|\s|$)")
+
+
+class LineStat:
+    __slots__ = ("line", "kind", "calls", "seconds")
+
+    def __init__(self, line: int, kind: str) -> None:
+        self.line = line
+        self.kind = kind
+        self.calls = 0
+        self.seconds = 0.0
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.lines: Dict[int, LineStat] = {}
+        self.kinds: Dict[str, List[float]] = {}  # kind -> [calls, seconds]
+        self.stacks: Dict[Tuple[str, str], float] = {}
+        self.phases: Dict[str, float] = {}
+        self._kind_cache: Dict[str, str] = {}
+
+    # ---- recording ----
+    def kind_of(self, text: str) -> str:
+        # Legacy engine: statement kind is the leading keyword, with widget names folded
+        kind = self._kind_cache.get(text)
+        if kind is None:
+            m = _KIND_RE.match(text)
+            kind = m.group(1) if m else text.strip()[:24]
+            head, dot, tail = kind.partition(".")
+            if dot and head not in ("Qonsol", "qonsol", "qons", "Qwindow", "qwd", "qw", "taQe", "tq",
+                                    "Qude", "qude", "insert", "ins", "i", "warn", "Wwindow"):
+                kind = "<widget>." + tail
+            self._kind_cache[text] = kind
+        return kind
+
+    def record(self, line: int, kind: str, seconds: float, frame: str = "run") -> None:
+        st = self.lines.get(line)
+        if st is None:
+            st = self.lines[line] = LineStat(line, kind)
+        st.calls += 1
+        st.seconds += seconds
+        k = self.kinds.get(kind)
+        if k is None:
+            k = self.kinds[kind] = [0, 0.0]
+        k[0] += 1
+        k[1] += seconds
+        key = (frame, f"line {line} {kind}")
+        self.stacks[key] = self.stacks.get(key, 0.0) + seconds
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    # ---- results ----
+    def hot_lines(self) -> List[LineStat]:
+        return sorted(self.lines.values(), key=lambda s: s.seconds, reverse=True)
+
+    def total_seconds(self) -> float:
+        return sum(s.seconds for s in self.lines.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_seconds": self.total_seconds(),
+            "phases": dict(self.phases),
+            "lines": [
+                {"line": s.line, "kind": s.kind, "calls": s.calls, "seconds": s.seconds}
+                for s in self.hot_lines()
+            ],
+            "kinds": [
+                {"kind": k, "calls": int(v[0]), "seconds": v[1]}
+                for k, v in sorted(self.kinds.items(), key=lambda kv: kv[1][1], reverse=True)
+            ],
+        }
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def collapsed(self) -> List[str]:
+        # flamegraph.pl / speedscope "collapsed" format, weights in microseconds
+        out: List[str] = []
+        for name, seconds in self.phases.items():
+            out.append(f"qude;{name} {max(1, int(seconds * 1e6))}")
+        for (frame, leaf), seconds in sorted(self.stacks.items()):
+            frame = frame.replace(";", ",")
+            leaf = leaf.replace(";", ",")
+            out.append(f"qude;{frame};{leaf} {max(1, int(seconds * 1e6))}")
+        return out
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.collapsed()) + "\n")
+
+
+def format_duration(seconds: float) -> str:
+    if seconds >= 1.0:
+        return f"{seconds:.2f}s"
+    if seconds >= 0.001:
+        return f"{seconds * 1e3:.1f}ms"
+    return f"{seconds * 1e6:.0f}µs"
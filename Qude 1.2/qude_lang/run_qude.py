@@ -1,43 +1,94 @@
 from __future__ import annotations
+import argparse
 import sys
-import tkinter as tk
+import time
+from typing import List, Optional
 from .parser import Parser
 from .interpreter import QudeAstInterpreter
+from .profiler import Profiler
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="python -m qude.qude_lang.run_qude",
+        description="Run a single Qude script",
+    )
+    ap.add_argument("script", help="path to a .q script")
+    ap.add_argument("--headless", action="store_true", help="run without a display (qude_lang.headless backend)")
+    ap.add_argument("--engine", choices=("ast", "legacy"), default="ast", help="interpreter to use (default: ast)")
+    ap.add_argument("--duration", type=float, default=0, metavar="MS",
+                    help="headless only: virtual time to keep running timers for after the script ends")
+    ap.add_argument("--profile", metavar="FILE",
+                    help="write a per-line profile: .json, or collapsed stacks for any other extension")
+    args = ap.parse_args(argv)
+    profiler = Profiler() if args.profile else None
 
-def main() -> int:
-    if len(sys.argv) < 2:
-        print("Usage: python -m qude.qude_lang.run_qude <script.q>")
-        return 1
-    script_path = sys.argv[1]
     try:
-        with open(script_path, 'r', encoding='utf-8') as f:
+        with open(args.script, 'r', encoding='utf-8') as f:
             code = f.read()
     except Exception as e:
         print(f"[Error] Cannot read script: {e}")
         return 2
 
-    root = tk.Tk()
+    if args.headless:
+        from . import headless as backend
+    else:
+        import tkinter as backend  # type: ignore[no-redef]
+    root = backend.Tk()
     try:
         root.withdraw()
     except Exception:
         pass
 
     def cw(msg: str) -> None:
-        print(msg)
+        print(msg, flush=True)
 
-    try:
-        program = Parser(code).parse()
-    except Exception as e:
-        print(f"[Error] Parse: {e}")
-        return 3
+    def read_answer(prompt: str) -> str:
+        # Headless input: one line per taQe.putt from stdin, empty at EOF
+        return sys.stdin.readline().rstrip("\r\n")
+
+    if args.engine == "legacy":
+        from ..interpreter import QudeInterpreter
+        try:
+            interp = QudeInterpreter(cw, root, backend=backend)
+            interp.profiler = profiler
+            if args.headless:
+                interp.input_provider = read_answer
+            interp.run(code)
+        except Exception as e:
+            print(f"[Error] Run: {e}")
+            return 4
+    else:
+        try:
+            t0 = time.perf_counter()
+            program = Parser(code).parse()
+            if profiler is not None:
+                profiler.add_phase("parse", time.perf_counter() - t0)
+        except Exception as e:
+            print(f"[Error] Parse: {e}")
+            return 3
+        try:
+            interp = QudeAstInterpreter(cw, root, backend=backend)
+            interp.profiler = profiler
+            if args.headless:
+                interp.input_provider = read_answer
+            interp.run(program)
+        except Exception as e:
+            print(f"[Error] Run: {e}")
+            return 4
 
     try:
-        interp = QudeAstInterpreter(cw, root)
-        interp.run(program)
-        root.mainloop()
+        if args.headless:
+            root.mainloop(duration_ms=args.duration)
+        else:
+            root.mainloop()
     except Exception as e:
         print(f"[Error] Run: {e}")
         return 4
+    if profiler is not None:
+        if args.profile.lower().endswith(".json"):
+            profiler.write_json(args.profile)
+        else:
+            profiler.write_collapsed(args.profile)
     return 0
 
 if __name__ == "__main__":
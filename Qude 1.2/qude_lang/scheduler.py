@@ -0,0 +1,129 @@
+from __future__ import annotations
+import heapq
+import itertools
+import math
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+# Timers for `every <ms>:` / `after <ms>:` blocks. All timers share one heap and a
+# single Tk after() callback armed for the earliest deadline, so thousands of timers
+# cost one pending Tk timer. Due actions are handed to `dispatch` (the engine's event
+# queue), which runs them under the frame budget and coalesces a timer whose previous
+# firing has not run yet.
+#
+# `every` keeps a fixed rate: the next deadline is the previous one plus the interval,
+# so lateness does not accumulate. Periods missed entirely are skipped and counted as
+# overruns; lateness of each firing is recorded as drift.
+
+Action = Callable[[], None]
+
+
+class Timer:
+    __slots__ = ("due", "interval", "action", "label", "cancelled", "fired")
+
+    def __init__(self, due: float, interval: float, action: Action, label: str) -> None:
+        self.due = due
+        self.interval = interval  # 0 = one-shot
+        self.action = action
+        self.label = label
+        self.cancelled = False
+        self.fired = 0
+
+
+def _clock_for(root: Any) -> Callable[[], float]:
+    # Milliseconds; the headless backend runs timers on its own virtual clock
+    if hasattr(root, "now_ms"):
+        return lambda: root.now_ms
+    return lambda: time.perf_counter() * 1000.0
+
+
+class Scheduler:
+    def __init__(self, root: Any, dispatch: Callable[[Action], None], metrics: Any = None) -> None:
+        self.root = root
+        self.dispatch = dispatch
+        self.metrics = metrics
+        self.clock = _clock_for(root)
+        self._heap: List[Tuple[float, int, Timer]] = []
+        self._seq = itertools.count()
+        self._job: Optional[str] = None
+        self._armed_for: Optional[float] = None
+
+    def every(self, ms: float, action: Action, label: str = "") -> Timer:
+        if ms <= 0:
+            raise ValueError("every needs a positive interval")
+        return self._add(Timer(self.clock() + ms, float(ms), action, label))
+
+    def after(self, ms: float, action: Action, label: str = "") -> Timer:
+        return self._add(Timer(self.clock() + max(0.0, ms), 0.0, action, label))
+
+    def cancel(self, timer: Timer) -> None:
+        # Lazy removal: the heap entry is dropped when it reaches the top
+        timer.cancelled = True
+
+    def clear(self) -> None:
+        for _due, _seq, timer in self._heap:
+            timer.cancelled = True
+        self._heap.clear()
+        self._disarm()
+
+    def __len__(self) -> int:
+        return sum(1 for _d, _s, t in self._heap if not t.cancelled)
+
+    def _add(self, timer: Timer) -> Timer:
+        heapq.heappush(self._heap, (timer.due, next(self._seq), timer))
+        self._arm()
+        return timer
+
+    def _disarm(self) -> None:
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                pass
+        self._job = None
+        self._armed_for = None
+
+    def _arm(self) -> None:
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        if not heap:
+            self._disarm()
+            return
+        due = heap[0][0]
+        if self._armed_for is not None and self._armed_for <= due:
+            return  # the pending tick comes first anyway
+        self._disarm()
+        delay = max(0, math.ceil(due - self.clock()))
+        self._armed_for = due
+        self._job = self.root.after(delay, self._tick)
+
+    def _tick(self) -> None:
+        self._job = None
+        self._armed_for = None
+        now = self.clock()
+        heap = self._heap
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.timer_ticks += 1
+        try:
+            while heap and heap[0][0] <= now:
+                due, _seq, timer = heapq.heappop(heap)
+                if timer.cancelled:
+                    continue
+                timer.fired += 1
+                if metrics is not None:
+                    metrics.timer_fires += 1
+                    metrics.timer_drift.observe((now - due) / 1000.0)
+                if timer.interval > 0:
+                    nxt = due + timer.interval
+                    if nxt <= now:
+                        missed = math.floor((now - nxt) / timer.interval) + 1
+                        nxt += missed * timer.interval
+                        if metrics is not None:
+                            metrics.timer_overruns += missed
+                    timer.due = nxt
+                    heapq.heappush(heap, (nxt, next(self._seq), timer))
+                self.dispatch(timer.action)
+        finally:
+            self._arm()
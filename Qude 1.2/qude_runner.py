@@ -0,0 +1,80 @@
+import os
+import struct
+import sys
+import zlib
+from typing import Optional
+
+# Entry point of the prebuilt runner executable ("stub"). The Qude program is not
+# baked into the build: it is read at start-up from a payload appended to the
+# executable, or from a <name>.qpak file placed next to it.
+
+PAYLOAD_MAGIC = b"QUDEPAY1"
+# payload length + magic, written after the compressed script
+_TRAILER = struct.Struct("<Q8s")
+
+
+def pack_payload(code: str) -> bytes:
+    data = zlib.compress(code.encode("utf-8"), 9)
+    return data + _TRAILER.pack(len(data), PAYLOAD_MAGIC)
+
+
+def read_payload(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size < _TRAILER.size:
+                return None
+            f.seek(size - _TRAILER.size)
+            length, magic = _TRAILER.unpack(f.read(_TRAILER.size))
+            if magic != PAYLOAD_MAGIC or length > size - _TRAILER.size:
+                return None
+            f.seek(size - _TRAILER.size - length)
+            return zlib.decompress(f.read(length)).decode("utf-8")
+    except Exception:
+        return None
+
+
+def sidecar_path(exe_path: str) -> str:
+    return os.path.splitext(exe_path)[0] + ".qpak"
+
+
+def load_program(exe_path: str) -> Optional[str]:
+    # A sidecar file wins so a script can be swapped without touching the exe
+    side = sidecar_path(exe_path)
+    if os.path.exists(side):
+        return read_payload(side)
+    return read_payload(exe_path)
+
+
+def main() -> int:
+    import tkinter as tk
+    from .interpreter import QudeInterpreter
+
+    # Frozen: payload lives on the exe itself; from source: python -m qude.qude_runner app.qpak
+    target = sys.argv[1] if len(sys.argv) > 1 and not getattr(sys, "frozen", False) else sys.executable
+    code = load_program(target)
+    if code is None:
+        print("[Error] Qude program payload not found")
+        return 1
+
+    root = tk.Tk()
+    try:
+        root.withdraw()
+    except Exception:
+        pass
+
+    def cw(msg: str) -> None:
+        print(msg)
+
+    interp = QudeInterpreter(cw, root)
+    interp.preview_mode = False
+    interp.preview_root = None
+    interp.window = None
+    interp.run(code)
+    root.mainloop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,159 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
+try:
+    from .paths import user_cache_dir
+    from .publish import BackgroundJob, _no_window_flags
+except ImportError:
+    # Run as a script: qude.* means the modules next to this file, not the root qude/
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import _bootstrap  # noqa: F401
+    from qude.paths import user_cache_dir
+    from qude.publish import BackgroundJob, _no_window_flags
+
+# "Ayrı süreçte çalıştır": the IDE writes the script to a file and runs it in a
+# child Python process with its own Tk root. The child's console output comes
+# back line by line over a pipe; Stop kills the child.
+
+
+def child_command(script_path: str, icon_path: Optional[str] = None, limits: Optional[Dict[str, Any]] = None) -> List[str]:
+    if getattr(sys, "frozen", False):
+        # Frozen IDE: the exe dispatches "run" through main.py
+        cmd = [sys.executable, "run", script_path]
+    else:
+        # Through _bootstrap, so the child runs this engine whatever qude/ is on sys.path
+        here = os.path.dirname(os.path.abspath(__file__))
+        cmd = [sys.executable, "-u", os.path.join(here, "_bootstrap.py"), "qude.script_process", script_path]
+    if icon_path:
+        cmd += ["--icon", icon_path]
+    for name, value in (limits or {}).items():
+        cmd += ["--limit", f"{name}={value}"]
+    return cmd
+
+
+def _child_env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONIOENCODING"] = "utf-8"
+    env["PYTHONUNBUFFERED"] = "1"
+    return env
+
+
+class ScriptRunJob(BackgroundJob):
+    thread_name = "qude-run"
+    cancelled_message = "Çalıştırma durduruldu."
+
+    def __init__(self, code: str, icon_path: Optional[str] = None, limits: Any = None) -> None:
+        super().__init__()
+        self.code = code
+        self.icon_path = icon_path
+        # Watchdog settings of the IDE's interpreter (qude_lang.limits.Limits)
+        self.limits = asdict(limits) if limits is not None else None
+        self._proc: Optional[subprocess.Popen] = None
+
+    def cancel(self) -> None:
+        super().cancel()
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+
+    def _build(self) -> str:
+        fd, path = tempfile.mkstemp(suffix=".q", prefix="run-", dir=user_cache_dir("run"))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.code)
+            self._proc = subprocess.Popen(
+                child_command(path, self.icon_path, self.limits),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+                env=_child_env(),
+                creationflags=_no_window_flags(),
+            )
+            if self._cancel.is_set():
+                self.cancel()
+            assert self._proc.stdout is not None
+            for ln in self._proc.stdout:
+                self._emit("line", ln.rstrip("\r\n"))
+            code = self._proc.wait()
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._check_cancel()
+        if code != 0:
+            raise RuntimeError(f"Program hata koduyla bitti ({code}).")
+        return "Program sona erdi."
+
+
+# ---- child side ----
+def main(argv: Optional[List[str]] = None) -> int:
+    import tkinter as tk
+    try:
+        from .interpreter import QudeInterpreter
+    except ImportError:
+        # Run as a script: the fallback at the top registered this directory as qude
+        from qude.interpreter import QudeInterpreter
+
+    parser = argparse.ArgumentParser(prog="qude run", description="Run a Qude script in its own window")
+    parser.add_argument("script")
+    parser.add_argument("--icon", default=None)
+    parser.add_argument("--limit", action="append", default=[], metavar="NAME=VALUE")
+    args = parser.parse_args(argv)
+    try:
+        with open(args.script, "r", encoding="utf-8") as f:
+            code = f.read()
+    except Exception as e:
+        print(f"[Error] Cannot read script: {e}", flush=True)
+        return 2
+
+    root = tk.Tk()
+    try:
+        root.withdraw()
+    except Exception:
+        pass
+
+    def cw(msg: str) -> None:
+        print(msg, flush=True)
+
+    interp = QudeInterpreter(cw, root, icon_bitmap_path=args.icon)
+    for item in args.limit:
+        name, _, value = item.partition("=")
+        current = getattr(interp.limits, name, None)
+        if current is not None:
+            setattr(interp.limits, name, type(current)(float(value)))
+
+    def finished() -> None:
+        window = interp.window
+        if window is None or not window.winfo_exists():
+            # Nothing on screen: the program is finished
+            root.destroy()
+            return
+        # Closing the app window ends the process
+        window.protocol("WM_DELETE_WINDOW", root.destroy)
+
+    try:
+        interp.run(code, on_done=finished)
+    except Exception as e:
+        print(f"[Error] {e}", flush=True)
+        return 4
+    try:
+        root.mainloop()
+    except tk.TclError:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,46 @@
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+# Wall-clock timings of IDE startup, printed with `--profile-startup`. Offsets are
+# measured from t0, which main.py takes before importing the IDE, so "imports" and
+# "first paint" are relative to a cold start of the entry point.
+class StartupProfile:
+    def __init__(self, t0: float | None = None, enabled: bool = False) -> None:
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.enabled = enabled
+        # (name, start offset, duration) in seconds; marks have no duration
+        self.phases: list[tuple[str, float, float | None]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.phases.append((f"{name} (failed)", start - self.t0, time.perf_counter() - start))
+            raise
+        self.phases.append((name, start - self.t0, time.perf_counter() - start))
+
+    def mark(self, name: str) -> None:
+        self.phases.append((name, time.perf_counter() - self.t0, None))
+
+    def report(self) -> str:
+        lines = ["Startup profile (ms from entry point):"]
+        for name, offset, duration in self.phases:
+            took = f"{duration * 1000:9.1f} ms" if duration is not None else " " * 12
+            lines.append(f"  {offset * 1000:9.1f}  {took}  {name}")
+        return "\n".join(lines)
+
+    def emit(self, console_write=None) -> None:
+        if not self.enabled:
+            return
+        text = self.report()
+        # Windowed builds have no stderr; the IDE console always gets a copy
+        if sys.stderr is not None:
+            print(text, file=sys.stderr, flush=True)
+        if console_write is not None:
+            for line in text.splitlines():
+                console_write(line)
@@ -0,0 +1,411 @@
+import argparse
+import importlib.util
+import json
+import logging
+import logging.handlers
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Benchmark suite for the Qude toolchain.
+#
+#   python benchmarks/bench.py                        # all cases, 100..100k lines
+#   python benchmarks/bench.py --quick                # 100 and 1k lines only
+#   python benchmarks/bench.py --save-baseline base.json
+#   python benchmarks/bench.py --baseline base.json   # compare, flag regressions
+#
+# Results are written to bench_output.txt at the repository root. Interpreters run
+# on the headless backend. The highlighter and console cases use a real Tk Text
+# widget when a display is available and otherwise a no-op Text stand-in, which
+# still measures the Python side (regex scanning, index conversion, batching).
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+PKG_DIR = os.path.join(REPO, "Qude 1.2")
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+QUICK_SIZES = (100, 1_000)
+DEFAULT_THRESHOLD = 1.25
+# Slowdowns smaller than this are timer noise and never reported as regressions
+NOISE_FLOOR_S = 0.001
+
+sys.path.insert(0, HERE)
+from scripts import generate  # noqa: E402
+
+
+def load_qude() -> Any:
+    # The package lives in "Qude 1.2" (not importable by name) and an older qude/
+    # package sits at the repo root, so register it as "qude" explicitly
+    mod = sys.modules.get("qude")
+    if mod is not None and os.path.dirname(getattr(mod, "__file__", "") or "") == PKG_DIR:
+        return mod
+    spec = importlib.util.spec_from_file_location(
+        "qude", os.path.join(PKG_DIR, "__init__.py"), submodule_search_locations=[PKG_DIR]
+    )
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["qude"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def timeit(fn: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> List[float]:
+    # The first run warms imports and regex caches and is not counted
+    times: List[float] = []
+    for _ in range(repeat + 1):
+        arg = setup() if setup is not None else None
+        t0 = time.perf_counter()
+        fn() if setup is None else fn(arg)
+        times.append(time.perf_counter() - t0)
+    return times[1:]
+
+
+# ---------- cases ----------
+def _unlimited() -> Any:
+    from qude.qude_lang.limits import Limits
+    return Limits(0, 0, 0, 0, 0)
+
+
+def _headless_interp(engine: str) -> Tuple[Any, Any, List[str]]:
+    from qude.qude_lang import headless
+    out: List[str] = []
+    root = headless.Tk()
+    if engine == "legacy":
+        from qude.interpreter import QudeInterpreter
+        interp = QudeInterpreter(out.append, root, backend=headless)
+    else:
+        from qude.qude_lang.interpreter import QudeAstInterpreter
+        interp = QudeAstInterpreter(out.append, root, backend=headless)
+    # Run to completion in one slice and never hit the watchdog
+    interp.slice_statements = 0
+    interp.slice_ms = 0
+    interp.limits = _unlimited()
+    interp.input_provider = lambda prompt: ""
+    return interp, root, out
+
+
+def _fire_all(interp: Any) -> int:
+    # One click per clickable widget and one edit per inputter (MatchEvent traces)
+    from qude.qude_lang import headless
+    fired = 0
+    for w in list(interp.widgets.values()):
+        if isinstance(w, headless.Entry):
+            w.delete(0, "end")
+            w.insert(0, "ok0")
+            fired += 1
+        for seq in ("<Button-1>", "<KeyRelease>"):
+            if w._bindings.get(seq):
+                w.event_generate(seq)
+                fired += 1
+    # Handlers are queued by the Tk callbacks; run them now rather than on the next tick
+    interp.events.queue.flush()
+    return fired
+
+
+def case_lexer(code: str, repeat: int) -> List[float]:
+    from qude.qude_lang.lexer import Lexer
+    return timeit(lambda: Lexer(code).tokenize(), repeat)
+
+
+def case_parser(code: str, repeat: int) -> List[float]:
+    from qude.qude_lang.parser import Parser
+    return timeit(lambda: Parser(code).parse(), repeat)
+
+
+def case_run_legacy(code: str, repeat: int) -> List[float]:
+    return timeit(lambda env: env[0].run(code), repeat, setup=lambda: _headless_interp("legacy"))
+
+
+def case_run_ast(code: str, repeat: int) -> List[float]:
+    from qude.qude_lang.parser import Parser
+    program = Parser(code).parse()
+    return timeit(lambda env: env[0].run(program), repeat, setup=lambda: _headless_interp("ast"))
+
+
+def _events_setup(engine: str, code: str) -> Any:
+    env = _headless_interp(engine)
+    if engine == "legacy":
+        env[0].run(code)
+    else:
+        from qude.qude_lang.parser import Parser
+        env[0].run(Parser(code).parse())
+    return env
+
+
+def case_events_legacy(code: str, repeat: int) -> List[float]:
+    return timeit(lambda env: _fire_all(env[0]), repeat, setup=lambda: _events_setup("legacy", code))
+
+
+def case_events_ast(code: str, repeat: int) -> List[float]:
+    return timeit(lambda env: _fire_all(env[0]), repeat, setup=lambda: _events_setup("ast", code))
+
+
+class _TextStandIn:
+    # Accepts the Text calls the highlighter and console make and does nothing
+    def __init__(self) -> None:
+        self.content = ""
+        self.tk = self
+
+    def eval(self, script: str) -> str:
+        return ""
+
+    def get(self, start: str, end: str) -> str:
+        return self.content + "\n"
+
+    def insert(self, index: str, *args: Any) -> None:
+        pass
+
+    def index(self, index: str) -> str:
+        return "1.0"
+
+    def tag_add(self, tag: str, *indices: str) -> None:
+        pass
+
+    def tag_configure(self, tag: str, **kw: Any) -> None:
+        pass
+
+    def tag_raise(self, *args: Any) -> None:
+        pass
+
+    def bind(self, *args: Any, **kw: Any) -> None:
+        pass
+
+    def delete(self, *args: Any) -> None:
+        pass
+
+    def see(self, index: str) -> None:
+        pass
+
+    def configure(self, **kw: Any) -> None:
+        pass
+
+
+class IdeHarness:
+    # Just enough of a QudeIDE to drive _highlight_all and the console buffer
+    def __init__(self) -> None:
+        import tkinter as tk
+        from qude.ide import QudeIDE, CONSOLE_MAX_LINES
+        self.real_tk = True
+        try:
+            root = tk.Tk()
+            root.withdraw()
+        except tk.TclError:
+            root = None
+            self.real_tk = False
+        ide = QudeIDE.__new__(QudeIDE)
+        ide.root = root
+        if root is not None:
+            ide.editor = tk.Text(root)
+            ide.console = tk.Text(root)
+        else:
+            ide.editor = _TextStandIn()
+            ide.console = _TextStandIn()
+        ide._setup_editor_highlight()
+        ide._console_pending = []
+        ide._console_flush_job = None
+        ide.console_max_lines = CONSOLE_MAX_LINES
+        # Keep console.log writes out of the user's cache directory
+        self._logdir = tempfile.TemporaryDirectory()
+        ide.console_log_path = None
+        handler = logging.handlers.RotatingFileHandler(os.path.join(self._logdir.name, "console.log"), encoding="utf-8")
+        logger = logging.getLogger(f"qude.bench.{id(ide)}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        ide._console_logger = logger
+        if root is None:
+            # No event loop: flush explicitly at the end of each batch
+            ide.root = _NoLoopRoot()
+        self.ide = ide
+
+    def set_editor(self, code: str) -> None:
+        if self.real_tk:
+            self.ide.editor.delete("1.0", "end")
+            self.ide.editor.insert("1.0", code)
+        else:
+            self.ide.editor.content = code
+
+    def update(self) -> None:
+        if self.real_tk:
+            self.ide.root.update_idletasks()
+
+    @property
+    def note(self) -> str:
+        return "" if self.real_tk else "no display, Text stand-in"
+
+
+class _NoLoopRoot:
+    def after(self, ms: int, func: Callable, *args: Any) -> str:
+        return "after#0"
+
+
+_harness: Optional[IdeHarness] = None
+
+
+def harness() -> IdeHarness:
+    global _harness
+    if _harness is None:
+        _harness = IdeHarness()
+    return _harness
+
+
+def case_highlight(code: str, repeat: int) -> List[float]:
+    h = harness()
+    h.set_editor(code)
+
+    def run() -> None:
+        h.ide._highlight_all()
+        h.update()
+    return timeit(run, repeat)
+
+
+def case_console(code: str, repeat: int) -> List[float]:
+    # One console line per script line, written the way the interpreter does
+    h = harness()
+    lines = code.splitlines()
+
+    def run() -> None:
+        write = h.ide._console_write
+        for line in lines:
+            write(line)
+        h.ide._flush_console()
+        h.update()
+    return timeit(run, repeat)
+
+
+CASES: Dict[str, Callable[[str, int], List[float]]] = {
+    "lexer": case_lexer,
+    "parser": case_parser,
+    "run.legacy": case_run_legacy,
+    "run.ast": case_run_ast,
+    "events.legacy": case_events_legacy,
+    "events.ast": case_events_ast,
+    "highlight": case_highlight,
+    "console": case_console,
+}
+
+
+# ---------- reporting ----------
+def run_suite(cases: List[str], sizes: List[int], repeat: int,
+              log: Callable[[str], None]) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    scripts = {n: generate(n) for n in sizes}
+    for name in cases:
+        for n in sizes:
+            # Large inputs are slow enough that fewer repeats are just as stable
+            reps = repeat if n < 100_000 else max(1, min(repeat, 3))
+            try:
+                times = CASES[name](scripts[n], reps)
+            except Exception as e:
+                results.append({"case": name, "lines": n, "error": str(e)})
+                log(_format_row(results[-1]))
+                continue
+            res = {
+                "case": name,
+                "lines": n,
+                "repeat": reps,
+                "min": min(times),
+                "median": statistics.median(times),
+                "lines_per_s": n / min(times) if min(times) > 0 else 0.0,
+            }
+            if name in ("highlight", "console") and harness().note:
+                res["note"] = harness().note
+            results.append(res)
+            log(_format_row(res))
+    return results
+
+
+def _format_row(r: Dict[str, Any], base: Optional[Dict[str, Any]] = None,
+                threshold: float = DEFAULT_THRESHOLD) -> str:
+    if "error" in r:
+        return f"{r['case']:14} {r['lines']:>7}  ERROR {r['error']}"
+    row = (f"{r['case']:14} {r['lines']:>7}  median {r['median'] * 1e3:10.2f}ms"
+           f"  min {r['min'] * 1e3:10.2f}ms  {r['lines_per_s']:>12,.0f} lines/s")
+    if base is not None and base.get("min", 0) > 0:
+        ratio = r["min"] / base["min"]
+        flag = "  REGRESSION" if _regressed(r, base, threshold) else ("  faster" if ratio < 1 / threshold else "")
+        row += f"  x{ratio:5.2f} vs baseline{flag}"
+    if r.get("note"):
+        row += f"  ({r['note']})"
+    return row
+
+
+def _regressed(r: Dict[str, Any], base: Dict[str, Any], threshold: float) -> bool:
+    if base.get("min", 0) <= 0:
+        return False
+    return r["min"] / base["min"] > threshold and r["min"] - base["min"] > NOISE_FLOOR_S
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any],
+            threshold: float) -> Tuple[List[str], int]:
+    index = {(b["case"], b["lines"]): b for b in baseline.get("results", [])}
+    rows: List[str] = []
+    regressions = 0
+    for r in results:
+        base = None if "error" in r else index.get((r["case"], r["lines"]))
+        rows.append(_format_row(r, base, threshold))
+        if base is not None and _regressed(r, base, threshold):
+            regressions += 1
+    return rows, regressions
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Qude benchmark suite")
+    ap.add_argument("--case", action="append", choices=sorted(CASES), help="case to run (repeatable, default: all)")
+    ap.add_argument("--sizes", type=lambda s: [int(x) for x in s.split(",")],
+                    help="comma separated script sizes in lines")
+    ap.add_argument("--quick", action="store_true", help=f"only sizes {', '.join(map(str, QUICK_SIZES))}")
+    ap.add_argument("-r", "--repeat", type=int, default=5, help="timed runs per case (best and median are kept)")
+    ap.add_argument("-o", "--output", default=os.path.join(REPO, "bench_output.txt"))
+    ap.add_argument("--save-baseline", metavar="FILE", help="write results as a JSON baseline")
+    ap.add_argument("--baseline", metavar="FILE", help="compare against a saved baseline")
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                    help="slowdown ratio (best time vs baseline) reported as a regression")
+    args = ap.parse_args(argv)
+
+    load_qude()
+    cases = args.case or list(CASES)
+    sizes = args.sizes or list(QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    env = environment()
+    print(f"Python {env['python']} ({env['implementation']}) on {env['platform']}", flush=True)
+    results = run_suite(cases, sizes, max(1, args.repeat), lambda s: print(s, flush=True))
+
+    report = [f"# Qude benchmarks, {time.strftime('%Y-%m-%d %H:%M:%S')}",
+              f"# Python {env['python']} ({env['implementation']}) on {env['platform']}"]
+    regressions = 0
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows, regressions = compare(results, baseline, args.threshold)
+        report.append(f"# baseline: {args.baseline} (threshold x{args.threshold:g})")
+        report.extend(rows)
+        report.append(f"# {regressions} regression(s)")
+        print("\n".join(rows))
+        print(f"{regressions} regression(s) vs {args.baseline}")
+    else:
+        report.extend(_format_row(r) for r in results)
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write("\n".join(report) + "\n")
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({"environment": env, "results": results}, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+    failed = any("error" in r for r in results)
+    return 1 if regressions or failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
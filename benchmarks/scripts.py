@@ -0,0 +1,90 @@
+import random
+from typing import List
+
+# Synthetic Qude programs for the benchmark suite. The statement mix roughly follows
+# hand-written apps: widget creation, property setting, arithmetic, console output
+# and event blocks. Output is deterministic for a given (lines, seed).
+
+COLORS = ["'#ff0000'", "'#00ff00'", "'#2979ff'", "'#222222'", "'#ffd54f'"]
+# Names are reused so large scripts keep a bounded set of live widget names
+NAME_POOL = 200
+
+
+def _widget_block(rng: random.Random, n: int) -> List[str]:
+    i = n % NAME_POOL
+    kind = rng.randrange(3)
+    if kind == 0:
+        return [
+            f"insert.text('Label {n}') as t{i}",
+            f"t{i}.text.color({rng.choice(COLORS)})",
+            f"t{i}.cordinates({rng.randrange(400)}, {rng.randrange(300)})",
+        ]
+    if kind == 1:
+        return [
+            f"insert.button() as b{i}",
+            f"b{i}.text('Click {n}')",
+            f"b{i}.geometry.size({rng.randrange(40, 120)}, {rng.randrange(20, 40)})",
+            f"b{i}.cordinates({rng.randrange(400)}, {rng.randrange(300)})",
+        ]
+    return [
+        f"insert.inputter() as in{i}",
+        f"in{i}.cordinates({rng.randrange(400)}, {rng.randrange(300)})",
+    ]
+
+
+def _property_block(rng: random.Random, n: int) -> List[str]:
+    i = rng.randrange(min(n + 1, NAME_POOL))
+    return [
+        f"t{i}.background.color({rng.choice(COLORS)})",
+        f"b{i}.text.color({rng.choice(COLORS)})",
+    ]
+
+
+def _arith_block(rng: random.Random, n: int) -> List[str]:
+    k = n % 50
+    return [
+        f"Qurr v{k} = {rng.randrange(100)} + {rng.randrange(100)}",
+        f"Qurr w{k} = v{k} * {rng.randrange(1, 9)}",
+        f"Qonsol.write(w{k})",
+    ]
+
+
+def _event_block(rng: random.Random, n: int) -> List[str]:
+    i = n % NAME_POOL
+    if rng.randrange(4) == 0:
+        return [
+            f"insert.inputter() as in{i}",
+            "event;",
+            f"    in{i}.MatchEvent == 'ok{rng.randrange(5)}':",
+            f"    Qonsol.write('match {n}')",
+        ]
+    return [
+        f"insert.button() as b{i}",
+        "event;",
+        f"    b{i}.LeftClickEvent:",
+        f"    Qonsol.write('clicked {n}')",
+    ]
+
+
+BLOCKS = [
+    (_widget_block, 4),
+    (_property_block, 2),
+    (_arith_block, 3),
+    (_event_block, 1),
+]
+
+
+def generate(lines: int, seed: int = 1234) -> str:
+    rng = random.Random(seed)
+    out = ["Qude.prompt", "Qwindow.qoll()", "Qwindow.uptext('Bench')", "Qwindow.geometry.size(640, 480)"]
+    makers = [m for m, weight in BLOCKS for _ in range(weight)]
+    n = 0
+    while len(out) < lines - 1:
+        out.extend(rng.choice(makers)(rng, n))
+        n += 1
+    del out[lines - 1:]
+    # An event block cut in half would not parse; drop its dangling header
+    while out and (out[-1] == "event;" or out[-1].endswith(":")):
+        out.pop()
+    out.append("Qude.kill/")
+    return "\n".join(out) + "\n"